@@ -0,0 +1,64 @@
+"""Measures how long it takes to make, add, connect and register graphs of increasing size.
+
+Every graph is a chain of :class:`~eagerx.nodes.butterworth_filter.ButterworthFilter` nodes,
+with an action connected to the first node and an observation connected to the last node.
+It also compares copying the graph state with :func:`~eagerx.utils.utils.copy_params` (used by e.g. ``spec.params``)
+and with :func:`copy.deepcopy`.
+
+Usage: python benchmarks/benchmark_graph_build.py --sizes 10 100 1000
+"""
+import argparse
+import copy
+import time
+
+import eagerx
+from eagerx import Node, SpaceConverter
+from eagerx.utils.utils import copy_params
+import eagerx.nodes  # noqa # pylint: disable=unused-import
+import eagerx.converters  # noqa # pylint: disable=unused-import
+
+
+def build(num_nodes):
+    timings = dict()
+
+    start = time.perf_counter()
+    nodes = [Node.make("ButterworthFilter", f"bf_{i}", rate=10, N=2) for i in range(num_nodes)]
+    timings["make"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph = eagerx.Graph.create()
+    graph.add(nodes)
+    timings["add"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph.connect(action="signal", target=nodes[0].inputs.signal)
+    for source, target in zip(nodes[:-1], nodes[1:]):
+        graph.connect(source=source.outputs.filtered, target=target.inputs.signal)
+    converter = SpaceConverter.make("Space_Float32MultiArray", [-3], [3], dtype="float32")
+    graph.connect(source=nodes[-1].outputs.filtered, observation="filtered", converter=converter)
+    timings["connect"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph.register()
+    timings["register"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    copy_params(graph._state)
+    timings["copy_params"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    copy.deepcopy(graph._state)
+    timings["deepcopy"] = time.perf_counter() - start
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    steps = ["make", "add", "connect", "register", "copy_params", "deepcopy"]
+    print(f"{'entities':<10}" + "".join(f"{step + ' (s)':>16}" for step in steps))
+    for size in args.sizes:
+        timings = build(size)
+        print(f"{size:<10}" + "".join(f"{timings[step]:>16.4f}" for step in steps))
@@ -0,0 +1,72 @@
+"""Compares how long it takes to save and load graphs of increasing size in the yaml and binary formats.
+
+Every graph is a chain of :class:`~eagerx.nodes.butterworth_filter.ButterworthFilter` nodes,
+with an action connected to the first node and an observation connected to the last node.
+The pure-python yaml loader/dumper is included as a reference.
+
+Usage: python benchmarks/benchmark_graph_persistence.py --sizes 10 100 1000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import yaml
+
+import eagerx
+from eagerx import Node
+import eagerx.nodes  # noqa # pylint: disable=unused-import
+
+
+def create_graph(num_nodes):
+    nodes = [Node.make("ButterworthFilter", f"bf_{i}", rate=10, N=2) for i in range(num_nodes)]
+    graph = eagerx.Graph.create(nodes)
+    graph.connect(action="signal", target=nodes[0].inputs.signal)
+    for source, target in zip(nodes[:-1], nodes[1:]):
+        graph.connect(source=source.outputs.filtered, target=target.inputs.signal)
+    graph.connect(source=nodes[-1].outputs.filtered, observation="filtered")
+    return graph
+
+
+def timeit(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def measure(graph, file):
+    timings = dict()
+
+    # Pure-python yaml (i.e. what Graph.save/load used before)
+    def save_python():
+        with open(file, "w") as f:
+            yaml.dump(graph._state, f, Dumper=yaml.SafeDumper, default_flow_style=False)
+
+    def load_python():
+        with open(file, "r") as f:
+            yaml.load(f, Loader=yaml.SafeLoader)
+
+    timings["save py-yaml"] = timeit(save_python)
+    timings["load py-yaml"] = timeit(load_python)
+    timings["save yaml"] = timeit(lambda: graph.save(file))
+    timings["load yaml"] = timeit(lambda: graph.load(file))
+    timings["save binary"] = timeit(lambda: graph.save(file, binary=True))
+    timings["load binary"] = timeit(lambda: graph.load(file))
+    timings["load entity"] = timeit(lambda: eagerx.Graph.load_entity(file, "bf_0"))
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file = os.path.join(tmpdir, "graph")
+        header = None
+        for size in args.sizes:
+            timings = measure(create_graph(size), file)
+            if header is None:
+                header = list(timings.keys())
+                print(f"{'entities':<10}" + "".join(f"{step + ' (s)':>18}" for step in header))
+            print(f"{size:<10}" + "".join(f"{timings[step]:>18.4f}" for step in header))
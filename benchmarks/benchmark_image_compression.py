@@ -0,0 +1,74 @@
+"""Compares the frame throughput of raw and compressed image transport.
+
+Per frame, the raw transport serializes and deserializes a :class:`sensor_msgs.msg.Image` (i.e. what TCPROS does),
+while the compressed transport additionally encodes and decodes the image with the
+:class:`~eagerx.converters.image_compression.Image_CompressedImage` converter.
+
+Usage: python benchmarks/benchmark_image_compression.py --height 480 --width 640 --frames 200
+"""
+import argparse
+import time
+from io import BytesIO
+
+import numpy as np
+from sensor_msgs.msg import Image, CompressedImage
+
+from eagerx.converters.image_compression import Image_CompressedImage
+
+
+def make_frames(num_frames, height, width):
+    # Smooth gradients with some noise, which is closer to camera images than uniform noise.
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    frames = []
+    for i in range(num_frames):
+        rgb = np.stack([(x + y + i) % 256, (x * 0.5 + i) % 256, (y * 0.5 + i) % 256], axis=-1)
+        rgb += np.random.normal(0, 4, size=rgb.shape)
+        image = np.clip(rgb, 0, 255).astype(np.uint8)
+        frames.append(Image(height=height, width=width, encoding="rgb8", step=width * 3, data=image.tobytes()))
+    return frames
+
+
+def transport(msg, msg_cls):
+    buff = BytesIO()
+    msg.serialize(buff)
+    data = buff.getvalue()
+    received = msg_cls()
+    received.deserialize(data)
+    return received, len(data)
+
+
+def benchmark(frames, converter=None):
+    num_bytes = 0
+    start = time.perf_counter()
+    for msg in frames:
+        if converter is None:
+            _, n = transport(msg, Image)
+        else:
+            received, n = transport(converter.A_to_B(msg), CompressedImage)
+            converter.B_to_A(received)
+        num_bytes += n
+    duration = time.perf_counter() - start
+    return len(frames) / duration, num_bytes / len(frames)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    frames = make_frames(args.frames, args.height, args.width)
+    transports = {
+        "raw": None,
+        "png (level=1)": Image_CompressedImage(format="png", png_level=1, skip_rx=False),
+        "png (level=3)": Image_CompressedImage(format="png", png_level=3, skip_rx=False),
+        "jpeg (quality=95)": Image_CompressedImage(format="jpeg", jpeg_quality=95, skip_rx=False),
+        "jpeg (quality=75)": Image_CompressedImage(format="jpeg", jpeg_quality=75, skip_rx=False),
+    }
+    print(f"{args.frames} frames of {args.height}x{args.width}x3")
+    print(f"{'transport':<20}{'frames/s':>12}{'kB/frame':>12}")
+    for name, converter in transports.items():
+        fps, size = benchmark(frames, converter)
+        print(f"{name:<20}{fps:>12.1f}{size / 1000:>12.1f}")
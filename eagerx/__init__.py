@@ -1,5 +1,7 @@
 __version__ = "0.1.22"
 
+import sys
+
 from eagerx.core.constants import process, log  # noqa: F401  # pylint: disable=unused-import
 from eagerx.utils.node_utils import initialize  # noqa # pylint: disable=unused-import
 from eagerx.core.entities import (  # noqa: F401  # pylint: disable=unused-import
@@ -14,9 +16,33 @@ from eagerx.core.entities import (  # noqa: F401  # pylint: disable=unused-impor
     EngineState,
     EngineNode,
 )
-from eagerx.core.env import EagerxEnv  # noqa # pylint: disable=unused-import
-from eagerx.core.graph import Graph  # noqa # pylint: disable=unused-import
-from eagerx.core.graph_engine import EngineGraph  # noqa # pylint: disable=unused-import
 import eagerx.core.register as register  # noqa # pylint: disable=unused-import
 import eagerx.core.specs as specs  # noqa: F401  # pylint: disable=unused-import
-import eagerx.wrappers as wrappers  # noqa: F401  # pylint: disable=unused-import
+
+# The environment, graphs, and wrappers depend on heavy modules (gym, cv2, networkx) that node processes do not need,
+# so they are only imported when first accessed.
+_LAZY = {
+    "EagerxEnv": ("eagerx.core.env", "EagerxEnv"),
+    "Graph": ("eagerx.core.graph", "Graph"),
+    "EngineGraph": ("eagerx.core.graph_engine", "EngineGraph"),
+    "wrappers": ("eagerx.wrappers", None),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module 'eagerx' has no attribute '{name}'")
+    import importlib
+
+    module, attr = _LAZY[name]
+    value = importlib.import_module(module)
+    value = getattr(value, attr) if attr is not None else value
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):  # Module-level __getattr__ (PEP 562) is not supported.
+    from eagerx.core.env import EagerxEnv  # noqa # pylint: disable=unused-import
+    from eagerx.core.graph import Graph  # noqa # pylint: disable=unused-import
+    from eagerx.core.graph_engine import EngineGraph  # noqa # pylint: disable=unused-import
+    import eagerx.wrappers as wrappers  # noqa: F401  # pylint: disable=unused-import
@@ -18,7 +18,7 @@ class GymBridge(Bridge):
         self.simulator = dict()
 
     @staticmethod
-    @register.spec("GymBridge", Bridge)
+    @register.spec("GymBridge", Bridge, prototype=True)
     def spec(
         spec: BridgeSpec,
         rate,
@@ -14,9 +14,10 @@ import gym
 class GymSpace_Float32MultiArray(SpaceConverter):
     MSG_TYPE_A = np.ndarray
     MSG_TYPE_B = Float32MultiArray
+    SHARED = True
 
     @staticmethod
-    @register.spec("GymSpace_Float32MultiArray", SpaceConverter)
+    @register.spec("GymSpace_Float32MultiArray", SpaceConverter, prototype=True)
     def spec(
         spec,
         gym_id: str = None,
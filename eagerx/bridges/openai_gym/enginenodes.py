@@ -1,8 +1,6 @@
 from typing import Optional, List
-import skimage.transform
 import numpy as np
 import gym
-from pyvirtualdisplay import Display
 import os
 
 # IMPORT ROS
@@ -13,13 +11,14 @@ from sensor_msgs.msg import Image
 # IMPORT EAGERX
 import eagerx.core.register as register
 from eagerx.utils.utils import Msg
+from eagerx.utils import inprocess
 from eagerx.core.entities import EngineNode
 from eagerx.core.constants import process
 
 
 class ObservationSensor(EngineNode):
     @staticmethod
-    @register.spec("ObservationSensor", EngineNode)
+    @register.spec("ObservationSensor", EngineNode, prototype=True)
     def spec(
         spec,
         name: str,
@@ -72,7 +71,7 @@ class ObservationSensor(EngineNode):
 
 class RewardSensor(EngineNode):
     @staticmethod
-    @register.spec("RewardSensor", EngineNode)
+    @register.spec("RewardSensor", EngineNode, prototype=True)
     def spec(
         spec,
         name: str,
@@ -125,7 +124,7 @@ class RewardSensor(EngineNode):
 
 class DoneSensor(EngineNode):
     @staticmethod
-    @register.spec("DoneSensor", EngineNode)
+    @register.spec("DoneSensor", EngineNode, prototype=True)
     def spec(
         spec,
         name: str,
@@ -178,7 +177,7 @@ class DoneSensor(EngineNode):
 
 class ActionActuator(EngineNode):
     @staticmethod
-    @register.spec("ActionActuator", EngineNode)
+    @register.spec("ActionActuator", EngineNode, prototype=True)
     def spec(
         spec,
         name: str,
@@ -260,7 +259,7 @@ class ActionActuator(EngineNode):
 
 class GymImage(EngineNode):
     @staticmethod
-    @register.spec("GymImage", EngineNode)
+    @register.spec("GymImage", EngineNode, prototype=True)
     def spec(
         spec,
         name: str,
@@ -298,9 +297,11 @@ class GymImage(EngineNode):
         self.render_toggle = False
         self.id = self.bridge_config["env_id"]
         self.obj_name = self.config["name"]
-        self.render_toggle_pub = rospy.Subscriber("%s/env/render/toggle" % self.ns, Bool, self._set_render_toggle)
+        self.render_toggle_pub = inprocess.subscriber("%s/env/render/toggle" % self.ns, Bool, self._set_render_toggle)
 
         # Setup virtual display for rendering.
+        from pyvirtualdisplay import Display
+
         self.display = Display(visible=False, backend="xvfb")
         self.disp_id = os.environ["DISPLAY"]  # First record default display id
         self.display.start()
@@ -325,6 +326,8 @@ class GymImage(EngineNode):
 
             # Resize image if not matching desired self.shape (defined in .yaml)
             if rgb.shape[:2] != tuple(self.shape):
+                import skimage.transform
+
                 kwargs = dict(output_shape=self.shape, mode="edge", order=1, preserve_range=True)
                 rgb = skimage.transform.resize(rgb, **kwargs).astype(rgb.dtype)
 
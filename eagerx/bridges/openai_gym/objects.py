@@ -47,7 +47,7 @@ class GymObject(Object):
         spec.actuators.action.rate = rate
 
     @staticmethod
-    @register.spec(entity_id, Object)
+    @register.spec(entity_id, Object, prototype=True)
     def spec(
         spec: ObjectSpec,
         name: str,
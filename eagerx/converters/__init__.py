@@ -1,2 +1,3 @@
 import eagerx.converters.space_ros_converters  # noqa: F401
 import eagerx.converters.ros_processor  # noqa: F401
+import eagerx.converters.image_compression  # noqa: F401
@@ -0,0 +1,116 @@
+# ROS IMPORTS
+from sensor_msgs.msg import Image, CompressedImage
+
+# RX IMPORTS
+from eagerx.core import register as register
+from eagerx.core.entities import Converter
+from eagerx.core.specs import ConverterSpec
+
+# OTHER
+import numpy as np
+
+# Encodings that can be compressed, structured as ENCODINGS[encoding] = (dtype, channels). PNG supports 8 and 16 bit
+# images with 1, 3 or 4 channels. JPEG only supports 8 bit images with 1 or 3 channels.
+ENCODINGS = {
+    "mono8": (np.uint8, 1),
+    "8UC1": (np.uint8, 1),
+    "rgb8": (np.uint8, 3),
+    "bgr8": (np.uint8, 3),
+    "8UC3": (np.uint8, 3),
+    "rgba8": (np.uint8, 4),
+    "bgra8": (np.uint8, 4),
+    "8UC4": (np.uint8, 4),
+    "mono16": (np.uint16, 1),
+    "16UC1": (np.uint16, 1),
+    "rgb16": (np.uint16, 3),
+    "bgr16": (np.uint16, 3),
+    "16UC3": (np.uint16, 3),
+    "rgba16": (np.uint16, 4),
+    "bgra16": (np.uint16, 4),
+    "16UC4": (np.uint16, 4),
+}
+
+
+class Image_CompressedImage(Converter):
+    """Compresses :class:`sensor_msgs.msg.Image` messages into :class:`sensor_msgs.msg.CompressedImage` messages.
+
+    Add it as an output converter to compress images before they are published, and as an input converter
+    to decode them again on the receiving side. This reduces the bandwidth of cross-process (ROS) camera links.
+
+    - *format* = "png": lossless compression (zlib), with compression level *png_level*.
+
+    - *format* = "jpeg": lossy compression, with quality *jpeg_quality*.
+
+    Only 8 and 16 bit images with 1, 3 or 4 channels can be compressed (see ENCODINGS), and jpeg only supports
+    8 bit images with 1 or 3 channels. Images with other encodings raise a ValueError.
+
+    If *skip_rx* = True, images are only compressed right before they are published as a ROS topic.
+    Inputs that are connected via Rx (i.e. in the same process) then receive the raw image instead.
+    """
+
+    MSG_TYPE_A = Image
+    MSG_TYPE_B = CompressedImage
+
+    @staticmethod
+    @register.spec("Image_CompressedImage", Converter, prototype=True)
+    def spec(spec: ConverterSpec, format: str = "png", png_level: int = 3, jpeg_quality: int = 95, skip_rx: bool = True):
+        # Initialize spec with default arguments
+        spec.initialize(Image_CompressedImage)
+
+        assert format in ["png", "jpeg"], f'Unsupported format "{format}". Only "png" and "jpeg" are supported.'
+        assert 0 <= png_level <= 9, f'Invalid png_level "{png_level}". Must be in [0, 9].'
+        assert 0 <= jpeg_quality <= 100, f'Invalid jpeg_quality "{jpeg_quality}". Must be in [0, 100].'
+        params = dict(format=format, png_level=png_level, jpeg_quality=jpeg_quality, skip_rx=skip_rx)
+        spec.config.update(params)
+
+    def initialize(self, format="png", png_level=3, jpeg_quality=95, skip_rx=True):
+        import cv2  # Only imported when used, as it is slow to import.
+
+        self.format = format
+        self.skip_rx = skip_rx
+        if format == "png":
+            self.ext = ".png"
+            self.encode_params = [cv2.IMWRITE_PNG_COMPRESSION, png_level]
+        else:
+            self.ext = ".jpg"
+            self.encode_params = [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality]
+
+    def convert(self, msg):
+        # With skip_rx, raw images pass through. The message broker compresses them right before publishing.
+        if self.skip_rx and isinstance(msg, Image):
+            return msg
+        return super().convert(msg)
+
+    def A_to_B(self, msg):
+        import cv2
+
+        if msg.height == 0 or msg.width == 0:
+            return CompressedImage(format=f"{msg.encoding}; {self.format}", data=b"")
+        if msg.encoding not in ENCODINGS:
+            raise ValueError(f'Cannot compress images with encoding "{msg.encoding}". Supported: {list(ENCODINGS)}.')
+        dtype, channels = ENCODINGS[msg.encoding]
+        if self.format == "jpeg" and (dtype is not np.uint8 or channels == 4):
+            raise ValueError(f'Cannot compress images with encoding "{msg.encoding}" to jpeg. Use png instead.')
+        dtype = np.dtype(dtype).newbyteorder(">" if msg.is_bigendian else "<")
+        row = msg.width * channels * dtype.itemsize
+        image = np.frombuffer(bytes(msg.data), dtype=np.uint8).reshape(msg.height, msg.step)[:, :row]
+        image = np.ascontiguousarray(image).view(dtype).astype(dtype.newbyteorder("="))
+        _, data = cv2.imencode(self.ext, image.reshape(msg.height, msg.width, channels), self.encode_params)
+        return CompressedImage(header=msg.header, format=f"{msg.encoding}; {self.format}", data=data.tobytes())
+
+    def B_to_A(self, msg):
+        import cv2
+
+        encoding = msg.format.split(";")[0]
+        if len(msg.data) == 0:
+            return Image(header=msg.header, encoding=encoding)
+        image = cv2.imdecode(np.frombuffer(bytes(msg.data), dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+        height, width = image.shape[:2]
+        return Image(
+            header=msg.header,
+            height=height,
+            width=width,
+            encoding=encoding,
+            step=image.nbytes // height,
+            data=image.tobytes(),
+        )
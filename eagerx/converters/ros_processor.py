@@ -7,9 +7,10 @@ from eagerx.core.entities import Processor
 
 class GetIndex_Float32MultiArray(Processor):
     MSG_TYPE = Float32MultiArray
+    PUSHDOWN = True
 
     @staticmethod
-    @register.spec("GetIndex_Float32MultiArray", Processor)
+    @register.spec("GetIndex_Float32MultiArray", Processor, prototype=True)
     def spec(spec, index: Union[int, List[int]]):
         # Initialize spec with default arguments
         spec.initialize(GetIndex_Float32MultiArray)
@@ -27,6 +28,6 @@ class GetIndex_Float32MultiArray(Processor):
         if msg.data == []:
             return msg
         data = msg.data
-        if isinstance(data, list) and len(data) > self.index:
-            data = [data[self.index]]
+        if len(data) > max(self.index):
+            data = [data[i] for i in self.index]
         return Float32MultiArray(data=data)
@@ -15,9 +15,10 @@ from gym.spaces import Box
 class Space_Float32MultiArray(SpaceConverter):
     MSG_TYPE_A = np.ndarray
     MSG_TYPE_B = Float32MultiArray
+    SHARED = True
 
     @staticmethod
-    @register.spec("Space_Float32MultiArray", SpaceConverter)
+    @register.spec("Space_Float32MultiArray", SpaceConverter, prototype=True)
     def spec(spec: ConverterSpec, low, high, dtype="float32"):
         # Initialize spec with default arguments
         spec.initialize(Space_Float32MultiArray)
@@ -43,9 +44,10 @@ class Space_Float32MultiArray(SpaceConverter):
 class Space_Image(SpaceConverter):
     MSG_TYPE_A = np.ndarray
     MSG_TYPE_B = Image
+    SHARED = True
 
     @staticmethod
-    @register.spec("Space_Image", SpaceConverter)
+    @register.spec("Space_Image", SpaceConverter, prototype=True)
     def spec(spec: ConverterSpec, low=None, high=None, shape=None, dtype="uint64"):
         # Initialize spec with default arguments
         spec.initialize(Space_Image)
@@ -104,9 +106,10 @@ class Space_Image(SpaceConverter):
 class Space_Float32(SpaceConverter):
     MSG_TYPE_A = np.ndarray
     MSG_TYPE_B = Float32
+    SHARED = True
 
     @staticmethod
-    @register.spec("Space_Float32", SpaceConverter)
+    @register.spec("Space_Float32", SpaceConverter, prototype=True)
     def spec(spec: ConverterSpec, low, high, dtype="float32"):
         # Initialize spec with default arguments
         spec.initialize(Space_Float32)
@@ -141,9 +144,10 @@ class Space_Float32(SpaceConverter):
 class Space_Bool(SpaceConverter):
     MSG_TYPE_A = np.ndarray
     MSG_TYPE_B = Bool
+    SHARED = True
 
     @staticmethod
-    @register.spec("Space_Bool", SpaceConverter)
+    @register.spec("Space_Bool", SpaceConverter, prototype=True)
     def spec(spec: ConverterSpec):
         pass
 
@@ -157,3 +157,17 @@ class process:
     #: Instead, the user is responsible for running the executable script with the appropriate arguments.
     #: This allows nodes to run distributed.
     EXTERNAL: int = 3
+    #: Prefix of a named process group (e.g. ``process="group:vision"``, see :func:`~eagerx.core.constants.process.group`).
+    #: All nodes in the same group are spawned in a single separate process.
+    #: Nodes that are registered together (e.g. the nodes of the graph) communicate via Rx inside this process.
+    GROUP: str = "group:"
+
+    @staticmethod
+    def group(name: str) -> str:
+        """Returns the process of the group with the specified name."""
+        assert "/" not in name, f'Process group "{name}" cannot contain the reserved character "/".'
+        return process.GROUP + name
+
+    @staticmethod
+    def is_group(p) -> bool:
+        return isinstance(p, str) and p.startswith(process.GROUP)
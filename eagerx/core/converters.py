@@ -9,7 +9,7 @@ class Identity(BaseConverter):
         super().__init__()
 
     @staticmethod
-    @register.spec("Identity", BaseConverter)
+    @register.spec("Identity", BaseConverter, prototype=True)
     def spec(spec):
         pass
 
@@ -1,5 +1,4 @@
 from typing import List, Dict, Optional, Union, Any
-import gym
 import abc
 import inspect
 import logging
@@ -20,10 +19,12 @@ from eagerx.core.constants import TERMCOLOR, WARN, SILENT, process
 from eagerx.core.rx_message_broker import RxMessageBroker
 from eagerx.utils.node_utils import initialize_nodes, wait_for_node_initialization
 from eagerx.utils.utils import Msg, initialize_state, check_valid_rosparam_type, get_param_with_blocking
+from eagerx.utils import scheduling
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import gym  # noqa: F401
     from eagerx.core.graph_engine import EngineGraph  # noqa: F401
     from eagerx.core.specs import (  # noqa: F401
         EntitySpec,
@@ -61,13 +62,14 @@ class Entity(object):
         """
         from eagerx.core import register
 
-        spec = register.make(cls, entity_id, *args, **kwargs)
-        try:
-            cls.check_spec(spec)
-        except AssertionError as e:
-            print(e)
-            raise
-        return spec
+        def check_spec(spec):
+            try:
+                cls.check_spec(spec)
+            except AssertionError as e:
+                print(e)
+                raise
+
+        return register.make_prototype(cls, entity_id, check_spec, *args, **kwargs)
 
     @classmethod
     def info(cls, entity_id: str, method: Optional[Union[List[str], str]] = None) -> None:
@@ -132,6 +134,9 @@ class BaseNode(Entity):
         print_mode: int = TERMCOLOR,
         log_level: int = WARN,
         log_level_memory: int = SILENT,
+        cpu_affinity: Optional[List[int]] = None,
+        nice: Optional[int] = None,
+        sched_priority: Optional[int] = None,
         object_name: str = "",
         **kwargs,
     ):
@@ -204,16 +209,48 @@ class BaseNode(Entity):
         #: Note that `log_level` has precedent over the memory level set here.
         #: Can be set in the subclass' :func:`~eagerx.core.entities.Node.spec`.
         self.log_memory: int = log_level >= effective_log_level and log_level_memory >= effective_log_level
+        #: Cpus that the process (if launched in a separate process) and the scheduler thread of this node may run on.
+        #: Can be set in the subclass' :func:`~eagerx.core.entities.Node.spec`.
+        self.cpu_affinity: Optional[List[int]] = cpu_affinity
+        #: Niceness of the process (if launched in a separate process) and the scheduler thread of this node.
+        #: Can be set in the subclass' :func:`~eagerx.core.entities.Node.spec`.
+        self.nice: Optional[int] = nice
+        #: Real-time (SCHED_FIFO) priority of the process (if launched in a separate process) and the scheduler thread
+        #: of this node. Only applied if the process is permitted to do so.
+        #: Can be set in the subclass' :func:`~eagerx.core.entities.Node.spec`.
+        self.sched_priority: Optional[int] = sched_priority
+        #: The applied scheduling settings of the host process ("process") and scheduler thread ("scheduler").
+        #: Cannot be modified.
+        self.scheduling: Dict[str, Dict] = dict()
+        if process in [eagerx.core.constants.process.NEW_PROCESS, eagerx.core.constants.process.EXTERNAL]:
+            # The node owns the process, so also apply the settings to the threads that are created from here on.
+            self.scheduling["process"] = scheduling.apply(cpu_affinity, nice, sched_priority)
         self.initialize(*args, **kwargs)
 
     @staticmethod
     def get_msg_type(cls, component, cname):
         return cls.msg_types[component][cname]
 
+    def get_msg(self, cname: str) -> Any:
+        """Returns an (empty) message for output *cname*.
+
+        If pooling is enabled for the output (see :attr:`~eagerx.core.specs.NodeSpec.outputs`),
+        a previously published message instance is recycled if possible. Make sure to set all fields of the message.
+
+        :param cname: Name of the output.
+        :return: A message of the output's message type.
+        """
+        for o in self.outputs:
+            if o["name"] == cname:
+                if "msg_pool" in o:
+                    return o["msg_pool"].acquire()
+                return o["msg_type"]()
+        raise KeyError(f'Output "{cname}" is not selected for node "{self.name}".')
+
     @classmethod
     def pre_make(cls, entity_id, entity_type):
         spec = super().pre_make(entity_id, entity_type)
-        params = spec.params
+        params = spec._params
         params["node_type"] = params.pop("entity_type")
         params["config"] = dict(
             name=None,
@@ -226,6 +263,9 @@ class BaseNode(Entity):
             print_mode=TERMCOLOR,
             log_level=WARN,
             log_level_memory=SILENT,
+            cpu_affinity=None,
+            nice=None,
+            sched_priority=None,
             executable=None,
             entity_id=params.pop("entity_id"),
         )
@@ -551,7 +591,7 @@ class Node(BaseNode):
             d.executable = "python:=eagerx.core.executable_node"
         from eagerx.core.specs import NodeSpec  # noqa: F811
 
-        return NodeSpec(spec.params)
+        return NodeSpec(spec._params)
 
     @classmethod
     def check_spec(cls, spec):
@@ -669,7 +709,7 @@ class ResetNode(Node):
 
         from eagerx.core.specs import ResetNodeSpec  # noqa: F811
 
-        return ResetNodeSpec(spec.params)
+        return ResetNodeSpec(spec._params)
 
     @classmethod
     def check_spec(cls, spec):
@@ -800,7 +840,7 @@ class EngineNode(Node):
         spec = super().pre_make(entity_id, entity_type)
         from eagerx.core.specs import NodeSpec  # noqa: F811
 
-        return NodeSpec(spec.params)
+        return NodeSpec(spec._params)
 
     @classmethod
     def check_spec(cls, spec):
@@ -1076,7 +1116,7 @@ class Bridge(BaseNode):
             d.executable = "python:=eagerx.core.executable_bridge"
         from eagerx.core.specs import BridgeSpec  # noqa: F811
 
-        return BridgeSpec(spec.params)
+        return BridgeSpec(spec._params)
 
     @classmethod
     def check_spec(cls, spec):
@@ -1259,7 +1299,7 @@ class Object(Entity):
     @classmethod
     def pre_make(cls, entity_id, entity_type):
         spec = super().pre_make(entity_id, entity_type)
-        params = spec.params
+        params = spec._params
         params["config"] = dict(
             name=None,
             sensors=[],
@@ -1311,6 +1351,10 @@ class Object(Entity):
 class BaseConverter(Entity):
     """Baseclass for converters and processors."""
 
+    #: Allow components in the same process that use this converter with identical params to share a single instance,
+    #: so it is only initialized once. Only set this to `True` for converters that keep no state between calls to `convert`.
+    SHARED: bool = False
+
     __metaclass__ = abc.ABCMeta
 
     def __init__(self, *args: Union[bool, int, float, str, List, Dict], **kwargs: Union[bool, int, float, str, List, Dict]):
@@ -1378,7 +1422,7 @@ class BaseConverter(Entity):
     @classmethod
     def pre_make(cls, entity_id: str, entity_type: "Entity"):
         spec = super().pre_make(entity_id, entity_type)
-        params = spec.params
+        params = spec._params
         params["converter_type"] = params.pop("entity_type")
         params.pop("entity_id")
         from eagerx.core.specs import ConverterSpec  # noqa: F811
@@ -1427,6 +1471,11 @@ class Processor(BaseConverter):
     #: Supported message type
     MSG_TYPE: Any
 
+    #: Allow the processor to be applied on the producer side of a cross-process (ROS) link.
+    #: The processed topic is shared by all consumers that request the same processor,
+    #: so only set this to `True` for stateless processors.
+    PUSHDOWN: bool = False
+
     __metaclass__ = abc.ABCMeta
 
     def __init__(self, *args, **kwargs):
@@ -1445,7 +1494,7 @@ class Processor(BaseConverter):
     @classmethod
     def pre_make(cls, entity_id, entity_type):
         spec = super().pre_make(entity_id, entity_type)
-        params = spec.params
+        params = spec._params
         from eagerx.core.specs import ConverterSpec  # noqa: F811
 
         return ConverterSpec(params)
@@ -1552,7 +1601,7 @@ class Converter(BaseConverter):
     @classmethod
     def pre_make(cls, entity_id, entity_type):
         spec = super().pre_make(entity_id, entity_type)
-        params = spec.params
+        params = spec._params
         from eagerx.core.specs import ConverterSpec  # noqa: F811
 
         return ConverterSpec(params)
@@ -1639,14 +1688,14 @@ class SpaceConverter(Converter):
         return self._initial_obs
 
     @abc.abstractmethod
-    def get_space(self) -> gym.Space:
+    def get_space(self) -> "gym.Space":
         """An abstract method that returns the OpenAI's gym space related to converted message."""
         pass
 
     @classmethod
     def pre_make(cls, entity_id, entity_type):
         spec = super().pre_make(entity_id, entity_type)
-        params = spec.params
+        params = spec._params
         from eagerx.core.specs import ConverterSpec  # noqa: F811
 
         return ConverterSpec(params)
@@ -1748,7 +1797,7 @@ class EngineState(Entity):
     @classmethod
     def pre_make(cls, entity_id, entity_type):
         spec = super().pre_make(entity_id, entity_type)
-        params = spec.params
+        params = spec._params
         params["state_type"] = params.pop("entity_type")
         params.pop("entity_id")
         from eagerx.core.specs import EngineStateSpec  # noqa: F811
@@ -1,8 +1,6 @@
 # ROS packages required
 import rospy
-import rosparam
 import rosgraph
-import rosservice
 from std_msgs.msg import UInt64
 from std_srvs.srv import Trigger, TriggerResponse, TriggerRequest
 
@@ -10,6 +8,8 @@ from std_srvs.srv import Trigger, TriggerResponse, TriggerRequest
 from eagerx.core.specs import NodeSpec, ObjectSpec, BridgeSpec
 from eagerx.core.entities import Node
 from eagerx.core.graph import Graph
+from eagerx.utils.utils import param_client, copy_params, clear_converters
+from eagerx.utils import inprocess, build_cache
 from eagerx.utils.node_utils import (
     initialize_nodes,
     wait_for_node_initialization,
@@ -22,9 +22,9 @@ from eagerx.core.rx_message_broker import RxMessageBroker
 from eagerx.core.constants import process
 
 # OTHER IMPORTS
+import os
 import atexit
 import abc
-import cv2
 import numpy as np
 from copy import deepcopy
 from typing import List, Union, Dict, Tuple, Callable, Optional
@@ -54,39 +54,87 @@ class Env(gym.Env):
         self.has_shutdown = False
 
         # Take deepcopy of bridge
-        bridge = BridgeSpec(bridge.params)
+        self._bridge = BridgeSpec(bridge.params)
         self._bridge_name = bridge.params["config"]["entity_id"]
 
-        # Register graph
-        self.graph = graph
-        nodes, objects, actions, observations, self.render_node = graph.register()
+        # Graph that replaces the current graph at the next reset (see :func:`~eagerx.core.env.Env.replace_graph`).
+        self._pending_graph: Optional[Graph] = None
 
-        # Add bridge implementation
-        [o.add_bridge(self._bridge_name) for o in objects]
+        # Build the environment
+        self._build(graph, self._bridge, force_start)
 
-        # Initialize supervisor node
-        self.mb, self.supervisor_node, self.supervisor = self._init_supervisor(bridge, nodes, objects, force_start)
-        self._is_initialized = self.supervisor_node.is_initialized
+        # Implement clean up
+        atexit.register(self.shutdown)
 
-        # Initialize bridge
-        self._init_bridge(bridge, nodes)
+    def _build(self, graph: Graph, bridge: BridgeSpec, force_start: bool) -> None:
+        # Take deepcopy of bridge, because it is modified when it is initialized.
+        bridge = BridgeSpec(bridge.params)
 
-        # Create environment node
-        self.env_node, self.env = self._init_environment(actions, observations, self.supervisor_node, self.mb)
+        # Load the compiled environment if the graph and bridge were compiled before, and store it once the build
+        # succeeded (only if EAGERX_CACHE=1).
+        with build_cache.compiling(self.ns, self.rate, graph._state, bridge.params):
+            # Register graph
+            self.graph = graph
+            # Snapshot of the graph that is running, to determine what changed when the graph is replaced.
+            self._graph_state = copy_params(graph._state)
+            registered = build_cache.get(self.ns, "register")
+            if registered is None:
+                nodes, objects, actions, observations, render_node = graph.register()
+
+                # Add bridge implementation
+                [o.add_bridge(self._bridge_name) for o in objects]
+                registered = nodes, objects, actions, observations, render_node
+                build_cache.put(self.ns, "register", registered)
+            nodes, objects, actions, observations, self.render_node = registered
+
+            # Run without a roscore if no node needs another process
+            self.local = bool(eval(os.environ.get("EAGERX_LOCAL", "1"))) and self._is_local(bridge, nodes, objects)
+            if self.local:
+                inprocess.enable(self.ns)
+                rospy.loginfo(f'Environment "{self.ns}" runs in-process (i.e. without roscore).')
+            else:
+                assert rosgraph.is_master_online(), (
+                    f'Environment "{self.ns}" has nodes in other processes, so it requires a roscore. '
+                    "Call eagerx.initialize(..., roscore=True) first."
+                )
 
-        # Register render node
-        if self.render_node:
-            nodes = [self.render_node] + nodes
+            # Initialize supervisor node
+            self.mb, self.supervisor_node, self.supervisor = self._init_supervisor(bridge, nodes, objects, force_start)
+            self._is_initialized = self.supervisor_node.is_initialized
 
-        # Register nodes
-        self.register_nodes(nodes)
+            # Initialize bridge
+            self._init_bridge(bridge, nodes)
 
-        # Register objects
-        self.register_objects(objects)
+            # Create environment node
+            self.env_node, self.env = self._init_environment(actions, observations, self.supervisor_node, self.mb)
 
-        # Implement clean up
-        self._shutdown_srv = rospy.Service(f"{self.ns}/environment/shutdown", Trigger, self._remote_shutdown)
-        atexit.register(self.shutdown)
+            # Register render node
+            if self.render_node:
+                nodes = [self.render_node] + nodes
+
+            # Register nodes
+            self.register_nodes(nodes)
+
+            # Register objects
+            self.register_objects(objects)
+
+        # Remote shutdown
+        self._shutdown_srv = inprocess.service(f"{self.ns}/environment/shutdown", Trigger, self._remote_shutdown)
+
+    def _is_local(self, bridge: BridgeSpec, nodes: List[NodeSpec], objects: List[ObjectSpec]) -> bool:
+        # Every node must run in the environment process (the bridge then also runs in the environment process).
+        in_process = [process.ENVIRONMENT, process.BRIDGE]
+        if bridge.config.process != process.ENVIRONMENT:
+            return False
+        if self.render_node and self.render_node.config.process not in in_process:
+            return False
+        if any(n.config.process not in in_process for n in nodes):
+            return False
+        for o in objects:
+            for params_simnode in o.params[self._bridge_name]["nodes"].values():
+                if params_simnode["config"]["process"] not in in_process:
+                    return False
+        return True
 
     def _init_supervisor(self, bridge: BridgeSpec, nodes: List[NodeSpec], objects: List[ObjectSpec], force_start: bool):
         # Initialize supervisor
@@ -143,11 +191,11 @@ class Env(gym.Env):
                             supervisor.config.states.append(name)
 
         # Check if there already exists an environment
-        services = rosservice.get_service_list()
+        services = inprocess.get_service_list(self.ns)
         if f"{self.ns}/environment/shutdown" in services:
             if force_start:
                 rospy.logwarn(f"There already exists an environment named '{self.ns}'. Shutting down existing environment.")
-                shutdown_client = rospy.ServiceProxy(f"{self.ns}/environment/shutdown", Trigger)
+                shutdown_client = inprocess.service_proxy(f"{self.ns}/environment/shutdown", Trigger)
                 shutdown_client.wait_for_service(1)
                 shutdown_client(TriggerRequest())
             else:
@@ -160,14 +208,14 @@ class Env(gym.Env):
 
         # Delete pre-existing parameters
         try:
-            rosparam.delete_param(f"/{self.name}")
+            param_client.delete(f"/{self.name}")
             rospy.loginfo(f'Pre-existing parameters under namespace "/{self.name}" deleted.')
         except rosgraph.masterapi.Error:
             pass
 
         # Upload log_level
         log_level = logging.getLogger("rosout").getEffectiveLevel()
-        rosparam.upload_params(self.ns, {"log_level": log_level})
+        param_client.upload(self.ns, {"log_level": log_level})
 
         # Initialize message broker
         mb = RxMessageBroker(owner="%s/%s" % (self.ns, "env"))
@@ -181,7 +229,7 @@ class Env(gym.Env):
         name = supervisor.config.name
         supervisor.config.rate = self.rate
         supervisor_params = supervisor.build(ns=self.ns)
-        rosparam.upload_params(self.ns, supervisor_params)
+        param_client.upload(self.ns, supervisor_params)
         rx_supervisor = Supervisor(
             "%s/%s" % (self.ns, name),
             mb,
@@ -203,6 +251,9 @@ class Env(gym.Env):
         assert (
             "target_addresses" not in bridge.params["config"]
         ), f'Keyword "{"target_addresses"}" is a reserved keyword within the bridge params and cannot be used twice.'
+        assert not process.is_group(
+            bridge.params["config"]["process"]
+        ), "Cannot initialize the bridge inside a process group. You can choose process.{ENVIRONMENT, EXTERNAL, NEW_PROCESS}."
         assert (
             not bridge.params["config"]["process"] == process.BRIDGE
         ), "Cannot initialize the bridge inside the bridge process, because it has not been launched yet. You can choose process.{ENVIRONMENT, EXTERNAL, NEW_PROCESS}."
@@ -268,7 +319,7 @@ class Env(gym.Env):
                 d[i].rate = self.rate
             env_spec.config.outputs.append(i)
         env_params = env_spec.build(ns=self.ns)
-        rosparam.upload_params(self.ns, env_params)
+        param_client.upload(self.ns, env_params)
         rx_env = RxNode(name="%s/%s" % (self.ns, name), message_broker=message_broker)
         rx_env.node_initialized()
 
@@ -383,6 +434,10 @@ class Env(gym.Env):
         :returns: The initial observation.
         """
         assert not self.has_shutdown, "This environment has been shutdown."
+        # Apply the replaced graph (if any)
+        if self._pending_graph is not None:
+            self._replace_graph()
+
         # Initialize environment
         if not self.initialized:
             self._initialize(states)
@@ -441,10 +496,13 @@ class Env(gym.Env):
                 self.env.node_shutdown()
             self.mb.shutdown()
             try:
-                rosparam.delete_param(f"/{self.name}")
+                param_client.delete(f"/{self.name}")
                 rospy.loginfo(f'Parameters under namespace "/{self.name}" deleted.')
             except rosgraph.masterapi.ROSMasterException as e:
                 rospy.logwarn(e)
+            if self.local:
+                inprocess.disable(self.ns)
+            clear_converters()
             self.has_shutdown = True
 
     def register_nodes(self, nodes: Union[List[NodeSpec], NodeSpec]) -> None:
@@ -453,8 +511,8 @@ class Env(gym.Env):
         if not isinstance(nodes, list):
             nodes = [nodes]
 
-        # Register nodes
-        [self.supervisor_node.register_node(n) for n in nodes]
+        # Register nodes (at once, so that nodes in the same process group are linked via Rx)
+        self.supervisor_node.register_nodes(nodes)
 
     def register_objects(self, objects: Union[List[ObjectSpec], ObjectSpec]) -> None:
         assert not self.has_shutdown, "This environment has been shutdown."
@@ -465,6 +523,95 @@ class Env(gym.Env):
         # Register objects
         [self.supervisor_node.register_object(o, self._bridge_name) for o in objects]
 
+    def replace_graph(self, graph: Optional[Graph] = None) -> None:
+        """Replaces the graph of the environment at the start of the next episode, without creating a new environment.
+
+        The graph can be modified (e.g. with :func:`~eagerx.core.graph.Graph.set`, :func:`~eagerx.core.graph.Graph.add`,
+        :func:`~eagerx.core.graph.Graph.connect`, etc...) between episodes. The changes take effect at the next reset.
+
+        - Nodes and objects that are added without states or targets, and only receive messages from the existing
+          graph, are registered in the running environment. Only their links are connected.
+
+        - Any other change (e.g. changed parameters, converters, removed nodes or connections, or changes to the
+          actions and observations) relaunches the nodes, objects and bridge of the environment with the new graph.
+          Only additions are applied in-place, because the supervisor and bridge can register entities (e.g. in the reset
+          procedure), but cannot unregister or modify them.
+
+        .. note:: The observation, action and state space are inferred again after the reset,
+                  so they may change if actions, observations or states were added, removed or converted.
+
+        :param graph: The new graph. By default, the graph that was used to create the environment, in case it
+                      was modified in-place.
+        """
+        assert not self.has_shutdown, "This environment has been shutdown."
+        graph = graph if graph is not None else self.graph
+        assert graph.is_valid(plot=False), "Graph not valid."
+        self._pending_graph = graph
+
+    def _replace_graph(self) -> None:
+        graph, self._pending_graph = self._pending_graph, None
+        additions = self._get_additions(graph)
+        if isinstance(additions, str):
+            rospy.loginfo(f'Relaunching environment "{self.ns}" with the replaced graph, because {additions}.')
+            self._shutdown()
+            self.has_shutdown = False
+            self.initialized = False
+            self._build(graph, self._bridge, force_start=True)
+            return
+
+        nodes, objects = additions
+        rospy.loginfo(f'Adding {[e.config.name for e in nodes + objects]} to environment "{self.ns}".')
+        launched = set(self.supervisor_node.sp_nodes.keys())
+        self.register_nodes(nodes)
+        self.register_objects(objects)
+        self.graph = graph
+        self._graph_state = copy_params(graph._state)
+
+        # Only connect the links of the added nodes (the others were connected when the environment was initialized).
+        if self.initialized:
+            [node.node_initialized() for name, node in self.supervisor_node.sp_nodes.items() if name not in launched]
+            wait_for_node_initialization(self._is_initialized)
+            self.mb.connect_io(print_status=True)
+
+    def _get_additions(self, graph: Graph) -> Union[str, Tuple[List[NodeSpec], List[ObjectSpec]]]:
+        """Returns the nodes and objects that were added to the graph, if they can be registered in the running
+        environment. Otherwise, returns the reason why the environment must be relaunched instead."""
+        old, new = self._graph_state, graph._state
+
+        # Existing nodes, objects and connections must remain unchanged, because the supervisor and bridge only support
+        # registering entities (i.e. not unregistering or modifying them).
+        for name, params in old["nodes"].items():
+            if name not in new["nodes"]:
+                return f'"{name}" was removed'
+            if new["nodes"][name] != params:
+                return f'"{name}" was changed'
+        for source, target in old["connects"]:
+            if [source, target] not in new["connects"]:
+                return f"connection {source} -> {target} was removed"
+
+        # The added entities may only be the target of new connections, and cannot be an action, observation, or render.
+        added = [name for name in new["nodes"] if name not in old["nodes"]]
+        for name in added:
+            if name.startswith("env/"):
+                return f'"{name}" was added'
+        for source, target in new["connects"]:
+            if [source, target] not in old["connects"] and target[0] not in added:
+                return f'"{target[0]}" (which was not added) is the target of new connection {source} -> {target}'
+
+        nodes, objects, _, _, _ = graph.register(prune=False)
+        nodes = [n for n in nodes if n.config.name in added]
+        objects = [o for o in objects if o.config.name in added]
+        [o.add_bridge(self._bridge_name) for o in objects]
+
+        # States and targets are registered with the supervisor and bridge when the environment is created.
+        simnodes = [params for o in objects for params in o.params[self._bridge_name]["nodes"].values()]
+        for config in [e.params["config"] for e in nodes + objects] + [params["config"] for params in simnodes]:
+            if len(config.get("states", [])) > 0 or len(config.get("targets", [])) > 0:
+                return f'added "{config["name"]}" has states or targets'
+        if self.local and not self._is_local(self._bridge, nodes, objects):
+            return "the added entities cannot run in-process"
+        return nodes, objects
+
     def render(self, mode: str = "human") -> Optional[np.ndarray]:
         """A method to start rendering (i.e. open the render window).
 
@@ -490,6 +637,8 @@ class Env(gym.Env):
                 else:
                     im = np.frombuffer(ros_im.data, dtype=np.uint8).reshape(ros_im.height, ros_im.width, -1)
                     if "bgr" in ros_im.encoding:
+                        import cv2
+
                         # try:
                         # todo: find out what exception to catch here.
                         im = cv2.cvtColor(im, cv2.COLOR_BGR2RGB)
@@ -624,7 +773,10 @@ class EagerxEnv(Env):
         super(EagerxEnv, self).__init__(name, rate, graph, bridge, force_start=force_start)
 
         # Determine set of observations to exclude
-        exclude = exclude if isinstance(exclude, list) else []
+        self._exclude = exclude if isinstance(exclude, list) else []
+        self._set_excluded(self._exclude)
+
+    def _set_excluded(self, exclude: List[str]) -> None:
         zero_window = [name for name, buffer in self.env_node.observation_buffer.items() if buffer["window"] == 0]
         self.excl_nonzero = [name for name in exclude if name not in zero_window]
         self.excl_obs = exclude + [name for name in zero_window if name not in exclude]
@@ -635,6 +787,12 @@ class EagerxEnv(Env):
         if len(nonexistent) != 0:
             rospy.logwarn(f"Some excluded observations with window > 0 do not exist: {nonexistent}.")
 
+    def _replace_graph(self) -> None:
+        super(EagerxEnv, self)._replace_graph()
+
+        # Observations may have been added, removed or changed.
+        self._set_excluded(self._exclude)
+
     @property
     def observation_space(self):
         """Infers the observation space from the :class:`~eagerx.core.entities.SpaceConverter` of every observation.
@@ -707,6 +865,10 @@ class EagerxEnv(Env):
 
         :returns: The initial observation.
         """
+        # Apply the replaced graph (if any) first, because the state space may have changed.
+        if self._pending_graph is not None:
+            self._replace_graph()
+
         # Determine reset states
         states = self.reset_fn(self)
 
@@ -23,6 +23,7 @@ from eagerx.utils.utils import (
 )
 from eagerx.core.executable_node import RxNode
 from eagerx.utils.node_utils import wait_for_node_initialization
+from eagerx.utils import inprocess
 from eagerx.core.constants import log_levels_ROS
 
 # Other imports
@@ -75,9 +76,11 @@ class RxBridge(object):
 
             # Notify env that node is initialized
             if not self.initialized:
-                self.init_pub = rospy.Publisher(self.name + "/initialized", UInt64, queue_size=0, latch=True)
+                self.init_pub = inprocess.publisher(self.name + "/initialized", UInt64, queue_size=0, latch=True)
                 self.init_pub.publish(UInt64(data=1))
                 rospy.loginfo('Node "%s" initialized.' % self.name)
+                if "process" in self.bridge.scheduling:
+                    rospy.loginfo(f'Node "{self.name}" process started with {self.bridge.scheduling["process"]}.')
                 self.initialized = True
 
     def _prepare_io_topics(self, name):
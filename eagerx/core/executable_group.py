@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# source ROS if in colab
+import os
+
+if bool(eval(os.environ.get("EAGERX_COLAB", "0"))):
+    import site
+
+    site.addsitedir("/opt/ros/melodic/lib/python2.7/dist-packages")
+    site.addsitedir("/usr/lib/python2.7/dist-packages")
+
+# ROS imports
+import rospy
+from std_msgs.msg import String
+
+# Rx imports
+from eagerx.core.constants import log_levels_ROS
+from eagerx.core.executable_node import RxNode
+import eagerx.core.rx_message_broker
+from eagerx.utils.utils import get_param_with_blocking
+
+# Other imports
+import sys
+import json
+
+
+class RxGroup(object):
+    """Hosts all nodes of a process group (i.e. nodes with the same ``process="group:<name>"``) in a single process.
+
+    The environment sends the nodes that must be hosted to topic "*<name>/register*" as a json list of dicts with the
+    node name and object name. Nodes that are sent together are linked via Rx.
+    """
+
+    def __init__(self, name, message_broker):
+        self.name = name
+        self.ns = "/".join(name.split("/")[:2])
+        self.mb = message_broker
+        self.has_shutdown = False
+        self.nodes = dict()
+
+        # Group hosts always run in a separate process, so they communicate via ROS with the environment.
+        self.sub_register = rospy.Subscriber(self.name + "/register", String, self._register)
+
+        # Prepare closing routine
+        rospy.on_shutdown(self.node_shutdown)
+
+    def _register(self, msg):
+        nodes = []
+        for entry in json.loads(msg.data):
+            address = f"{self.ns}/{entry['name']}"
+            assert address not in self.nodes, f'Node "{address}" is already hosted by process group "{self.name}".'
+            nodes.append(RxNode(name=address, message_broker=self.mb, object_name=f"{self.ns}/{entry['object_name']}"))
+            self.nodes[address] = nodes[-1]
+
+        # Connect all nodes first, so that nodes in the same group are linked via Rx.
+        self.mb.connect_io()
+        [node.node_initialized() for node in nodes]
+
+    def node_shutdown(self):
+        if not self.has_shutdown:
+            rospy.logdebug(f"[{self.name}] RxGroup.node_shutdown() called.")
+            self.sub_register.unregister()
+            for _, rxnode in self.nodes.items():
+                if not rxnode.has_shutdown:
+                    rospy.loginfo(f"[{self.name}] Shutting down '{rxnode.name}'.")
+                    rxnode.node_shutdown()
+            self.mb.shutdown()
+            self.has_shutdown = True
+
+
+if __name__ == "__main__":
+    try:
+        executable, ns, name, _ = sys.argv[0], sys.argv[-3], sys.argv[-2], sys.argv[-1]
+
+        log_level = get_param_with_blocking(ns + "/log_level")
+
+        rospy.init_node(
+            f"{name}".replace("/", "_"),
+            log_level=log_levels_ROS[log_level],
+            anonymous=True,
+        )
+
+        message_broker = eagerx.core.rx_message_broker.RxMessageBroker(owner=f"{ns}/{name}")
+
+        pnode = RxGroup(name=f"{ns}/{name}", message_broker=message_broker)
+
+        rospy.spin()
+    finally:
+        if not pnode.has_shutdown:
+            rospy.loginfo(f"[{ns}/{name}] Send termination signal to '{ns}/{name}'.")
+            rospy.signal_shutdown(f"Terminating '{ns}/{name}'")
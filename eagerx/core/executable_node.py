@@ -17,6 +17,7 @@ from std_msgs.msg import UInt64
 from eagerx.core.constants import log_levels_ROS
 import eagerx.core.rx_message_broker
 import eagerx.core.rx_pipelines
+from eagerx.utils import inprocess
 from eagerx.utils.utils import (
     get_attribute_from_module,
     initialize_converter,
@@ -65,11 +66,13 @@ class RxNode(object):
 
     def node_initialized(self):
         # Notify env that node is initialized
-        self.init_pub = rospy.Publisher(self.name + "/initialized", UInt64, queue_size=0, latch=True)
+        self.init_pub = inprocess.publisher(self.name + "/initialized", UInt64, queue_size=0, latch=True)
         self.init_pub.publish(UInt64())
 
         if not self.initialized:
             rospy.loginfo('Node "%s" initialized.' % self.name)
+            if "process" in self.node.scheduling:
+                rospy.loginfo(f'Node "{self.name}" process started with {self.node.scheduling["process"]}.')
         self.initialized = True
 
     def _prepare_io_topics(self, name, **kwargs):
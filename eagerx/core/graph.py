@@ -1,8 +1,9 @@
 import os
+import pickle
+import struct
 
 import yaml
 from copy import deepcopy
-import matplotlib.pyplot as plt
 import networkx as nx
 from typing import List, Union, Dict, Optional, Any
 import rospy
@@ -15,6 +16,7 @@ from eagerx.utils.utils import (
     substitute_args,
     msg_type_error,
     supported_types,
+    copy_params,
 )
 from eagerx.utils.network_utils import (
     reset_graph,
@@ -23,6 +25,7 @@ from eagerx.utils.network_utils import (
     color_nodes,
     color_edges,
     is_stale,
+    IncrementalDAG,
 )
 import eagerx
 from eagerx.core.entities import Node, BaseConverter, SpaceConverter
@@ -37,6 +40,69 @@ from eagerx.core.specs import (
 
 yaml.Dumper.ignore_aliases = lambda *args: True  # todo: check if needed.
 
+# Use the (much faster) libyaml bindings if available.
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+class _Dumper(SafeDumper):
+    def ignore_aliases(self, data):
+        return True
+
+
+_Dumper.add_representer(tuple, SafeDumper.represent_list)
+
+
+#: Version of the binary graph format. Increase when the layout of the graph state changes.
+SCHEMA_VERSION = 1
+# Entity sections that are pickled per entity, so that single entities can be loaded without unpickling the others.
+_ENTITY_SECTIONS = ["nodes", "backup"]
+_PROTOCOL = min(5, pickle.HIGHEST_PROTOCOL)
+_MAGIC = b"EAGERX-GRAPH\n"
+
+
+def _dump_binary(state: Dict, stream) -> None:
+    # Layout: magic, header size (8 bytes), pickled header with the (offset, size) of every pickled section/entity, blobs.
+    blobs, index, offset = [], dict(), 0
+    for key, value in state.items():
+        items = value.items() if key in _ENTITY_SECTIONS else [(None, value)]
+        for name, params in items:
+            blob = pickle.dumps(params, protocol=_PROTOCOL)
+            if name is None:
+                index[key] = (offset, len(blob))
+            else:
+                index.setdefault(key, dict())[name] = (offset, len(blob))
+            blobs.append(blob)
+            offset += len(blob)
+    header = pickle.dumps(dict(schema=SCHEMA_VERSION, version=eagerx.__version__, index=index), protocol=_PROTOCOL)
+    stream.write(_MAGIC + struct.pack("<Q", len(header)) + header)
+    [stream.write(blob) for blob in blobs]
+
+
+def _load_binary(stream, names: Optional[List[str]] = None) -> Dict:
+    assert stream.read(len(_MAGIC)) == _MAGIC, "Not a binary graph state. Save it with `graph.save(file, binary=True)`."
+    (size,) = struct.unpack("<Q", stream.read(8))
+    header = pickle.loads(stream.read(size))
+    assert header["schema"] == SCHEMA_VERSION, (
+        f"Cannot load a graph with schema version {header['schema']} (saved with eagerx {header['version']}), "
+        f"only version {SCHEMA_VERSION} is supported."
+    )
+    start = stream.tell()
+
+    def _read(offset, size):
+        stream.seek(start + offset)
+        return pickle.loads(stream.read(size))
+
+    state = dict()
+    for key, entry in header["index"].items():
+        if key in _ENTITY_SECTIONS:
+            state[key] = {name: _read(*entry[name]) for name in entry if names is None or name in names}
+        elif names is None:
+            state[key] = _read(*entry)
+    return state
+
 
 def merge(a, b, path=None):
     """merges b into a"""
@@ -60,11 +126,47 @@ def merge(a, b, path=None):
     return a
 
 
+class _ConnectionIndex:
+    """Hash indices of the connections in a graph state, so that connections can be looked up without a scan."""
+
+    def __init__(self, connects: List[List[List[str]]]):
+        #: Targets per source, structured as targets[source] = {target: None} (i.e. an ordered set).
+        self.targets: Dict[tuple, Dict[tuple, None]] = dict()
+        #: Source per target (a target can only be connected to a single source).
+        self.source: Dict[tuple, tuple] = dict()
+        #: Connections per entity name, structured as connections[name] = {(source, target): None}.
+        self.connections: Dict[str, Dict[tuple, None]] = dict()
+        for source, target in connects:
+            self.add(source, target)
+
+    def add(self, source: List[str], target: List[str]) -> None:
+        source, target = tuple(source), tuple(target)
+        self.targets.setdefault(source, dict())[target] = None
+        self.source[target] = source
+        for name in {source[0], target[0]}:
+            self.connections.setdefault(name, dict())[(source, target)] = None
+
+    def remove(self, source: List[str], target: List[str]) -> None:
+        source, target = tuple(source), tuple(target)
+        self.targets[source].pop(target)
+        if len(self.targets[source]) == 0:
+            self.targets.pop(source)
+        self.source.pop(target)
+        for name in {source[0], target[0]}:
+            self.connections[name].pop((source, target))
+            if len(self.connections[name]) == 0:
+                self.connections.pop(name)
+
+
 class Graph:
     """The Graph API allows users to form a graph of connected nodes and objects."""
 
     def __init__(self, state: Dict):
         self._state = state
+        #: Topological order of the episode graph that is updated with every (dis)connect to detect algebraic loops early.
+        self._dag: Optional[IncrementalDAG] = None
+        #: Indices of the connections in the state. Like the dag, it is rebuilt lazily when the state is replaced.
+        self._index: Optional[_ConnectionIndex] = None
 
     def __str__(self):
         return yaml.dump(self._state)
@@ -122,7 +224,7 @@ class Graph:
             ), f'There is already a node or object registered in this graph with name "{name}".'
             assert not entity.has_graph, f"Spec '{name}' is already added to a graph."
 
-            # Add node to state
+            # Add node to state. The graph owns a copy of the params, so the spec and the graph never share (mutable) params.
             self._state["nodes"][name] = entity.params
             self._state["backup"][name] = entity.params
 
@@ -146,20 +248,20 @@ class Graph:
             if isinstance(name, EntitySpec):
                 name = name.params["config"]["name"]
                 assert name in self._state["nodes"], f" No entity with name '{name}' in graph."
-            for source, target in deepcopy(self._state["connects"]):
+            for source, target in list(self._get_index().connections.get(name, {})):
                 if name in [source[0], target[0]]:
                     if source[0] == "env/actions":
                         action = source[2]
                         source = None
                     else:
                         action = None
-                        source = self.get_view(source[0], source[1:])
+                        source = self.get_view(source[0], list(source[1:]))
                     if target[0] == "env/observations":
                         observation = target[2]
                         target = None
                     else:
                         observation = None
-                        target = self.get_view(target[0], target[1:])
+                        target = self.get_view(target[0], list(target[1:]))
                     self.disconnect(source, target, action, observation, remove=remove)
             self._state["nodes"].pop(name)
 
@@ -271,13 +373,10 @@ class Graph:
         view = self.get_view("env/actions", ["outputs", action])
         self._remove_component(view, remove=False)
         params_action = self._state["nodes"]["env/actions"]
-        source = ["env/actions", "outputs", action]
-        connect_exists = False
-        for c in self._state["connects"]:
-            if source == c[0]:
-                connect_exists = True
-                target = c[1]
-                break
+        source = ("env/actions", "outputs", action)
+        targets = self._get_index().targets.get(source, {})
+        connect_exists = len(targets) > 0
+        target = list(next(iter(targets))) if connect_exists else None
         assert (
             not connect_exists
         ), f'Action entry "{action}" cannot be removed, because it is not disconnected. Connection with target {target} still exists.'
@@ -288,13 +387,10 @@ class Graph:
         view = self.get_view("env/observations", ["inputs", observation])
         self._remove_component(view, remove=False)
         params_obs = self._state["nodes"]["env/observations"]
-        target = ["env/observations", "inputs", observation]
-        connect_exists = False
-        for c in self._state["connects"]:
-            if target == c[1]:
-                connect_exists = True
-                source = c[0]
-                break
+        target = ("env/observations", "inputs", observation)
+        source = self._get_index().source.get(target, None)
+        connect_exists = source is not None
+        source = list(source) if connect_exists else None
         assert not connect_exists, (
             'Observation entry "%s" cannot be removed, because it is not disconnected. Connection with source %s still exists.'
             % (observation, source)
@@ -410,10 +506,9 @@ class Graph:
             self._is_selected(self._state, target)
 
         # Make sure that target is not already connected.
-        for s, t in self._state["connects"]:
-            t_name, t_comp, t_cname = t
-            flag = not (target_name == t_name and target_comp == t_comp and target_cname == t_cname)
-            assert flag, f'Target "{target}" is already connected to source "{s}"'
+        index = self._get_index()
+        s = index.source.get((target_name, target_comp, target_cname), None)
+        assert s is None, f'Target "{target}" is already connected to source "{list(s)}"'
 
         # Add properties to target params
         if converter is not None:
@@ -428,7 +523,18 @@ class Graph:
         # Add connection
         Graph.check_msg_type(source, target, self._state)
         connect = [list(source()), list(target())]
+        dag = self._get_dag()
         self._state["connects"].append(connect)
+        index.add(*connect)
+
+        # Check if the connection closes an algebraic loop
+        edge = self._dag_edge(self._state, *connect)
+        cycle = dag.add_edge(*edge) if edge else []
+        if len(cycle) > 0:
+            rospy.logwarn(
+                f"Connecting {connect[0]} to {connect[1]} creates an algebraic loop: {' --> '.join(cycle)}. "
+                "Set skip=True for one of the connections in the loop, else the graph cannot be registered."
+            )
 
     def _connect_action(self, action, target, converter=None):
         """Method to connect a (previously added) action, that *precedes* self._connect(source, target)."""
@@ -570,12 +676,7 @@ class Graph:
         self._disconnect(source, target, action, observation)
         if remove:
             if action:
-                connect_exists = False
-                source = ["env/actions", "outputs", action]
-                for c in self._state["connects"]:
-                    if source == c[0]:
-                        connect_exists = True
-                        break
+                connect_exists = ("env/actions", "outputs", action) in self._get_index().targets
                 if not connect_exists:
                     self.remove_component(action=action)
             if observation:
@@ -620,19 +721,19 @@ class Graph:
         self._is_selected(self._state, target)
 
         # Check if connection exists
-        connect_exists = False
-        idx_connect = None
-        for idx, c in enumerate(self._state["connects"]):
-            if list(source()) == c[0] and list(target()) == c[1]:
-                connect_exists = True
-                idx_connect = idx
-                break
+        index = self._get_index()
+        connect = [list(source()), list(target())]
+        connect_exists = index.source.get(tuple(connect[1]), None) == tuple(connect[0])
         assert connect_exists, (
             f"The connection with source={source()} and target={target()} cannot be removed," " because it does not exist."
         )
 
         # Pop the connection from the state
-        self._state["connects"].pop(idx_connect)
+        edge = self._dag_edge(self._state, *connect)
+        if edge and self._dag is not None:
+            self._dag.remove_edge(*edge)
+        self._state["connects"].remove(connect)
+        index.remove(*connect)
 
         # Reset source params to disconnected state
         if action:
@@ -655,9 +756,9 @@ class Graph:
         """
         was_connected = False
         name, component, cname = entry()
-        for source, target in deepcopy(self._state["connects"]):
-            source = self.get_view(source[0], source[1:])
-            target = self.get_view(target[0], target[1:])
+        for source, target in list(self._get_index().connections.get(name, {})):
+            source = self.get_view(source[0], list(source[1:]))
+            target = self.get_view(target[0], list(target[1:]))
             self._is_selected(self._state, source)
             self._is_selected(self._state, target)
             source_name, source_comp, source_cname = source()
@@ -687,12 +788,7 @@ class Graph:
         That is, remove space_converter if it is not connected to any other targets."""
         params_action = self._state["nodes"]["env/actions"]
         assert action in params_action["outputs"], 'Cannot disconnect action "%s", as it does not exist.' % action
-        source = ["env/actions", "outputs", action]
-        connect_exists = False
-        for c in self._state["connects"]:
-            if source == c[0]:
-                connect_exists = True
-                break
+        connect_exists = ("env/actions", "outputs", action) in self._get_index().targets
         if not connect_exists:
             params_action["outputs"][action] = dict()
 
@@ -758,6 +854,8 @@ class Graph:
                 source[2] = new_cname
             if target_comp == component and target_cname == old_cname:
                 target[2] = new_cname
+        self._dag = None
+        self._index = None
 
     def set(
         self,
@@ -817,6 +915,8 @@ class Graph:
                 else:
                     name, component, cname = entry()
                     p = self._state["nodes"][name][component][cname]
+                    if parameter == "skip" and (name, component, cname) in self._get_index().source:
+                        self._dag = None
                 self._set(p, {parameter: value})
 
     def _set_converter(self, entry: GraphView, converter: Dict):
@@ -891,12 +991,20 @@ class Graph:
         else:
             return entry
 
-    def register(self):
+    def register(self, prune: Optional[bool] = None):
         # Check if valid graph.
         assert self.is_valid(plot=False), "Graph not valid."
+        state = copy_params(self._state)
+
+        # Prune nodes, outputs, and sensors that are not used by any action, observation or render path.
+        prune = bool(eval(os.environ.get("EAGERX_PRUNE", "0"))) if prune is None else prune
+        if prune:
+            pruned = self._prune(state)
+            for key, names in pruned.items():
+                if len(names) > 0:
+                    rospy.loginfo(f"[register]: Pruned {len(names)} unused {key}: {names}.")
 
         # Add addresses based on connections
-        state = deepcopy(self._state)
         for source, target in state["connects"]:
             source_name, source_comp, source_cname = source
             target_name, target_comp, target_cname = target
@@ -941,6 +1049,57 @@ class Graph:
         assert observations, "No observation node defined in the graph."
         return nodes, objects, actions, observations, render
 
+    @staticmethod
+    def _prune(state: Dict) -> Dict[str, List[str]]:
+        """Removes all nodes from the state that do not (indirectly) contribute to an observation, render, or object.
+        Also deselects unconnected outputs of the remaining nodes and unconnected sensors of objects.
+        Nodes without any selected output are kept, as they are assumed to be sinks with side effects.
+
+        :param state: The graph state that is pruned in-place.
+        :return: A report with the pruned nodes, outputs, and sensors.
+        """
+        pruned = dict(nodes=[], outputs=[], sensors=[])
+
+        # Nodes are only required if they can reach a sink via their outputs (i.e. reverse reachability from the sinks),
+        # so that cycles (e.g. via skipped inputs) that do not reach a sink are also removed.
+        sources = dict()
+        for source, target in state["connects"]:
+            sources.setdefault(target[0], set()).add(source[0])
+        required = set()
+        for name, params in state["nodes"].items():
+            if name in ["env/actions", "env/observations", "env/render"] or "node_type" not in params:
+                required.add(name)  # Objects are sinks via their actuators.
+            elif len(params["config"]["outputs"]) == 0:
+                required.add(name)
+        stack = list(required)
+        while len(stack) > 0:
+            for source_name in sources.get(stack.pop(), set()):
+                if source_name not in required:
+                    required.add(source_name)
+                    stack.append(source_name)
+        for name in [name for name in state["nodes"].keys() if name not in required]:
+            state["nodes"].pop(name)
+            pruned["nodes"].append(name)
+        state["connects"] = [[s, t] for s, t in state["connects"] if s[0] in required and t[0] in required]
+        connected = set(tuple(source) for source, _ in state["connects"])
+
+        # Deselect unconnected outputs & sensors.
+        for name, params in state["nodes"].items():
+            if name in ["env/actions", "env/observations", "env/render"]:
+                continue
+            if "node_type" in params:
+                # Outputs of reset nodes are linked to their feedthroughs, so they must remain selected.
+                if "targets" in params:
+                    continue
+                component, key = "outputs", "outputs"
+            else:
+                component, key = "sensors", "sensors"
+            for cname in list(params["config"][component]):
+                if (name, component, cname) not in connected:
+                    params["config"][component].remove(cname)
+                    pruned[key].append(f"{name}/{component}/{cname}")
+        return pruned
+
     def render(
         self,
         source: GraphView,
@@ -1010,33 +1169,67 @@ class Graph:
             skip=skip,
         )
 
-    def save(self, file: str):
+    def save(self, file: str, binary: bool = False):
         """Saves the graph state.
 
-        The state is saved in *.yaml* format and contains the state of every added node, object, action, and observation
-        and the connections between them.
+        The state is saved in *.yaml* format (or a binary format) and contains the state of every added node, object,
+        action, and observation and the connections between them.
 
         :param file: A string giving the name (and the file if the file isn't in the current working directory).
+        :param binary: Saves the state in a (much faster) binary format that is versioned with
+                       :attr:`~eagerx.core.graph.SCHEMA_VERSION`. It can only be loaded with python and eagerx,
+                       by passing ``binary=True`` to :func:`~eagerx.core.graph.Graph.load`.
         """
-        with open(file, "w") as outfile:
-            yaml.dump(self._state, outfile, default_flow_style=False)
-        pass
+        if binary:
+            with open(file, "wb") as outfile:
+                _dump_binary(self._state, outfile)
+        else:
+            with open(file, "w") as outfile:
+                yaml.dump(self._state, outfile, Dumper=_Dumper, default_flow_style=False)
 
-    def load(self, file: str):
+    def load(self, file: str, binary: bool = False):
         """Loads the graph state.
 
-        The state is loaded in *.yaml* format and contains the state of every added node, object, action, and observation
-        and the connections between them.
+        The state is loaded in *.yaml* (or binary) format and contains the state of every added node, object, action,
+        and observation and the connections between them.
 
         :param file: A string giving the name (and the file if the file isn't in the current working directory).
+        :param binary: Loads a state that was saved with ``binary=True``.
+
+                       .. warning:: The binary format is unpickled, which can execute arbitrary code.
+                                    Only load binary files that you trust.
         """
-        with open(file, "r") as stream:
+        with open(file, "rb") as stream:
             try:
-                self._state = yaml.safe_load(stream)
+                if binary:
+                    self._state = _load_binary(stream)
+                else:
+                    self._state = yaml.load(stream, Loader=SafeLoader)
+                self._dag = None
+                self._index = None
                 # self._state = yaml.load(file)
             except yaml.YAMLError as exc:
                 print(exc)
 
+    @staticmethod
+    def load_entity(file: str, name: str, binary: bool = False) -> Dict:
+        """Loads the params of a single entity from a saved graph state.
+
+        With the binary format, only the params of the entity are unpickled. For *.yaml*, the complete state is parsed.
+
+        :param file: A string giving the name (and the file if the file isn't in the current working directory).
+        :param name: Name of the node/object.
+        :param binary: Loads from a state that was saved with ``binary=True`` (see :func:`~eagerx.core.graph.Graph.load`).
+        :return: The params of the entity, as they are stored in the graph.
+        """
+        with open(file, "rb") as stream:
+            if binary:
+                state = _load_binary(stream, names=[name])
+            else:
+                state = yaml.load(stream, Loader=SafeLoader)
+        assert name in state["nodes"], f'No entity named "{name}" in graph "{file}".'
+        return state["nodes"][name]
+
     def gui(self) -> None:
         """Opens a graphical user interface of the graph.
 
@@ -1056,6 +1249,34 @@ class Graph:
             return
 
         self._state = launch_gui(deepcopy(self._state))
+        self._dag = None
+        self._index = None
+
+    def _get_index(self) -> _ConnectionIndex:
+        if self._index is None:
+            self._index = _ConnectionIndex(self._state["connects"])
+        return self._index
+
+    def _get_dag(self) -> IncrementalDAG:
+        if self._dag is None:
+            self._dag = IncrementalDAG()
+            self._dag.add_edge("env/observations", "env/actions")
+            for source, target in self._state["connects"]:
+                edge = self._dag_edge(self._state, source, target)
+                if edge:
+                    self._dag.add_edge(*edge)
+        return self._dag
+
+    @staticmethod
+    def _dag_edge(state: Dict, source: List[str], target: List[str]) -> Optional[tuple]:
+        """Maps a connection onto an edge between nodes (or object components), ignoring connections that are skipped."""
+        if source[1] not in ["outputs", "sensors"] or target[1] not in ["inputs", "actuators", "feedthroughs"]:
+            return None
+        if state["nodes"][target[0]][target[1]][target[2]]["skip"]:
+            return None
+        u = source[0] if "node_type" in state["nodes"][source[0]] else "/".join(source)
+        v = target[0] if "node_type" in state["nodes"][target[0]] else "/".join(target)
+        return u, v
 
     @staticmethod
     def _is_selected(state: Dict, entry: GraphView):
@@ -1101,7 +1322,7 @@ class Graph:
 
     @staticmethod
     def _is_valid(state, plot=True):
-        state = deepcopy(state)
+        state = copy_params(state)
         Graph.check_msg_types_are_consistent(state)
         Graph.check_inputs_have_address(state)
         Graph.check_graph_is_acyclic(state, plot=plot)
@@ -1147,7 +1368,7 @@ class Graph:
 
     @staticmethod
     def check_inputs_have_address(state):
-        state = deepcopy(state)
+        state = copy_params(state)
         for source, target in state["connects"]:
             source_name, source_comp, source_cname = source
             target_name, target_comp, target_cname = target
@@ -1324,6 +1545,8 @@ class Graph:
 
         # Plot graphs
         if plot:
+            import matplotlib.pyplot as plt
+
             fig_env, ax_env = plt.subplots(nrows=1, ncols=1)
             ax_env.set_title("Communication graph (episode)")
             _, _, _, pos = plot_graph(G, k=2, ax=ax_env)
@@ -1365,6 +1588,8 @@ class Graph:
 
         # Plot graphs
         if plot:
+            import matplotlib.pyplot as plt
+
             fig_reset, ax_reset = plt.subplots(nrows=1, ncols=1)
             ax_reset.set_title("Communication graph (reset)")
             _, _, _, pos = plot_graph(F, pos=pos, ax=ax_reset)
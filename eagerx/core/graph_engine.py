@@ -1,7 +1,8 @@
+import os
+import json
 import rospy
 import yaml
 from copy import deepcopy
-import matplotlib.pyplot as plt
 import networkx as nx
 from typing import List, Union, Dict, Tuple, Optional, Any
 from eagerx.utils.utils import (
@@ -11,6 +12,7 @@ from eagerx.utils.utils import (
     get_opposite_msg_cls_v2,
     substitute_args,
     msg_type_error,
+    copy_params,
 )
 from eagerx.utils.network_utils import (
     episode_graph,
@@ -25,6 +27,52 @@ from eagerx.core.view import GraphView
 
 yaml.Dumper.ignore_aliases = lambda *args: True
 
+# Dependencies of the sensors and actuators, per engine graph topology (see EngineGraph._node_depenencies).
+_DEPENDENCIES: Dict[str, Dict[str, Dict[str, List[str]]]] = dict()
+
+
+def _topology_key(state: Dict) -> str:
+    """Everything the edges of the graph from :func:`~eagerx.core.graph_engine.EngineGraph._generate_graph` depend on."""
+    components = dict()
+    for name, params in state["nodes"].items():
+        components[name] = [params["config"].get("inputs", []), params["config"].get("outputs", [])]
+    return json.dumps([components, state["connects"]], sort_keys=True)
+
+
+def _dependency_index(G: nx.MultiDiGraph, state: Dict) -> Dict[str, Dict[str, List[str]]]:
+    """Determines the enginenodes every sensor depends on (i.e. its ancestors) and every actuator affects
+    (i.e. its descendants).
+
+    Instead of a graph search per sensor and actuator, the reachable nodes of all strongly connected components are
+    accumulated in a single (reverse) topological pass over the condensation of *G*, which is acyclic even if *G*
+    contains skipped edges.
+    """
+    C = nx.condensation(G)
+    members = nx.get_node_attributes(C, "members")
+    order = list(nx.topological_sort(C))
+    descendants = dict()
+    for c in reversed(order):
+        descendants[c] = set(members[c])
+        for succ in C.successors(c):
+            descendants[c] |= descendants[succ]
+    ancestors = dict()
+    for c in order:
+        ancestors[c] = set(members[c])
+        for pred in C.predecessors(c):
+            ancestors[c] |= ancestors[pred]
+
+    def node_names(names):
+        names = {name.split("/")[0] for name in names}
+        return sorted(names - {"actuators", "sensors"})
+
+    mapping = C.graph["mapping"]
+    dependencies = dict(sensors=dict(), actuators=dict())
+    for cname in state["nodes"]["sensors"]["inputs"]:
+        dependencies["sensors"][cname] = node_names(ancestors[mapping[f"sensors/{cname}"]])
+    for cname in state["nodes"]["actuators"]["outputs"]:
+        dependencies["actuators"][cname] = node_names(descendants[mapping[f"actuators/{cname}"]])
+    return dependencies
+
 
 class EngineGraph:
     def __init__(self, state: Dict):
@@ -118,7 +166,7 @@ class EngineGraph:
             if isinstance(name, EntitySpec):
                 name = name.params["config"]["name"]
                 assert name in self._state["nodes"], f" No entity with name '{name}' in graph."
-            for source, target in deepcopy(self._state["connects"]):
+            for source, target in copy_params(self._state["connects"]):
                 if name in [source[0], target[0]]:
                     if source[0] == "actuators":
                         actuator = source[2]
@@ -430,7 +478,7 @@ class EngineGraph:
         """
         was_connected = False
         name, component, cname = entry()
-        for source, target in deepcopy(self._state["connects"]):
+        for source, target in copy_params(self._state["connects"]):
             source = self.get_view(source[0], source[1:])
             target = self.get_view(target[0], target[1:])
             self._is_selected(self._state, source)
@@ -571,56 +619,14 @@ class EngineGraph:
             return entry
 
     def _node_depenencies(self, state):
-        import networkx as nx
-
-        state = deepcopy(state)
-        G = self._generate_graph(state)
-        G_rev = G.reverse(copy=True)
-
-        # fig_env, ax_env = plt.subplots(nrows=1, ncols=1)
-        # ax_env.set_title('Engine-specific graph')
-        # _, _, _, pos = plot_graph(G, k=2, ax=ax_env)
-        # plt.show()
-        #
-        # fig_env, ax_env = plt.subplots(nrows=1, ncols=1)
-        # ax_env.set_title('Engine-specific graph (reversed)')
-        # _, _, _, _ = plot_graph(G_rev, k=2, ax=ax_env, pos=pos)
-        # plt.show()
-
-        # Determine sensor dependencies
-        dependencies = dict(sensors=dict(), actuators=dict())
-        for cname in state["nodes"]["sensors"]["inputs"]:
-            dependencies["sensors"][cname] = []
-            target_name = f"sensors/{cname}"
-            descendants = nx.descendants(G_rev, target_name)
-            for source in descendants:
-                node_name, source_cname = source.split("/")
-                if node_name in ["actuators", "sensors"]:
-                    continue
-                dependencies["sensors"][cname].append(node_name)
-
-        # Determine actuator dependency
-        for cname in state["nodes"]["actuators"]["outputs"]:
-            dependencies["actuators"][cname] = []
-            source_name = f"actuators/{cname}"
-            descendants = nx.descendants(G, source_name)
-            for target in descendants:
-                node_name, target_cname = target.split("/")
-                if node_name in ["actuators", "sensors"]:
-                    continue
-                dependencies["actuators"][cname].append(node_name)
-            # Also add dependencies of all targets
-            for target in descendants:
-                nx.descendants(G_rev, target)
-                for source in descendants:
-                    node_name, source_cname = source.split("/")
-                    if node_name in ["actuators", "sensors"]:
-                        continue
-                    dependencies["actuators"][cname].append(node_name)
-            dependencies["actuators"][cname] = list(set(dependencies["actuators"].pop(cname)))
-        return dependencies
-
-    def register(self):
+        # Objects of the same type share the same engine graph, so the dependencies are only determined once per topology.
+        key = _topology_key(state)
+        dependencies = _DEPENDENCIES.get(key, None)
+        if dependencies is None:
+            dependencies = _DEPENDENCIES[key] = _dependency_index(EngineGraph._generate_graph(state), state)
+        return copy_params(dependencies)
+
+    def register(self, prune: Optional[bool] = None):
         # """Set the addresses in all incoming components.
         # Validate the graph.
         # Create params that can be uploaded to the ROS param server.
@@ -633,7 +639,7 @@ class EngineGraph:
         dependencies = self._node_depenencies(self._state)
 
         # Add addresses based on connections
-        state = deepcopy(self._state)
+        state = copy_params(self._state)
         actuators = dict()
         sensors = dict()
         for source, target in state["connects"]:
@@ -683,13 +689,26 @@ class EngineGraph:
                     spec = NodeSpec(params)
                     name = f"$(ns obj_name)/{spec.config.name}"
                     spec.config.name = name
-                    params = spec.params
+                    params = spec._params
 
                     # Substitute placeholder args of simnode
                     context = {"ns": {"node_name": name}, "config": params["config"]}
                     substitute_args(params, context, only=["config", "ns"])
                     nodes[name] = params
 
+        # Prune enginenodes that no sensor or actuator depends on (i.e. they would never be launched).
+        prune = bool(eval(os.environ.get("EAGERX_PRUNE", "0"))) if prune is None else prune
+        if prune:
+            required = set()
+            for component in ["sensors", "actuators"]:
+                for dependency in dependencies[component].values():
+                    required.update([f"$(ns obj_name)/{d}" for d in dependency])
+            pruned = [name for name in nodes.keys() if name not in required]
+            for name in pruned:
+                nodes.pop(name)
+            if len(pruned) > 0:
+                rospy.loginfo(f"[register]: Pruned {len(pruned)} unused enginenodes: {pruned}.")
+
         # assert len(actuators) > 0, "No actuators node defined in the graph."
         # assert len(sensors) > 0, "No sensors node defined in the graph."
         return nodes, actuators, sensors
@@ -766,7 +785,7 @@ class EngineGraph:
 
     @staticmethod
     def _is_valid(state, plot=True):
-        state = deepcopy(state)
+        state = copy_params(state)
         EngineGraph.check_msg_types_are_consistent(state)
         EngineGraph.check_inputs_have_address(state)
         EngineGraph.check_graph_is_acyclic(state, plot=plot)
@@ -826,7 +845,7 @@ class EngineGraph:
 
     @staticmethod
     def check_inputs_have_address(state):
-        state = deepcopy(state)
+        state = copy_params(state)
         for source, target in state["connects"]:
             address = EngineGraph._get_address(source, target)
             target_name, target_comp, target_cname = target
@@ -872,6 +891,8 @@ class EngineGraph:
 
         # Plot graphs
         if plot:
+            import matplotlib.pyplot as plt
+
             fig_env, ax_env = plt.subplots(nrows=1, ncols=1)
             ax_env.set_title("Engine-specific graph")
             _, _, _, pos = plot_graph(G, k=2, ax=ax_env)
@@ -8,18 +8,17 @@ import numpy as np
 import rospy
 from std_msgs.msg import UInt64, Bool
 from sensor_msgs.msg import Image
-import cv_bridge
-import cv2
 
 import eagerx
 import eagerx.core.register as register
 from eagerx.core.specs import NodeSpec
 from eagerx.utils.utils import initialize_converter, Msg
+from eagerx.utils import inprocess
 
 
 class EnvNode(eagerx.Node):
     @staticmethod
-    @register.spec("Environment", eagerx.Node)
+    @register.spec("Environment", eagerx.Node, prototype=True)
     def spec(spec: NodeSpec, rate=1, log_level=eagerx.log.WARN, color="yellow"):
         """EnvNode Spec"""
         spec.initialize(EnvNode)
@@ -139,7 +138,7 @@ class EnvNode(eagerx.Node):
 
 class ObservationsNode(eagerx.Node):
     @staticmethod
-    @register.spec("Observations", eagerx.Node)
+    @register.spec("Observations", eagerx.Node, prototype=True)
     def spec(spec: NodeSpec, rate=1, log_level=eagerx.log.WARN, color="yellow"):
         """ObservationsNode spec"""
         # Initialize spec
@@ -172,7 +171,7 @@ class ObservationsNode(eagerx.Node):
 
 class ActionsNode(eagerx.Node):
     @staticmethod
-    @register.spec("Actions", eagerx.Node)
+    @register.spec("Actions", eagerx.Node, prototype=True)
     def spec(spec: NodeSpec, rate=1, log_level=eagerx.log.WARN, color="yellow"):
         """ActionsNode spec"""
         # Initialize spec
@@ -205,7 +204,7 @@ class ActionsNode(eagerx.Node):
 
 class RenderNode(eagerx.Node):
     @staticmethod
-    @register.spec("Render", eagerx.Node)
+    @register.spec("Render", eagerx.Node, prototype=True)
     def spec(
         spec: NodeSpec,
         rate,
@@ -236,14 +235,16 @@ class RenderNode(eagerx.Node):
         spec.inputs.image.window = 0
 
     def initialize(self, display):
+        import cv_bridge  # cv2 is only imported in the (render) processes that use it, as it is slow to import.
+
         self.cv_bridge = cv_bridge.CvBridge()
         self.window = None
         self.display = display
         self.last_image = Image(data=[])
         self.render_toggle = False
-        self.sub_toggle = rospy.Subscriber("%s/%s/toggle" % (self.ns, self.name), Bool, self._set_render_toggle)
-        self.sub_get = rospy.Subscriber("%s/%s/get_last_image" % (self.ns, self.name), Bool, self._get_last_image)
-        self.pub_set = rospy.Publisher(
+        self.sub_toggle = inprocess.subscriber("%s/%s/toggle" % (self.ns, self.name), Bool, self._set_render_toggle)
+        self.sub_get = inprocess.subscriber("%s/%s/get_last_image" % (self.ns, self.name), Bool, self._get_last_image)
+        self.pub_set = inprocess.publisher(
             "%s/%s/set_last_image" % (self.ns, self.name),
             Image,
             queue_size=0,
@@ -261,6 +262,8 @@ class RenderNode(eagerx.Node):
         self.img_thread.start()
 
     def _async_imshow(self):
+        import cv2
+
         while True:
             self.img_event.wait()  # Wait for event (ie new image or close window)
             self.img_event.clear()  # Clear event
@@ -298,6 +301,9 @@ class RenderNode(eagerx.Node):
             self.last_image = image.msgs[-1]
         empty = self.last_image.height == 0 or self.last_image.width == 0
         if not empty and self.display and self.render_toggle:
+            import cv2
+            import cv_bridge
+
             try:
                 cv_image = self.cv_bridge.imgmsg_to_cv2(self.last_image, "bgr8")
             except ImportError as e:
@@ -345,7 +351,7 @@ class RenderNode(eagerx.Node):
 
 class ColabRender(eagerx.Node):
     @staticmethod
-    @register.spec("ColabRender", eagerx.Node)
+    @register.spec("ColabRender", eagerx.Node, prototype=True)
     def spec(
         spec: NodeSpec,
         rate: int,
@@ -402,9 +408,9 @@ class ColabRender(eagerx.Node):
         self.window = None
         self.last_image = Image(data=[])
         self.render_toggle = False
-        self.sub_toggle = rospy.Subscriber("%s/%s/toggle" % (self.ns, self.name), Bool, self._set_render_toggle)
-        self.sub_get = rospy.Subscriber("%s/%s/get_last_image" % (self.ns, self.name), Bool, self._get_last_image)
-        self.pub_set = rospy.Publisher(
+        self.sub_toggle = inprocess.subscriber("%s/%s/toggle" % (self.ns, self.name), Bool, self._set_render_toggle)
+        self.sub_get = inprocess.subscriber("%s/%s/get_last_image" % (self.ns, self.name), Bool, self._get_last_image)
+        self.pub_set = inprocess.publisher(
             "%s/%s/set_last_image" % (self.ns, self.name),
             Image,
             queue_size=0,
@@ -449,6 +455,8 @@ class ColabRender(eagerx.Node):
                 img = np.array(self.last_image.data, dtype=np.uint8).reshape(self.last_image.height, self.last_image.width, -1)
             # Convert to rgb (from bgr)
             if "bgr" in self.last_image.encoding:
+                import cv2
+
                 img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
             # Add image to buffer (where it is send async to javascript window)
             self.window.buffer_images(img)
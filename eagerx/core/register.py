@@ -1,9 +1,11 @@
+import ast
 import functools
+import importlib
 import inspect
 import rospy
-import copy
+from types import MappingProxyType
 from unittest.mock import MagicMock
-from eagerx.utils.utils import deepcopy
+from eagerx.utils.utils import copy_params
 from typing import TYPE_CHECKING, Callable, Any, Union, List, Dict, Optional
 import os
 
@@ -19,37 +21,161 @@ TYPE_REGISTER = dict()
 
 
 class ReverseRegisterLookup:
-    def __init__(self, d):
-        self._dict = d
+    """Index of the registered spec functions to their entity_id."""
+
+    def __init__(self):
+        self._index = dict()
+
+    def add(self, spec_fn, entity_id):
+        self._index[spec_fn] = entity_id
 
     def __getitem__(self, spec_lookup):
-        for _entity_cls, entity_id in self._dict.items():
-            for entity_idd, entry in entity_id.items():
-                if entry["spec"] == spec_lookup:
-                    return entity_idd
+        return self._index.get(spec_lookup, None)
 
 
 class LookupType:
     def __init__(self, d):
         self._dict = d
+        self._views = dict()
 
-    @deepcopy
     def __getitem__(self, func_lookup):
+        """Returns a (deep) read-only view of the registered types of the class that *func_lookup* belongs to.
+
+        Use :func:`~eagerx.core.register.thaw` to obtain a mutable copy.
+        """
         name_split = func_lookup.__qualname__.split(".")
         cls_name = name_split[0]
-        return self._dict[cls_name]
+        if cls_name not in self._views:
+            self._views[cls_name] = _read_only(self._dict[cls_name])
+        return self._views[cls_name]
+
+    def invalidate(self, cls_name):
+        self._views.pop(cls_name, None)
+
 
+def _read_only(value):
+    # Dicts become read-only mappings and lists become tuples, so that nested values cannot be modified either.
+    if isinstance(value, dict):
+        return MappingProxyType({k: _read_only(v) for k, v in value.items()})
+    elif isinstance(value, list):
+        return tuple(_read_only(v) for v in value)
+    return value
+
+
+def thaw(value):
+    """Returns a mutable copy of a read-only view returned by :attr:`~eagerx.core.register.LOOKUP_TYPES`.
+
+    :param value: A (nested) read-only view.
+    :return: A deep copy with dicts and lists instead of read-only mappings and tuples.
+    """
+    if isinstance(value, (MappingProxyType, dict)):
+        return {k: thaw(v) for k, v in value.items()}
+    elif isinstance(value, (tuple, list)):
+        return [thaw(v) for v in value]
+    return copy_params(value)
+
+
+# Modules that register entities, structured as MANIFEST[(entity_cls.__name__, entity_id)] = module. Modules are only
+# imported when one of their entities is first used. The manifest is generated from the ``@register.spec`` decorators
+# of the modules in this package. Other packages can add entities to the manifest via entry points in group
+# "eagerx.entities", named "<entity_cls>/<entity_id>" (e.g. "Node/MyNode") with the module as value.
+MANIFEST = dict()
+MANIFEST_GROUP = "eagerx.entities"
+_manifest_loaded = False
+
+
+def _scan_package() -> Dict:
+    """Finds the spec functions in the modules of this package without importing them."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    manifest = dict()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith((".", "__"))]
+        for filename in filenames:
+            if not filename.endswith(".py"):
+                continue
+            path = os.path.join(dirpath, filename)
+            with open(path, encoding="utf-8") as f:
+                source = f.read()
+            if "register.spec(" not in source:
+                continue
+            module = os.path.relpath(path[:-3], os.path.dirname(root)).replace(os.sep, ".")
+            module = module[: -len(".__init__")] if module.endswith(".__init__") else module
+            for entity_cls, entity_id in _spec_decorators(ast.parse(source, filename=path)):
+                manifest.setdefault((entity_cls, entity_id), module)
+    return manifest
+
+
+def _spec_decorators(tree: ast.AST):
+    # Yields (entity_cls, entity_id) of the decorators of the form @register.spec(<entity_id>, <entity_cls>, ...), where
+    # entity_id is a string or a name that is assigned a string (e.g. a class attribute).
+    constants = dict()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+                constants[node.targets[0].id] = node.value.value
+    for node in ast.walk(tree):
+        for d in getattr(node, "decorator_list", []):
+            if not (isinstance(d, ast.Call) and isinstance(d.func, ast.Attribute) and d.func.attr == "spec"):
+                continue
+            if len(d.args) < 2:
+                continue
+            entity_id, entity_cls = d.args[:2]
+            if isinstance(entity_id, ast.Name):
+                entity_id = ast.Constant(constants.get(entity_id.id, None))
+            if not isinstance(entity_id, ast.Constant) or not isinstance(entity_id.value, str):
+                continue
+            if isinstance(entity_cls, ast.Name):
+                yield entity_cls.id, entity_id.value
+            elif isinstance(entity_cls, ast.Attribute):  # E.g. @register.spec("Environment", eagerx.Node)
+                yield entity_cls.attr, entity_id.value
+
+
+def _load_manifest():
+    global _manifest_loaded
+    _manifest_loaded = True
+    MANIFEST.update(_scan_package())
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # python < 3.8
+        return
+    eps = entry_points()
+    eps = eps.select(group=MANIFEST_GROUP) if hasattr(eps, "select") else eps.get(MANIFEST_GROUP, [])
+    for ep in eps:
+        entity_cls, _, entity_id = ep.name.partition("/")
+        MANIFEST.setdefault((entity_cls, entity_id), ep.value)
+
+
+def _lazy_import(entity, id) -> bool:
+    """Imports the module of an entity that is not registered yet, if it is in the manifest."""
+    if not _manifest_loaded:
+        _load_manifest()
+    module = MANIFEST.get((entity.__name__, id), None)
+    if module is None:
+        return False
+    rospy.logdebug(f"[register]: Importing module '{module}' for entity_id={id}, entity={entity.__name__}.")
+    importlib.import_module(module)
+    return id in REGISTRY.get(entity, {})
+
+
+# Global cache with validated prototype specs, structured as PROTOTYPES[(entity_cls, entity_id, args)] = (spec_cls, params)
+PROTOTYPES = dict()
+# Placeholder name with which prototypes are made. It is replaced by the actual name when a prototype is cloned.
+PROTOTYPE_NAME = "__eagerx_prototype__"
+# Signatures of the spec functions (without the spec argument)
+_SIGNATURES = dict()
 
 # Global (reversed) registry of REGISTER:
-REVERSE_REGISTRY = ReverseRegisterLookup(REGISTRY)
+REVERSE_REGISTRY = ReverseRegisterLookup()
 LOOKUP_TYPES = LookupType(TYPE_REGISTER)
 
 
-def spec(entity_id: str, entity_cls: "Entity") -> Callable:
+def spec(entity_id: str, entity_cls: "Entity", prototype: bool = False) -> Callable:
     """A decorator to register a spec function.
 
     :param entity_id: A unique string id.
     :param entity_cls: The entity's baseclass.
+    :param prototype: Caches a validated prototype per (nameless) arguments, which is cloned by subsequent makes.
+                      Only enable it if the spec function is deterministic in its arguments.
     """
     # """Register a spec function to make an entity"""
 
@@ -88,7 +214,9 @@ def spec(entity_id: str, entity_cls: "Entity") -> Callable:
             flag = _spec == REGISTRY[entity_cls][entity_id]["spec"] or bool(eval(os.environ.get("EAGERX_RELOAD", "0")))
             assert flag, f'There is already a {entity_cls.__name__} with entity_id "{entity_id}" registered.'
         cls = f"{func.__module__}/{func.__qualname__[:-5]}"
-        REGISTRY[entity_cls][entity_id] = {"spec": _spec, "cls": cls}
+        REGISTRY[entity_cls][entity_id] = {"spec": _spec, "cls": cls, "prototype": prototype}
+        REVERSE_REGISTRY.add(_spec, entity_id)
+        [PROTOTYPES.pop(key) for key in list(PROTOTYPES.keys()) if key[:2] == (entity_cls, entity_id)]
         return _spec
 
     return _register
@@ -96,6 +224,8 @@ def spec(entity_id: str, entity_cls: "Entity") -> Callable:
 
 def make(entity, id, *args, **kwargs):
     """Make an entity with the registered spec function"""
+    if id not in REGISTRY.get(entity, {}):
+        _lazy_import(entity, id)
     assert entity in REGISTRY, f'No entities of type "{entity.__name__}" registered.'
     assert (
         id in REGISTRY[entity]
@@ -103,8 +233,89 @@ def make(entity, id, *args, **kwargs):
     return REGISTRY[entity][id]["spec"](*args, **kwargs)
 
 
+def _prototype_key(entity, id, args, kwargs):
+    spec_fn = REGISTRY[entity][id]["spec"]
+    if spec_fn not in _SIGNATURES:
+        sig = inspect.signature(spec_fn)
+        _SIGNATURES[spec_fn] = sig.replace(parameters=list(sig.parameters.values())[1:])
+    try:
+        bound = _SIGNATURES[spec_fn].bind(*args, **kwargs)
+    except TypeError:
+        return None, None, None  # The spec function raises a more informative error.
+    bound.apply_defaults()
+    arguments = bound.arguments
+    name = arguments.get("name", None)
+    if "name" in arguments:
+        if not isinstance(name, str):
+            return None, None, None
+        arguments["name"] = PROTOTYPE_NAME
+    try:
+        key = (entity, id, _freeze(arguments))
+    except TypeError:  # E.g. specs or numpy arrays as arguments.
+        return None, None, None
+    return key, name, bound
+
+
+def _freeze(value):
+    # A hashable key of value that preserves the types (i.e. tuples and lists, or 1, 1.0 and True do not collide).
+    t = type(value)
+    if t is float and value != value:
+        raise TypeError("NaN is never equal to itself.")
+    if t in (str, int, float, bool, type(None)):
+        return t.__name__, value
+    elif t in (list, tuple):
+        return t.__name__, tuple(_freeze(v) for v in value)
+    elif t is dict:
+        return t.__name__, tuple((_freeze(k), _freeze(v)) for k, v in value.items())
+    raise TypeError(f"Cannot freeze type '{t.__name__}'.")
+
+
+def _clone(params, name):
+    t = type(params)
+    if t is dict:
+        return {_clone(k, name): _clone(v, name) for k, v in params.items()}
+    elif t is list:
+        return [_clone(v, name) for v in params]
+    elif t is str:
+        return params.replace(PROTOTYPE_NAME, name) if PROTOTYPE_NAME in params else params
+    return copy_params(params)
+
+
+def make_prototype(entity, id, check_spec, *args, **kwargs):
+    """Makes an entity by cloning a validated prototype, which is only made once per entity_id and (nameless) arguments.
+
+    Only entities that were registered with ``prototype=True`` are cached (see :func:`~eagerx.core.register.spec`).
+    Only the name is substituted when cloning, so the spec function must be deterministic in its arguments.
+    Arguments of other types than primitives, lists, tuples and dicts (e.g. other specs) bypass the cache.
+    Set EAGERX_PROTOTYPES=0 to disable the cache for all entities.
+
+    :param entity: The entity's baseclass.
+    :param id: The entity_id with which the spec function was registered.
+    :param check_spec: Validates the made spec.
+    :return: The spec.
+    """
+    key = None
+    if id not in REGISTRY.get(entity, {}):
+        _lazy_import(entity, id)
+    enabled = bool(eval(os.environ.get("EAGERX_PROTOTYPES", "1")))
+    if enabled and id in REGISTRY.get(entity, {}) and REGISTRY[entity][id]["prototype"]:
+        key, name, bound = _prototype_key(entity, id, args, kwargs)
+    if key is None:
+        spec = make(entity, id, *args, **kwargs)
+        check_spec(spec)
+        return spec
+    if key not in PROTOTYPES:
+        spec = make(entity, id, *bound.args, **bound.kwargs)
+        check_spec(spec)
+        PROTOTYPES[key] = (type(spec), spec._params)
+    spec_cls, params = PROTOTYPES[key]
+    return spec_cls(_clone(params, name) if name is not None else copy_params(params))
+
+
 def get_spec(entity, id, verbose=True):
     """Get information on the entity's spec function"""
+    if id not in REGISTRY.get(entity, {}):
+        _lazy_import(entity, id)
     if verbose:
         help(REGISTRY[entity][id]["spec"])
     return inspect.signature(REGISTRY[entity][id]["spec"])
@@ -143,6 +354,7 @@ def _register_types(TYPE_REGISTER, component, cnames, func, cls_only=True):
             flag
         ), f'There is already a [{cls_name}][{component}] registered with cnames "{TYPE_REGISTER[cls_name][component]}", and they do not match the cnames of this function: "{cnames}".'
     TYPE_REGISTER[cls_name][component] = cnames
+    LOOKUP_TYPES.invalidate(cls_name)
     return registered_fn
 
 
@@ -272,7 +484,7 @@ def bridge(entity_id: str, bridge_cls: "Bridge") -> Callable:
         def _bridge(spec):
             """First, initialize spec with object_info, then call the bridge function"""
             # Add default bridge_config parameters
-            spec._initialize_bridge_config(bridge_id, copy.deepcopy(bridge_config))
+            spec._initialize_bridge_config(bridge_id, thaw(bridge_config))
             # Initialize engine graph
             graph = spec._initialize_object_graph()
             # Modify bridge_config with user-defined bridge implementation
@@ -310,6 +522,8 @@ def add_bridge(spec, bridge_id):
     from eagerx.core.entities import Object
 
     msg = f"Cannot ad bridge implementation '{bridge_id}' for object '{entity_id}'. "
+    if entity_id not in REGISTRY.get(Object, {}):
+        _lazy_import(Object, entity_id)
     assert Object in REGISTRY, msg + "No Objects have been registered. Make sure to import the object."
     assert entity_id in REGISTRY[Object], msg + "No object with this entity_id was registered. Make sure to import the object."
 
@@ -5,17 +5,22 @@ import rospy
 import rx.disposable
 from rx import Observable, create
 from rx.disposable import Disposable
-from std_msgs.msg import UInt64, Bool
+from rx.subject import Subject
+from std_msgs.msg import UInt64, Bool, String, Float32
 
 # IMPORT OTHER
 from termcolor import cprint
+import hashlib
+import json
 import logging
 import types
 from functools import wraps
-from threading import Condition
+from threading import Condition, Event
 
 # IMPORT EAGERX
 from eagerx.core.constants import DEBUG
+from eagerx.utils.utils import initialize_converter
+from eagerx.utils import inprocess
 
 
 def thread_safe_wrapper(func, condition):
@@ -51,6 +56,27 @@ class RxMessageBroker(object):
         self.subscribers = []
         self.disposables = []
 
+        # Shared ROS subscriptions, structured as shared_topics[(address, msg_type)] = {rx=Observable, subject=Subject, etc..}
+        self.shared_topics = dict()
+
+        # Processor push-down (consumer side), structured as pushdown_requests[address] = {pid: processor_yaml}
+        self.pushdown_requests = dict()
+        self._pushdown_publishers = dict()
+
+        # Push-down acknowledgements of the producers, structured as pushdown_acks[address] = {pid: Event}
+        self.pushdown_acks = dict()
+
+        # Processor push-down (producer side), structured as pushed_down[address] = {pid: processor}
+        self.pushed_down = dict()
+
+        # Rate negotiation (consumer side), structured as rate_requests[address] = {cname_address: rate}
+        self.rate_requests = dict()
+        self._rate_publishers = dict()
+
+        # Rate decimation (producer side), structured as decimation[address] = {factor=int, consumers={callerid: rate}}
+        # A consumer is identified by the caller id of its connection, and forgotten when it disconnects.
+        self.decimation = dict()
+
     # Every method is wrapped in a 'with Condition' block in order to be threadsafe
     def __getattribute__(self, name):
         attr = super(RxMessageBroker, self).__getattribute__(name)
@@ -166,21 +192,33 @@ class RxMessageBroker(object):
                 "status": "",
             }
 
-            # Create publisher
-            i["msg_pub"] = rospy.Publisher(i["address"], i["msg_type"], queue_size=0, latch=True)
+            # Create publisher (decimated if all ROS consumers require a lower rate)
+            i["msg_pub"] = inprocess.publisher(i["address"], i["msg_type"], queue_size=0, latch=True)
+            encode = rx_skipped_encoder(i)
+            if self._can_decimate(node_name, i, tick_address):
+                publish = self._decimated_publish(i["address"], i["rate"], i["msg_pub"], encode=encode)
+            else:
+                publish = encoded_publish(i["msg_pub"], encode)
             d = i["msg"].subscribe(
-                on_next=i["msg_pub"].publish,
+                on_next=publish,
                 on_error=lambda e: print("Error : {0}".format(e)),
             )
             self.disposables.append(d)
             self._publishers.append(i["msg_pub"])
-            i["reset_pub"] = rospy.Publisher(i["address"] + "/reset", UInt64, queue_size=0, latch=True)
+            i["reset_pub"] = inprocess.publisher(i["address"] + "/reset", UInt64, queue_size=0, latch=True)
             d = i["reset"].subscribe(
                 on_next=i["reset_pub"].publish,
                 on_error=lambda e: print("Error : {0}".format(e)),
             )
             self.disposables.append(d)
             self._publishers.append(i["reset_pub"])
+
+            # Listen for consumers that request a processor to be applied before publishing (i.e. push-down)
+            if i["address"] != tick_address:
+                i["ack_pub"] = inprocess.publisher(i["address"] + "/pushdown_ack", String, queue_size=0, latch=True)
+                self._publishers.append(i["ack_pub"])
+                sub = inprocess.subscriber(i["address"] + "/pushdown", String, callback=self._pushdown_cb, callback_args=i)
+                self.subscribers.append(sub)
         for i in feedthrough:
             address = i["address"]
             cname_address = f"{i['feedthrough_to']}:{address}"
@@ -218,7 +256,7 @@ class RxMessageBroker(object):
                 n["state_outputs"][cname_address]["converter"] = i["converter"]
 
             # Create publisher
-            i["msg_pub"] = rospy.Publisher(i["address"], i["msg_type"], queue_size=0, latch=True)
+            i["msg_pub"] = inprocess.publisher(i["address"], i["msg_type"], queue_size=0, latch=True)
             d = i["msg"].subscribe(
                 on_next=i["msg_pub"].publish,
                 on_error=lambda e: print("Error : {0}".format(e)),
@@ -292,7 +330,7 @@ class RxMessageBroker(object):
             }
 
             # Create publisher: (latched: register, node_reset, start_reset, reset, real_reset)
-            i["msg_pub"] = rospy.Publisher(i["address"], i["msg_type"], queue_size=0, latch=True)
+            i["msg_pub"] = inprocess.publisher(i["address"], i["msg_type"], queue_size=0, latch=True)
             d = i["msg"].subscribe(
                 on_next=i["msg_pub"].publish,
                 on_error=lambda e: print("Error : {0}".format(e)),
@@ -314,7 +352,7 @@ class RxMessageBroker(object):
             }
 
             # Create publisher
-            i["reset_pub"] = rospy.Publisher(i["address"] + "/reset", UInt64, queue_size=0, latch=True)
+            i["reset_pub"] = inprocess.publisher(i["address"] + "/reset", UInt64, queue_size=0, latch=True)
             d = i["reset"].subscribe(
                 on_next=i["reset_pub"].publish,
                 on_error=lambda e: print("Error : {0}".format(e)),
@@ -379,6 +417,10 @@ class RxMessageBroker(object):
                             color is not None
                         ), "Address (cname_address) not found in self.(disconnected, connected_rx, connected_ros)."
                     status = self.node_io[node_name][key][cname_address]["status"]
+                    if key == "outputs":
+                        _, address = self._split_cname_address(cname_address)
+                        if address in self.decimation and self.decimation[address]["factor"] > 1:
+                            status = "Decimated with a factor of %s" % self.decimation[address]["factor"]
 
                     # Print status
                     entry = self.node_io[node_name][key][cname_address]
@@ -408,6 +450,9 @@ class RxMessageBroker(object):
         if self.effective_log_level > DEBUG:
             print_status = False
 
+        # Request all push-downs first, so that the producers acknowledge them concurrently.
+        self._request_pushdowns()
+
         for node_name, node in self.disconnected.items():
             # Skip if no disconnected addresses
             num_disconnected = 0
@@ -443,6 +488,7 @@ class RxMessageBroker(object):
                             12, " "
                         )
                         status += node_str + msg_type_str + converter_str
+                        check_rx_skipped(entry, self.rx_connectable[address]["source"])
                         self.connected_rx[node_name][key][cname_address] = entry
                         T = self.rx_connectable[address]["rx"]
                     else:
@@ -451,7 +497,19 @@ class RxMessageBroker(object):
                         rate_str = "|" + "".center(3, " ")
                         msg_type = entry["msg_type"]
                         self.connected_ros[node_name][key][cname_address] = entry
-                        T = from_topic(msg_type, address, node_name, self.subscribers)
+                        processed, reset_address = None, None
+                        if key in ("inputs", "feedthrough") and not cname_address.endswith("/reset"):
+                            reset_address = address + "/reset"
+                        if key == "inputs" and is_pushable(entry):
+                            # Let the producer apply the processor, and subscribe to the processed topic instead.
+                            processed = self._pushdown_address(address, entry["converter"])
+                        if processed:
+                            address = processed
+                            entry["source"]["pushdown"] = True
+                            status = "ROS*|".ljust(5, " ")
+                        elif key in ("inputs", "feedthrough") and not cname_address.endswith("/reset"):
+                            self._request_rate(address, cname_address, self._required_rate(node_name, key, entry))
+                        T = self._shared_topic(msg_type, address, node_name, reset_address=reset_address)
 
                     # Subscribe and change status
                     entry["disposable"] = T.subscribe(entry["rx"])
@@ -481,6 +539,207 @@ class RxMessageBroker(object):
 
             print_status and print("".center(140, " "))
 
+        # Connections changed, so determine again for which outputs messages can be recycled.
+        self._update_pools()
+
+    def _update_pools(self):
+        from eagerx.core.converters import Identity
+
+        rx_addresses = set()
+        for node in self.connected_rx.values():
+            for addresses in node.values():
+                rx_addresses.update([self._split_cname_address(cname_address)[1] for cname_address in addresses.keys()])
+        for node in self.node_io.values():
+            for entry in node["outputs"].values():
+                o = entry["source"]
+                if "msg_pool" not in o or o["msg_pool"] is None:
+                    continue
+                # Rx consumers may hold on to messages (e.g. in their window), change-only outputs hold on to
+                # the last message, and converters may reuse the input message. In-process topics pass (and latch)
+                # messages by reference, so their consumers may hold on to messages as well.
+                safe = (
+                    o["address"] not in rx_addresses
+                    and not inprocess.is_local(o["address"])
+                    and not o.get("change_only", False)
+                    and isinstance(o["converter"], Identity)
+                )
+                if safe != o["msg_pool"].enabled:
+                    rospy.logdebug(f"[{self.owner}] Message pooling for output `{o['address']}`: enabled={safe}.")
+                o["msg_pool"].enabled = safe
+
+    def _shared_topic(self, msg_type, address, node_name, reset_address=None):
+        # Only create a single ROS subscriber per (address, msg_type) in this process, and fan-out the
+        # deserialized message to all (local) consumers via a subject.
+        key = (address, msg_type)
+        if key not in self.shared_topics:
+            # All publishers are latched, so we replay the last received message to consumers that connect later.
+            # Unlike the latch, we forget the message when its output is reset, so that a consumer never receives
+            # a (stale) message of a previous episode. The reset is subscribed first, because its latched count
+            # precedes the latched message.
+            subject, latched = Subject(), []
+            if reset_address is not None:
+                reset = self._shared_topic(UInt64, reset_address, node_name)
+                self.disposables.append(reset.subscribe(lambda _msg: latched.clear()))
+
+            def _latch(msg):
+                latched[:] = [msg]
+                subject.on_next(msg)
+
+            d = from_topic(msg_type, address, node_name, self.subscribers).subscribe(on_next=_latch, on_error=subject.on_error)
+            self.disposables.append(d)
+            self.shared_topics[key] = dict(rx=replay_latched(subject, latched), subject=subject, node_names=[])
+        self.shared_topics[key]["node_names"].append(node_name)
+        return self.shared_topics[key]["rx"]
+
+    def _request_pushdowns(self):
+        acks = []
+        for node in self.disconnected.values():
+            for cname_address, entry in node["inputs"].items():
+                _, address = self._split_cname_address(cname_address)
+                if address not in self.rx_connectable and is_pushable(entry):
+                    acks.append(self._request_pushdown(address, entry["converter"]))
+
+        # Condition.wait releases the condition while waiting, so that this broker keeps handling the callbacks
+        # (e.g. the push-down requests of other processes) in the meantime.
+        if not all(ack.is_set() for ack in acks):
+            self.cond.wait_for(lambda: all(ack.is_set() for ack in acks), timeout=PUSHDOWN_TIMEOUT)
+
+    def _request_pushdown(self, address, processor):
+        pid = processor_id(processor)
+        requests = self.pushdown_requests.setdefault(address, dict())
+        if pid not in requests:
+            requests[pid] = processor.get_yaml_definition()
+            if address not in self._pushdown_publishers:
+                pub = inprocess.publisher(address + "/pushdown", String, queue_size=0, latch=True)
+                self._pushdown_publishers[address] = pub
+                self._publishers.append(pub)
+
+                # Wakes up connect_io, which waits for the acknowledgements.
+                acks = self.pushdown_acks[address] = dict()
+                cond = self.cond
+
+                def _ack_cb(msg):
+                    with cond:
+                        [acks.setdefault(pid, Event()).set() for pid in json.loads(msg.data)]
+                        cond.notify_all()
+
+                sub = inprocess.subscriber(address + "/pushdown_ack", String, callback=_ack_cb)
+                self.subscribers.append(sub)
+            # The latched message always contains all processors that were requested by this process.
+            self._pushdown_publishers[address].publish(String(data=json.dumps(requests)))
+        return self.pushdown_acks[address].setdefault(pid, Event())
+
+    def _pushdown_address(self, address, processor):
+        # Only switch to the processed topic if the producer acknowledged that it publishes every message there.
+        pid = processor_id(processor)
+        if not self.pushdown_acks[address][pid].is_set():
+            rospy.logwarn(
+                f"[{self.owner}] Producer of `{address}` did not acknowledge the push-down of processor "
+                f"`{processor.__class__.__name__}` within {PUSHDOWN_TIMEOUT} seconds. Applying it in the consumer instead."
+            )
+            return None
+        return f"{address}/processed/{pid}"
+
+    def _pushdown_cb(self, msg, output):
+        address = output["address"]
+        pushed = self.pushed_down.setdefault(address, dict())
+        for pid, processor_args in json.loads(msg.data).items():
+            if pid in pushed:
+                continue
+            processor = initialize_converter(processor_args)
+            pub = inprocess.publisher(f"{address}/processed/{pid}", output["msg_type"], queue_size=0, latch=True)
+            convert = processor.convert
+            encode = rx_skipped_encoder(output)
+            if encode:
+                convert = lambda msg, encode=encode, process=processor.convert: process(encode(msg))  # noqa: E731
+            # Every message is published (i.e. never decimated), so the reset count of the original address also applies
+            # to the processed topic.
+            d = output["msg"].subscribe(
+                on_next=encoded_publish(pub, convert),
+                on_error=lambda e: print("Error : {0}".format(e)),
+            )
+            self.disposables.append(d)
+            self._publishers.append(pub)
+            pushed[pid] = processor
+            rospy.logdebug(f"[{self.owner}] Pushed down processor `{processor_args['converter_type']}` to output `{address}`.")
+        output["ack_pub"].publish(String(data=json.dumps(list(pushed.keys()))))
+
+    def _required_rate(self, node_name, key, entry):
+        # Only asynchronous inputs with window=1 can do with a lower rate than the output rate, because they only
+        # require the most recent message every tick. A skipped input only affects the first tick, so it is irrelevant.
+        # A rate of 0 means that every message is required.
+        holder = self.node_io[node_name]["node"]
+        node = getattr(holder, "node", getattr(holder, "bridge", None))
+        if key != "inputs" or entry.get("window", None) != 1 or node is None:
+            return 0
+        if getattr(node, "sync", True) or not getattr(node, "real_time_factor", 0) > 0:
+            return 0
+        return node.rate
+
+    def _request_rate(self, address, cname_address, rate):
+        requests = self.rate_requests.setdefault(address, dict())
+        requests[cname_address] = rate
+        if address not in self._rate_publishers:
+            pub = inprocess.publisher(address + "/rate_request", Float32, queue_size=0, latch=True)
+            self._rate_publishers[address] = pub
+            self._publishers.append(pub)
+        # All consumers in this process share the same ROS subscriber, so we request the highest rate of all.
+        rates = list(requests.values())
+        rate = 0 if min(rates) == 0 else max(rates)
+        self._rate_publishers[address].publish(Float32(data=rate))
+
+    def _can_decimate(self, node_name, output, tick_address):
+        # Consumers only request a lower rate if they run asynchronously in real-time (see _required_rate). As all nodes
+        # share the sync and real_time_factor of the bridge, no consumer can request it if the producer does not either.
+        # Change-only outputs are never decimated, because consumers refill the messages that were not sent by repeating
+        # the last one. In-process topics are not serialized, so there is nothing to gain.
+        if output["address"] == tick_address or output.get("change_only", False) or inprocess.is_local(output["address"]):
+            return False
+        holder = self.node_io[node_name]["node"]
+        node = getattr(holder, "node", getattr(holder, "bridge", None))
+        return node is not None and not getattr(node, "sync", True) and getattr(node, "real_time_factor", 0) > 0
+
+    def _decimated_publish(self, address, rate, pub, encode=None):
+        state = dict(factor=1, consumers=dict())
+        self.decimation[address] = state
+        cb_args = (address, rate)
+        sub = inprocess.subscriber(address + "/rate_request", Float32, callback=self._rate_request_cb, callback_args=cb_args)
+        self.subscribers.append(sub)
+        count = [0]
+        send = encoded_publish(pub, encode)
+
+        def publish(msg):
+            factor = state["factor"]
+            if factor > 1:
+                # Forget the requests of consumers that disconnected, and only decimate if all connected consumers
+                # have requested a lower rate.
+                connected = inprocess.connections(pub)
+                if not set(state["consumers"].keys()) <= connected:
+                    self._update_factor(address, rate, connected)
+                    factor = state["factor"]
+                if not connected <= set(state["consumers"].keys()):
+                    factor = 1
+            if count[0] % factor == 0:
+                send(msg)
+            count[0] += 1
+
+        return publish
+
+    def _rate_request_cb(self, msg, args):
+        address, rate_out = args
+        self.decimation[address]["consumers"][msg._connection_header["callerid"]] = msg.data
+        self._update_factor(address, rate_out)
+
+    def _update_factor(self, address, rate_out, connected=None):
+        state = self.decimation[address]
+        if connected is not None:
+            [state["consumers"].pop(callerid) for callerid in list(state["consumers"].keys()) if callerid not in connected]
+        rates = list(state["consumers"].values())
+        factor = 1 if len(rates) == 0 or min(rates) <= 0 else max(1, int(rate_out // max(rates)))
+        if factor != state["factor"]:
+            rospy.loginfo(f"[{self.owner}] Decimating output `{address}` ({rate_out} Hz) with a factor of {factor}.")
+        state["factor"] = factor
+
     def _split_cname_address(self, cname_address):
         res = cname_address.split(":")
         if len(res) == 2:
@@ -497,6 +756,64 @@ class RxMessageBroker(object):
         [pub.unregister() for pub in self._publishers]
         [sub.unregister() for sub in self.subscribers]
         [d.dispose() for d in self.disposables]
+        [t["subject"].dispose() for t in self.shared_topics.values()]
+        self.shared_topics.clear()
+
+
+#: Seconds that a consumer waits for the producer to acknowledge a push-down request.
+PUSHDOWN_TIMEOUT = 10.0
+
+
+def processor_id(processor) -> str:
+    definition = json.dumps(processor.get_yaml_definition(), sort_keys=True)
+    return hashlib.md5(definition.encode()).hexdigest()[:8]
+
+
+def is_pushable(entry) -> bool:
+    # Only (stateless) processors on non-external inputs can be applied by the producer.
+    from eagerx.core.entities import Processor
+
+    converter = entry.get("converter", None)
+    if not isinstance(converter, Processor) or not converter.PUSHDOWN:
+        return False
+    return not entry["source"].get("external_rate", None)
+
+
+def rx_skipped_encoder(output):
+    # Converters with skip_rx=True only convert right before publishing, so Rx links receive the unconverted message.
+    converter = output["converter"]
+    if not getattr(converter, "skip_rx", False):
+        return None
+    return lambda msg: converter.A_to_B(msg) if isinstance(msg, converter.MSG_TYPE_A) else msg
+
+
+def encoded_publish(pub, encode=None):
+    # Encodes (e.g. compresses, or applies a pushed down processor) before publishing. Every message is published,
+    # also without subscribers, because the latched message is sent to subscribers that connect later (e.g. for resets).
+    if encode is None:
+        return pub.publish
+    return lambda msg: pub.publish(encode(msg))
+
+
+def check_rx_skipped(entry, output):
+    # Rx links of outputs with a skip_rx converter receive the unconverted message, so the input must skip it as well.
+    converter = output["converter"]
+    if not getattr(converter, "skip_rx", False) or "converter" not in entry:
+        return
+    assert type(entry["converter"]) is type(converter) and getattr(entry["converter"], "skip_rx", False), (
+        f'Cannot connect `{entry["source"]["address"]}` via Rx: the output converter `{converter.__class__.__name__}` '
+        f"has skip_rx=True, so the input converter must be a `{converter.__class__.__name__}` with skip_rx=True as well."
+    )
+
+
+def replay_latched(subject, latched: list) -> Observable:
+    """Replays the *latched* messages to every observer, before it subscribes to *subject*."""
+
+    def _subscribe(observer, scheduler=None) -> Disposable:
+        [observer.on_next(msg) for msg in list(latched)]
+        return subject.subscribe(observer, scheduler=scheduler)
+
+    return create(_subscribe)
 
 
 def from_topic(topic_type: Any, topic_name: str, node_name, subscribers: list) -> Observable:
@@ -512,7 +829,7 @@ def from_topic(topic_type: Any, topic_name: str, node_name, subscribers: list) -
                     sub.unregister()
                     rospy.logdebug(f"[{sub.name}]: Unregistered this subscription because of exception: {e}")
 
-            sub = rospy.Subscriber(topic_name, topic_type, callback=cb_from_topic, callback_args=wrapped_sub)
+            sub = inprocess.subscriber(topic_name, topic_type, callback=cb_from_topic, callback_args=wrapped_sub)
             wrapped_sub.append(sub)
             subscribers.append(sub)
         except Exception as e:
@@ -7,7 +7,6 @@ import rx
 from rx import Observable, typing, operators as ops
 from rx.disposable import Disposable, SingleAssignmentDisposable, CompositeDisposable
 from rx.subject import Subject, BehaviorSubject
-from rx.internal.concurrency import synchronized
 
 # EAGERX IMPORTS
 from eagerx.core.converters import Identity
@@ -26,6 +25,7 @@ from eagerx.utils.utils import (
     get_attribute_from_module,
     initialize_converter,
     get_param_with_blocking,
+    param_client,
     Info,
     Msg,
     Stamp,
@@ -36,6 +36,7 @@ from eagerx.utils.utils import (
 
 # OTHER IMPORTS
 import time
+import numpy as np
 from collections import deque
 from termcolor import cprint
 import datetime
@@ -483,118 +484,292 @@ def calculate_inputs(N_node, rate_in, rate_node, delay):
     return N_in
 
 
-def generate_msgs(
-    source_Nc: Observable,
-    rate_node: float,
-    name: str,
-    rate_in: float,
-    params: dict,
-    sync: bool,
-    real_time_factor: float,
-    simulate_delays: bool,
-    node=None,
-):
-    dt_i = 1 / rate_in
+class InputChannel:
+    """Fused input channel of a node.
+
+    Converts, counts and buffers the received messages, and generates the windowed :class:`~eagerx.utils.utils.Msg`
+    every node tick in a single ``on_next``, instead of chaining ``map``, ``scan``, ``share``, ``combine_latest`` and a
+    message generator per input. The semantics are the same as that (legacy) pipeline:
+
+    - :attr:`channel` emits a :class:`~eagerx.utils.utils.Msg` for every tick in ``Nc``.
+
+    - :attr:`flag` emits the number of received messages (starting at 0 on subscription), combined with the
+      expected number of messages in ``Is``. In sync mode, it only emits if they match.
+
+    The source subscription (and its message counter) is shared by :attr:`channel` and :attr:`flag`, and is disposed
+    once both are unsubscribed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        source: Observable,
+        Nc: Observable,
+        Is: Observable,
+        convert,
+        rate_node: float,
+        rate_in: float,
+        params: dict,
+        sync: bool,
+        real_time_factor: float,
+        simulate_delays: bool,
+        change_only: bool = False,
+        scheduler: Optional[typing.Scheduler] = None,
+    ):
+        self.name = name
+        self._source = source.pipe(ops.observe_on(scheduler))
+        self._Nc = Nc
+        self._Is = Is
+        self._convert = convert
+        self._rate_node = rate_node
+        self._rate_in = rate_in
+        self._dt_i = 1 / rate_in
+        self._window = params["window"]
+        self._skip = int(params["skip"])
+        self._delay = params["delay"] if simulate_delays else 0.0
+        self._sync = sync
+        self._real_time_factor = real_time_factor
+        # The held value is only synthesised in async mode, because change-only outputs are only filtered in async mode.
+        self._hold = change_only and not sync
+
+        # Shared source subscription
+        self._lock = RLock()
+        self._num_subscribers = 0
+        self._sad = None
+        self._count = -1
+        self._channel_subs = []
+        self._flag_subs = []
+
+        #: Emits a :class:`~eagerx.utils.utils.Msg` with the (windowed) received messages every node tick.
+        self.channel = rx.create(self._subscribe_channel).pipe(ops.share())
+        #: Emits ``{name: num_msgs}`` if the number of received messages matches the expected number (sync only).
+        self.flag = rx.create(self._subscribe_flag)
+
+    def _connect(self, scheduler):
+        with self._lock:
+            self._num_subscribers += 1
+            if self._num_subscribers == 1:
+                self._count = -1
+                self._sad = SingleAssignmentDisposable()
+                self._sad.disposable = self._source.subscribe(self._on_next, self._on_error, self._on_completed, scheduler)
+
+    def _disconnect(self):
+        with self._lock:
+            self._num_subscribers -= 1
+            if self._num_subscribers == 0 and self._sad is not None:
+                self._sad.dispose()
+                self._sad = None
+
+    def _on_next(self, msg):
+        try:
+            msg = self._convert(msg)
+        except Exception as ex:  # pylint: disable=broad-except
+            self._on_error(ex)
+            return
+        self._count += 1
+        count = self._count
+        for on_msg, _ in list(self._channel_subs):
+            on_msg(count, msg)
+        for on_count, _ in list(self._flag_subs):
+            on_count(count + 1)
+
+    def _on_error(self, ex):
+        for _, observer in list(self._channel_subs):
+            observer.on_error(ex)
+        for _, observer in list(self._flag_subs):
+            observer.on_error(ex)
+
+    def _on_completed(self):
+        for _, observer in list(self._channel_subs):
+            observer.on_completed()
+        for _, observer in list(self._flag_subs):
+            observer.on_completed()
+
+    def _subscribe_flag(self, observer: typing.Observer, scheduler: Optional[typing.Scheduler] = None) -> Disposable:
+        name, sync = self.name, self._sync
+        state = [0, None]  # [num_msgs, num_expected]
+
+        def emit():
+            if state[1] is not None and (not sync or state[0] == state[1]):
+                observer.on_next({name: state[0]})
+
+        def on_count(num_msgs):
+            state[0] = num_msgs
+            emit()
+
+        def on_reset(msg):
+            state[1] = msg.data  # Depends on ROS reset msg type
+            emit()
+
+        sub = (on_count, observer)
+        self._flag_subs.append(sub)
+        self._connect(scheduler)
+        d_Is = self._Is.subscribe(on_reset, observer.on_error, scheduler=scheduler)
+
+        def dispose():
+            d_Is.dispose()
+            self._flag_subs.remove(sub)
+            self._disconnect()
+
+        return Disposable(dispose)
+
+    def _subscribe_channel(
+        self, observer: typing.Observer, scheduler: Optional[typing.Scheduler] = None
+    ) -> CompositeDisposable:
+        gen = _ChannelGenerator(self, observer)
+        sad = SingleAssignmentDisposable()
+        subscriptions = [sad]
+        sad.disposable = self._Nc.subscribe(gen.on_next_Nc, observer.on_error, observer.on_completed, scheduler)
+
+        if not self._sync and self._delay > 0:
+            # Simulated delays are only applied to the channel (i.e. not to the flag), so they go via a separate stream.
+            delayed = Subject()
+            on_msg = lambda count, msg: delayed.on_next((count, msg))  # noqa: E731
+            subscriptions.append(
+                delayed.pipe(ops.delay(self._delay / self._real_time_factor)).subscribe(
+                    lambda x: gen(*x), observer.on_error, scheduler=scheduler
+                )
+            )
+        else:
+            on_msg = gen
+        sub = (on_msg, observer)
+        self._channel_subs.append(sub)
+        self._connect(scheduler)
+
+        def dispose():
+            self._channel_subs.remove(sub)
+            self._disconnect()
+
+        subscriptions.append(Disposable(dispose))
+        return CompositeDisposable(subscriptions)
+
+
+class _ChannelGenerator:
+    # Per subscription state of InputChannel.channel.
+    def __init__(self, channel: InputChannel, observer: typing.Observer):
+        self.c = channel
+        self.observer = observer
+        self.start = time.time()
+        self.msgs_queue: List = []
+        self.t_i_queue: List = []
+        self.num_queue: List = []
+        self.tick_queue: List = []
+        self.msgs_window = deque(maxlen=channel._window)
+        self.t_i_window = deque(maxlen=channel._window)
+        self.t_n_window = deque(maxlen=channel._window)
+        self.lock = RLock()
+        self.last_msg = None
+        self.num_msgs_total = 0
+
+    def fill_held(self, wc_stamp):
+        # Synthesise the held value for every message that the change-only output did not publish (up until now).
+        c = self.c
+        num_expected = int(((wc_stamp - self.start) / c._real_time_factor) * c._rate_in)
+        while self.last_msg is not None and self.num_msgs_total < num_expected:
+            sim_stamp = self.num_msgs_total * c._dt_i
+            self.msgs_queue.append(self.last_msg)
+            self.t_i_queue.append(Stamp(self.num_msgs_total, sim_stamp, self.start + sim_stamp * c._real_time_factor))
+            self.num_msgs_total += 1
+
+    def __call__(self, count, msg):
+        c = self.c
+        with self.lock:
+            wc_stamp = time.time()
+            seq = count
+            if c._hold:
+                self.fill_held(wc_stamp)
+                self.last_msg = msg
+                seq = self.num_msgs_total
+                self.num_msgs_total += 1
+            self.msgs_queue.append(msg)
+            if c._sync:
+                sim_stamp = round(count * c._dt_i, 12)
+            else:
+                sim_stamp = (wc_stamp - self.start) / c._real_time_factor
+            self.t_i_queue.append(Stamp(seq, sim_stamp, wc_stamp))
+            self.next()
+
+    def on_next_Nc(self, x):
+        c = self.c
+        with self.lock:
+            if c._sync:
+                # Caculate expected number of message to be received
+                self.num_queue.append(expected_inputs(x - c._skip, c._rate_in, c._rate_node, c._delay))
+            self.tick_queue.append(x)
+            self.next()
+
+    def next(self):
+        c = self.c
+        if len(self.tick_queue) == 0:
+            return
+        if c._hold:
+            self.fill_held(time.time())
+        if c._sync and len(self.msgs_queue) < self.num_queue[0]:
+            return
+        tick = self.tick_queue.pop(0)
+        if c._sync:
+            num_msgs = self.num_queue.pop(0)
+            msgs = self.msgs_queue[:num_msgs]
+            t_i = self.t_i_queue[:num_msgs]
+            del self.msgs_queue[:num_msgs]
+            del self.t_i_queue[:num_msgs]
+        else:  # Empty complete buffer
+            msgs = self.msgs_queue
+            t_i = self.t_i_queue
+            self.msgs_queue = []
+            self.t_i_queue = []
+
+        # Determine t_n stamp
+        wc_stamp = time.time()
+        if c._sync:
+            sim_stamp = round(tick / c._rate_node, 12)
+        else:
+            sim_stamp = (wc_stamp - self.start) / c._real_time_factor
+        t_n = Stamp(tick, sim_stamp, wc_stamp)
+
+        if c._window > 0:
+            self.msgs_window.extend(msgs)
+            self.t_i_window.extend(t_i)
+            self.t_n_window.extend([t_n] * len(msgs))
+            wmsgs = list(self.msgs_window)
+            wt_i = list(self.t_i_window)
+            wt_n = list(self.t_n_window)
+        else:
+            wmsgs = msgs
+            wt_i = t_i
+            wt_n = [t_n] * len(msgs)
+        self.observer.on_next(Msg(Info(c.name, tick, c._rate_in, wt_n, wt_i, None), wmsgs))
 
-    def _generate_msgs(source_msg: Observable):
-        window = params["window"]
-        skip = int(params["skip"])
 
-        def subscribe(observer: typing.Observer, scheduler: Optional[typing.Scheduler] = None) -> CompositeDisposable:
-            start = time.time()
-            msgs_queue: List = []
-            t_i_queue: List = []
-            num_queue: List = []
-            tick_queue: List = []
-            msgs_window = deque(maxlen=window)
-            t_i_window = deque(maxlen=window)
-            t_n_window = deque(maxlen=window)
-            lock = RLock()
-
-            @synchronized(lock)
-            def next(i):
-                if len(tick_queue) > 0:
-                    if not sync or len(msgs_queue) >= num_queue[0]:
-                        try:
-                            tick = tick_queue.pop(0)
-                            if sync:
-                                # determine num_msgs
-                                num_msgs = num_queue.pop(0)
-                                msgs = msgs_queue[:num_msgs]
-                                t_i = t_i_queue[:num_msgs]
-                                msgs_queue[:] = msgs_queue[num_msgs:]
-                                t_i_queue[:] = t_i_queue[num_msgs:]
-                            else:  # Empty complete buffer
-                                msgs = msgs_queue.copy()
-                                t_i = t_i_queue.copy()
-                                msgs_queue[:] = []
-                                t_i_queue[:] = []
-                        except Exception as ex:  # pylint: disable=broad-except
-                            observer.on_error(ex)
-                            return
-
-                        # Determine t_n stamp
-                        wc_stamp = time.time()
-                        seq = tick
-                        if sync:
-                            sim_stamp = round(tick / rate_node, 12)
-                        else:
-                            sim_stamp = (wc_stamp - start) / real_time_factor
-                        t_n = Stamp(seq, sim_stamp, wc_stamp)
-
-                        if window > 0:
-                            msgs_window.extend(msgs)
-                            t_i_window.extend(t_i)
-                            t_n_window.extend([t_n] * len(msgs))
-                            wmsgs = list(msgs_window)
-                            wt_i = list(t_i_window)
-                            wt_n = list(t_n_window)
-                        else:
-                            wmsgs = msgs
-                            wt_i = t_i
-                            wt_n = [t_n] * len(msgs)
-                        res = Msg(Info(name, tick, rate_in, wt_n, wt_i, None), wmsgs)
-                        observer.on_next(res)
-
-            # Determine Nc logic
-            def on_next_Nc(x):
-                if sync:
-                    # Caculate expected number of message to be received
-                    delay = params["delay"] if simulate_delays else 0.0
-                    num_msgs = expected_inputs(x - skip, rate_in, rate_node, delay)
-                    num_queue.append(num_msgs)
-                tick_queue.append(x)
-                next(x)
-
-            subscriptions = []
-            sad = SingleAssignmentDisposable()
-            sad.disposable = source_Nc.subscribe(on_next_Nc, observer.on_error, observer.on_completed, scheduler)
-            subscriptions.append(sad)
-
-            def on_next_msg(x):
-                msgs_queue.append(x[1])
-                wc_stamp = time.time()
-                seq = x[0]
-                if sync:
-                    sim_stamp = round(x[0] * dt_i, 12)
-                else:
-                    sim_stamp = (wc_stamp - start) / real_time_factor
-                t_i_queue.append(Stamp(seq, sim_stamp, wc_stamp))
-                next(x)
+def msg_changed(prev, msg, tolerance: float) -> bool:
+    try:
+        a = np.array(prev.data, dtype=float)
+        b = np.array(msg.data, dtype=float)
+        return a.shape != b.shape or not np.allclose(a, b, rtol=0.0, atol=tolerance)
+    except (AttributeError, TypeError, ValueError):
+        return prev != msg
 
-            sad = SingleAssignmentDisposable()
-            if not sync and simulate_delays:
-                source_msg_delayed = source_msg.pipe(ops.delay(params["delay"] / real_time_factor))
-            else:
-                source_msg_delayed = source_msg
-            sad.disposable = source_msg_delayed.subscribe(on_next_msg, observer.on_error, observer.on_completed, scheduler)
-            subscriptions.append(sad)
 
-            return CompositeDisposable(subscriptions)
+def filter_unchanged(tolerance: float, keyframe: int):
+    # Only passes messages that changed more than tolerance w.r.t. the last passed message, or every keyframe'th message.
+    def _filter_unchanged(source):
+        def subscribe(observer, scheduler=None):
+            last = [None]
+            num_held = [0]
+
+            def on_next(msg):
+                if last[0] is None or (keyframe > 0 and num_held[0] + 1 >= keyframe) or msg_changed(last[0], msg, tolerance):
+                    last[0] = msg
+                    num_held[0] = 0
+                    observer.on_next(msg)
+                else:
+                    num_held[0] += 1
+
+            return source.subscribe(on_next, observer.on_error, observer.on_completed, scheduler)
 
         return rx.create(subscribe)
 
-    return _generate_msgs
+    return _filter_unchanged
 
 
 def create_channel(
@@ -615,21 +790,17 @@ def create_channel(
     else:
         name = inpt["name"]
 
-    # Readable format
-    Is = inpt["reset"]
-    Ir = inpt["msg"].pipe(
-        ops.observe_on(scheduler),
-        ops.map(inpt["converter"].convert),
-        ops.scan(lambda acc, x: (acc[0] + 1, x), (-1, None)),
-        ops.share(),
-    )
+    convert = (lambda msg: msg) if inpt.get("pushdown", False) else inpt["converter"].convert  # Already processed
 
     # Get rate from rosparam server
     if inpt["external_rate"] and inpt["external_rate"] > 0:
         rate = inpt["external_rate"]
+        change_only = False
     else:
         rate_str = "%s/rate/%s" % (ns, inpt["address"][len(ns) + 1 :])
         rate = get_param_with_blocking(rate_str)
+        # Uploaded together with the rate, so it is available if the rate is.
+        change_only = param_client.get("%s/change_only/%s" % (ns, inpt["address"][len(ns) + 1 :]), default=False)
 
     # Create input channel
     if real_time_factor == 0:
@@ -637,29 +808,22 @@ def create_channel(
     else:
         Nc = Nc.pipe(ops.observe_on(scheduler))
 
-    channel = Ir.pipe(
-        generate_msgs(
-            Nc,
-            rate_node,
-            name,
-            rate,
-            params=inpt,
-            sync=sync,
-            real_time_factor=real_time_factor,
-            simulate_delays=simulate_delays,
-            node=node,
-        ),
-        ops.share(),
-    )
-
-    # Create reset flag
-    flag = Ir.pipe(
-        ops.map(lambda val: val[0] + 1),
-        ops.start_with(0),
-        ops.combine_latest(Is.pipe(ops.map(lambda msg: msg.data))),  # Depends on ROS reset msg type
-        ops.filter(lambda value: not sync or value[0] == value[1]),
-        ops.map(lambda x: {name: x[0]}),
+    ic = InputChannel(
+        name,
+        inpt["msg"],
+        Nc,
+        inpt["reset"],
+        convert,
+        rate_node,
+        rate,
+        params=inpt,
+        sync=sync,
+        real_time_factor=real_time_factor,
+        simulate_delays=simulate_delays,
+        change_only=change_only,
+        scheduler=scheduler,
     )
+    channel, flag = ic.channel, ic.flag
     return channel, flag
 
 
@@ -676,6 +840,9 @@ def init_channels(
     node,
     is_feedthrough=False,
 ):
+    # Params may have been reconfigured since the last reset
+    param_client.sync(ns)
+
     # Create channels
     channels = []
     flags = []
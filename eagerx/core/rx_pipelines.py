@@ -10,6 +10,8 @@ from rx.subject import ReplaySubject, Subject, BehaviorSubject
 
 # EAGERX IMPORTS
 from eagerx.core.constants import DEBUG
+from eagerx.utils.utils import MessagePool
+from eagerx.utils import scheduling
 
 from eagerx.core.rx_operators import (
     cb_ft,
@@ -34,9 +36,22 @@ from eagerx.core.rx_operators import (
     extract_node_reset,
     throttle_callback_trigger,
     with_latest_from,
+    filter_unchanged,
 )
 
 
+def publish_and_release(subject, pool=None):
+    if pool is None:
+        return subject.on_next
+
+    def _publish_and_release(msg):
+        subject.on_next(msg)
+        # All consumers are synchronous (checked by the message broker), so the message can be recycled.
+        pool.release(msg)
+
+    return _publish_and_release
+
+
 def init_node_pipeline(
     ns,
     rate_node,
@@ -137,13 +152,23 @@ def init_node_pipeline(
 
     # Publish output msg as ROS topic and to subjects if single process
     for o in outputs:
+        # Change-only outputs are only filtered in async mode. In sync mode, consumers expect every message.
+        if o.get("change_only", False) and not sync:
+            change_filter = filter_unchanged(o["tolerance"], o["keyframe"])
+        else:
+            change_filter = rx.pipe()
         d = output_stream.pipe(
             ops.filter(lambda x: x is not None),
             ops.pluck(o["name"]),
             ops.filter(lambda x: x is not None),
             ops.map(o["converter"].convert),
+            change_filter,
             ops.share(),
-        ).subscribe(o["msg"])
+        ).subscribe(
+            on_next=publish_and_release(o["msg"], o.get("msg_pool", None)),
+            on_error=o["msg"].on_error,
+            on_completed=o["msg"].on_completed,
+        )
         # Add disposable
         d_msg += [d]
 
@@ -194,7 +219,7 @@ def init_node(
     targets=tuple(),
 ):
     # Initialize scheduler
-    event_scheduler = EventLoopScheduler()
+    event_scheduler = EventLoopScheduler(thread_factory=scheduling.thread_factory(node))
     eps_disp = CompositeDisposable()
     reset_disp = CompositeDisposable(eps_disp)
 
@@ -255,6 +280,10 @@ def init_node(
         # Prepare output topic
         i["msg"] = Subject()
 
+        # Prepare message pool (enabled by the message broker, if safe)
+        if i.get("pool_size", 0) > 0:
+            i["msg_pool"] = MessagePool(i["msg_type"], i["pool_size"], guard=i["pool_guard"], name=i["address"])
+
         # Initialize reset topic
         i["reset"] = Subject()
 
@@ -466,7 +495,11 @@ def init_bridge_pipeline(
             ops.filter(lambda x: x is not None),
             ops.map(o["converter"].convert),
             ops.share(),
-        ).subscribe(o["msg"])
+        ).subscribe(
+            on_next=publish_and_release(o["msg"], o.get("msg_pool", None)),
+            on_error=o["msg"].on_error,
+            on_completed=o["msg"].on_completed,
+        )
         # Add disposable
         d_msg += [d]
 
@@ -510,7 +543,7 @@ def init_bridge(
     # Initialization ##########################################################
     ###########################################################################
     # Prepare scheduler
-    event_scheduler = EventLoopScheduler()
+    event_scheduler = EventLoopScheduler(thread_factory=scheduling.thread_factory(node))
     eps_disp = CompositeDisposable()
     reset_disp = CompositeDisposable(eps_disp)
 
@@ -524,6 +557,10 @@ def init_bridge(
         # Prepare output topic
         i["msg"] = Subject()
 
+        # Prepare message pool (enabled by the message broker, if safe)
+        if i.get("pool_size", 0) > 0:
+            i["msg_pool"] = MessagePool(i["msg_type"], i["pool_size"], guard=i["pool_guard"], name=i["address"])
+
         # Initialize reset topic
         i["reset"] = Subject()
 
@@ -1,7 +1,6 @@
 from typing import Dict, Any, Optional, Union
 import inspect
 from yaml import dump
-import copy
 
 import eagerx.core.register as register
 from eagerx.core.view import SpecView, GraphView
@@ -11,7 +10,9 @@ from eagerx.utils.utils import (
     get_module_type_string,
     get_default_params,
     substitute_args,
+    copy_params,
 )
+from eagerx.utils.build_cache import cached
 
 
 class EntitySpec(object):
@@ -28,6 +29,11 @@ class EntitySpec(object):
     @property
     @deepcopy
     def params(self):
+        """A copy of all params of the spec.
+
+        Every read copies all params (with :func:`~eagerx.utils.utils.copy_params`, i.e. not copy-on-write),
+        so prefer the views (e.g. ``spec.config.rate``) to read or modify single params.
+        """
         return self._params
 
     def set_graph(self, graph):
@@ -126,9 +132,10 @@ class BaseNodeSpec(EntitySpec):
 
             Rate (Hz) at which the :func:`~eagerx.core.entities.Node.callback` is called.
 
-        - .. py:attribute:: Spec.config.process: int = 0
+        - .. py:attribute:: Spec.config.process: Union[int, str] = 0
 
             Process in which the node is launched. See :class:`~eagerx.core.constants.process` for all options.
+            Nodes with the same process group (e.g. ``process="group:vision"``) are launched in a single process.
 
         - .. py:attribute:: Spec.config.color: str = grey
 
@@ -143,6 +150,19 @@ class BaseNodeSpec(EntitySpec):
 
             Specifies the log level for the bridge: `{0: SILENT, 10: DEBUG, 20: INFO, 30: WARN, 40: ERROR, 50: FATAL}`
 
+        - .. py:attribute:: Spec.config.cpu_affinity: List[int] = None
+
+            Cpus that the node's process (if launched in a separate process) and scheduler thread may run on.
+
+        - .. py:attribute:: Spec.config.nice: int = None
+
+            Niceness of the node's process (if launched in a separate process) and scheduler thread.
+
+        - .. py:attribute:: Spec.config.sched_priority: int = None
+
+            Real-time (SCHED_FIFO) priority of the node's process (if launched in a separate process) and scheduler thread.
+            Only applied if permitted. The applied settings are logged when the process and scheduler thread start.
+
         The API becomes **read-only** once the entity is added to :class:`~eagerx.core.graph.Graph`.
 
         :return: API to get/set parameters.
@@ -210,6 +230,33 @@ class BaseNodeSpec(EntitySpec):
             Convert messages to a valid format described by the associated :class:`gym.spaces.space.Space`.
             Only used when this output is used as an action.
 
+        - .. py:attribute:: Spec.outputs.<name>.change_only: bool = False
+
+            Only publish the output when it changes by more than *tolerance*, or when a keyframe is due.
+            Receiving inputs synthesise the held value, so *window* semantics are preserved.
+
+            .. note:: Only used in async mode (i.e. :attr:`~eagerx.core.entities.Bridge.sync` = False).
+
+        - .. py:attribute:: Spec.outputs.<name>.tolerance: float = 0.0
+
+            Absolute tolerance used to determine whether a change-only output changed.
+
+        - .. py:attribute:: Spec.outputs.<name>.keyframe: int = 10
+
+            A change-only output is published at least every *keyframe* messages. Set to 0 to disable keyframes.
+
+        - .. py:attribute:: Spec.outputs.<name>.pool_size: int = 0
+
+            Maximum number of message instances that are recycled for this output. Set to 0 to disable pooling.
+            Use :func:`~eagerx.core.entities.BaseNode.get_msg` in the callback to obtain a (recycled) message.
+
+            .. note:: Messages are only recycled if all consumers receive the output via ROS, as ROS serializes messages
+                      before publish returns. Consumers in the same process (i.e. Rx) may hold on to messages.
+
+        - .. py:attribute:: Spec.outputs.<name>.pool_guard: bool = False
+
+            Checks whether recycled messages are still referenced elsewhere, in which case they are not reused.
+
         :return: API to get/set parameters.
         """
         return self._lookup("outputs")
@@ -246,8 +293,7 @@ class BaseNodeSpec(EntitySpec):
         with self.config as d:
             d.update(defaults)
 
-        if "bridge_config" in params:
-            params.pop("bridge_config")
+        params = {component: cnames for component, cnames in params.items() if component != "bridge_config"}
 
         if "targets" in params:
             from eagerx.core.entities import ResetNode
@@ -270,6 +316,11 @@ class BaseNodeSpec(EntitySpec):
                         rate="$(config rate)",
                         converter=self.identity.params,
                         space_converter=None,
+                        change_only=False,
+                        tolerance=0.0,
+                        keyframe=10,
+                        pool_size=0,
+                        pool_guard=False,
                     )
                     # Add feedthrough entries for each output if node is a reset node (i.e. when it has a target)
                     if add_ft:
@@ -406,9 +457,10 @@ class BaseNodeSpec(EntitySpec):
         with self.targets as d:
             d[cname] = mapping
 
+    @cached
     def build(self, ns):
         params = self.params  # Creates a deepcopy
-        default = copy.deepcopy(self.config.to_dict())
+        default = copy_params(self.config.to_dict())
         name = default["name"]
         default["node_type"] = params["node_type"]
         entity_id = default["entity_id"]
@@ -491,18 +543,26 @@ class BaseNodeSpec(EntitySpec):
         default["targets"] = [i.build(ns=ns) for i in targets]
         default["feedthroughs"] = [i.build(ns=ns) for i in feedthroughs]
 
-        # Create rate dictionary with outputs
+        # Create rate (and change-only) dictionary with outputs
         chars_ns = len(ns) + 1
         rate_dict = dict()
+        change_only_dict = dict()
         for i in default["outputs"]:
             assert (
                 i["rate"] is not None and isinstance(i["rate"], (int, float)) and i["rate"] > 0
             ), f'The rate of node "{name}" (and output cname "{i["name"]}") is misspecified: rate="{i["rate"]}". Make sure that it is of type(rate)=("int", "float",) and rate > 0.'
             address = i["address"][chars_ns:]
             rate_dict[address] = i["rate"]  # {'rate': i['rate']}
+            if i["change_only"]:
+                change_only_dict[address] = True
 
         # Put parameters in node namespace (watch out, order of dict keys probably matters...)
-        node_params = {name: default, "rate": rate_dict}
+        # Change-only flags are uploaded before the rates, so they are available when the rates are. Empty dicts are
+        # not uploaded, as they would overwrite the flags of other nodes.
+        node_params = {name: default}
+        if len(change_only_dict) > 0:
+            node_params["change_only"] = change_only_dict
+        node_params["rate"] = rate_dict
         return replace_None(node_params)
 
 
@@ -628,6 +688,19 @@ class BridgeSpec(BaseNodeSpec):
 
             Specifies the log level for the bridge: `{0: SILENT, 10: DEBUG, 20: INFO, 30: WARN, 40: ERROR, 50: FATAL}`.
 
+        - .. py:attribute:: Spec.config.cpu_affinity: List[int] = None
+
+            Cpus that the bridge's process (if launched in a separate process) and scheduler thread may run on.
+
+        - .. py:attribute:: Spec.config.nice: int = None
+
+            Niceness of the bridge's process (if launched in a separate process) and scheduler thread.
+
+        - .. py:attribute:: Spec.config.sched_priority: int = None
+
+            Real-time (SCHED_FIFO) priority of the bridge's process (if launched in a separate process) and scheduler thread.
+            Only applied if permitted. The applied settings are logged when the process and scheduler thread start.
+
         The API becomes **read-only** once the entity is added to :class:`~eagerx.core.graph.Graph`.
 
         :return: API to get/set parameters.
@@ -841,10 +914,12 @@ class ObjectSpec(EntitySpec):
 
         # Set default agnostic params
         with self.config as d:
-            d.update(agnostic.pop("config"))
+            d.update(register.thaw(agnostic["config"]))
 
         # Set default components
         for component, cnames in agnostic.items():
+            if component == "config":
+                continue
             for cname, msg_type in cnames.items():
                 msg_type = get_module_type_string(msg_type)
                 if component == "sensors":
@@ -853,6 +928,9 @@ class ObjectSpec(EntitySpec):
                         rate=1,
                         converter=self.identity.params,
                         space_converter=None,
+                        change_only=False,
+                        tolerance=0.0,
+                        keyframe=10,
                     )
                 elif component == "actuators":
                     mapping = dict(
@@ -926,9 +1004,10 @@ class ObjectSpec(EntitySpec):
         self._params[bridge_id] = {}
         register.add_bridge(self, bridge_id)
 
+    @cached
     def build(self, ns, bridge_id):
         params = self.params  # Creates a deepcopy
-        default = copy.deepcopy(self.config.to_dict())  # Creates a deepcopy
+        default = copy_params(self.config.to_dict())  # Creates a deepcopy
         name = default["name"]
 
         # Construct context
@@ -1137,6 +1216,11 @@ class RxOutput(Component):
         rate: float,
         converter: Dict = None,
         space_converter: Dict = None,
+        change_only: bool = False,
+        tolerance: float = 0.0,
+        keyframe: int = 10,
+        pool_size: int = 0,
+        pool_guard: bool = False,
     ):
         # Store parameters as properties in baseclass
         # IMPORTANT! Do not define variables locally you do **not** want to store
@@ -1151,6 +1235,9 @@ class RxOutput(Component):
         # Calculate other parameters based on previously defined attributes.
 
         # Error check the parameters here.
+        assert tolerance >= 0, f'Invalid tolerance "{tolerance}" for output "{name}". Tolerance must be >= 0.'
+        assert keyframe >= 0, f'Invalid keyframe "{keyframe}" for output "{name}". Keyframe must be >= 0.'
+        assert pool_size >= 0, f'Invalid pool_size "{pool_size}" for output "{name}". Pool size must be >= 0.'
 
     def build(self, ns=""):
         params = self.__dict__.copy()
@@ -2,7 +2,6 @@ from __future__ import print_function
 
 # ROS imports
 import rospy
-import rosparam
 from std_msgs.msg import UInt64, String, Bool
 from sensor_msgs.msg import Image
 
@@ -18,13 +17,16 @@ from eagerx.utils.utils import (
     get_attribute_from_module,
     initialize_converter,
     get_param_with_blocking,
+    param_client,
 )
 from eagerx.utils.node_utils import initialize_nodes
+from eagerx.utils import inprocess
 from eagerx.core.nodes import EnvNode
 import eagerx
 
 # OTHER
 from threading import Event
+from typing import List
 
 
 class SupervisorNode(BaseNode):
@@ -36,9 +38,9 @@ class SupervisorNode(BaseNode):
         self.last_image = None
         self._image_event = Event()
         self.render_toggle = False
-        self.pub_get_last_image = rospy.Publisher("%s/env/render/get_last_image" % ns, Bool, queue_size=0, latch=True)
-        self.sub_set_last_image = rospy.Subscriber("%s/env/render/set_last_image" % ns, Image, self._last_image_callback)
-        self.render_toggle_pub = rospy.Publisher("%s/env/render/toggle" % ns, Bool, queue_size=0, latch=True)
+        self.pub_get_last_image = inprocess.publisher("%s/env/render/get_last_image" % ns, Bool, queue_size=0, latch=True)
+        self.sub_set_last_image = inprocess.subscriber("%s/env/render/set_last_image" % ns, Image, self._last_image_callback)
+        self.render_toggle_pub = inprocess.publisher("%s/env/render/toggle" % ns, Bool, queue_size=0, latch=True)
 
         # Initialize nodes
         self.cum_registered = 0
@@ -87,13 +89,15 @@ class SupervisorNode(BaseNode):
         self._image_event.set()
 
     def register_node(self, node: NodeSpec):
+        self.register_nodes([node])
+
+    def register_nodes(self, nodes: List[NodeSpec]):
         # Increase cumulative registered counter. Is send as '/start_reset' message.
-        self.cum_registered += 1
+        self.cum_registered += len(nodes)
 
-        # Initialize node
-        node_name = node.config.name
+        # Initialize nodes at once, so that all nodes of a process group are sent to its host together (i.e. linked via Rx).
         initialize_nodes(
-            node,
+            nodes,
             process.ENVIRONMENT,
             self.ns,
             self.message_broker,
@@ -102,7 +106,8 @@ class SupervisorNode(BaseNode):
             self.launch_nodes,
             rxnode_cls=RxNode,
         )
-        self.subjects["register_node"].on_next(String(self.ns + "/" + node_name))
+        for node in nodes:
+            self.subjects["register_node"].on_next(String(self.ns + "/" + node.config.name))
 
     def register_object(self, object: ObjectSpec, bridge_name: str):
         # Increase cumulative registered counter. Is send as '/start_reset' message.
@@ -110,13 +115,12 @@ class SupervisorNode(BaseNode):
 
         # Check if object name is unique
         obj_name = object.config.name
-        assert (
-            rospy.get_param(self.ns + "/" + obj_name + "/nodes", None) is None
-        ), f'Object name "{self.ns}/{obj_name}" already exists. Object names must be unique.'
+        exists = param_client.exists(self.ns + "/" + obj_name + "/nodes")
+        assert not exists, f'Object name "{self.ns}/{obj_name}" already exists. Object names must be unique.'
 
         # Upload object params to rosparam server
         params, nodes = object.build(ns=self.ns, bridge_id=bridge_name)
-        rosparam.upload_params(self.ns, params)
+        param_client.upload(self.ns, params)
 
         # Set node args
         node_args = dict(
@@ -205,7 +209,7 @@ class Supervisor(object):
 
     def node_initialized(self):
         # Notify env that node is initialized
-        self.init_pub = rospy.Publisher(self.name + "/initialized", UInt64, queue_size=0, latch=True)
+        self.init_pub = inprocess.publisher(self.name + "/initialized", UInt64, queue_size=0, latch=True)
         self.init_pub.publish(UInt64())
 
         if not self.initialized:
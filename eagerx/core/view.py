@@ -1,6 +1,5 @@
 from yaml import dump
-import copy
-from eagerx.utils.utils import is_supported_type
+from eagerx.utils.utils import is_supported_type, copy_params
 from typing import Dict, Any, Optional
 
 supported_types = (str, int, list, float, bool, dict)
@@ -239,7 +238,7 @@ class GraphView(View):
             if isinstance(d, dict):
                 return GraphView(self._graph, new_depth, self._name)
             else:
-                return copy.deepcopy(d)
+                return copy_params(d)  # The view is read-only, so mutable leaves are copied (immutable ones are not).
         else:
             try:
                 d = get_dict(self._graph._state["nodes"], self._depth)
@@ -275,4 +274,4 @@ class GraphView(View):
         return len(get_dict(self._graph._state["nodes"], self._depth))
 
     def to_dict(self):
-        return copy.deepcopy(get_dict(self._graph._state["nodes"], self._depth))
+        return copy_params(get_dict(self._graph._state["nodes"], self._depth))
@@ -13,7 +13,7 @@ from eagerx.core.constants import process
 
 class ButterworthFilter(Node):
     @staticmethod
-    @register.spec("ButterworthFilter", Node)
+    @register.spec("ButterworthFilter", Node, prototype=True)
     def spec(
         spec,
         name: str,
@@ -0,0 +1,124 @@
+import eagerx
+
+# OTHER
+import os
+import json
+import pickle
+import hashlib
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Dict, Optional
+
+
+def cache_dir() -> str:
+    """Directory in which the compiled environments are stored (set with *EAGERX_CACHE_DIR*)."""
+    return os.environ.get("EAGERX_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "eagerx"))
+
+
+class _Artifact(object):
+    __slots__ = ["path", "entries", "dirty"]
+
+    def __init__(self, path: str, entries: Dict[str, bytes]):
+        self.path = path
+        #: Pickled build results.
+        self.entries = entries
+        self.dirty = False
+
+
+# Artifacts of the environments that are being compiled, per namespace.
+_artifacts: Dict[str, _Artifact] = dict()
+
+
+def key(*params: Any) -> str:
+    """Content hash of *params* (e.g. the graph state and bridge params) and the eagerx version."""
+    dump = json.dumps([eagerx.__version__] + list(params), sort_keys=True, default=str)
+    return hashlib.sha256(dump.encode()).hexdigest()
+
+
+def begin(ns: str, *params: Any) -> None:
+    """Starts compiling the environment with namespace *ns*.
+
+    Build results are recorded until :func:`~eagerx.utils.build_cache.end` is called. If an artifact with the same
+    :func:`~eagerx.utils.build_cache.key` exists, its results are loaded instead of building the specs again.
+
+    .. note:: The cache is disabled by default, because changes to the python implementation of an entity (e.g. its
+              spec or bridge implementation) are not part of the key. Set *EAGERX_CACHE=1* to enable it.
+
+    :param ns: Namespace of the environment.
+    :param params: Everything the compiled environment depends on.
+    """
+    if not bool(eval(os.environ.get("EAGERX_CACHE", "0"))):
+        return
+    path = os.path.join(cache_dir(), key(ns, *params) + ".pkl")
+    entries = dict()
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                entries = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass  # A corrupted artifact is rebuilt.
+    _artifacts[ns] = _Artifact(path, entries)
+
+
+def end(ns: str, save: bool = True) -> None:
+    """Stops compiling the environment with namespace *ns* and stores the artifact if anything was built."""
+    artifact = _artifacts.pop(ns, None)
+    if artifact is None or not artifact.dirty or not save:
+        return
+    os.makedirs(os.path.dirname(artifact.path), exist_ok=True)
+    # Write atomically, so that parallel launches never load a partially written artifact.
+    tmp = f"{artifact.path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(artifact.entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, artifact.path)
+
+
+@contextmanager
+def compiling(ns: str, *params: Any):
+    """Compiles the environment with namespace *ns* within the context (see :func:`~eagerx.utils.build_cache.begin`).
+
+    The artifact is only stored if the context exits without an exception, and is never left active.
+
+    :param ns: Namespace of the environment.
+    :param params: Everything the compiled environment depends on.
+    """
+    begin(ns, *params)
+    try:
+        yield
+    except BaseException:
+        end(ns, save=False)
+        raise
+    end(ns)
+
+
+def get(ns: str, entry: str) -> Optional[Any]:
+    """Returns a copy of the cached result of *entry*, or None if it was not (yet) built."""
+    artifact = _artifacts.get(ns, None)
+    if artifact is None or entry not in artifact.entries:
+        return None
+    return pickle.loads(artifact.entries[entry])
+
+
+def put(ns: str, entry: str, value: Any) -> None:
+    artifact = _artifacts.get(ns, None)
+    if artifact is not None:
+        artifact.entries[entry] = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        artifact.dirty = True
+
+
+def cached(func):
+    """Caches the result of a spec's ``build(ns, ...)`` while the environment with namespace *ns* is compiled."""
+
+    @wraps(func)
+    def wrapper(spec, ns, *args, **kwargs):
+        if ns not in _artifacts:
+            return func(spec, ns, *args, **kwargs)
+        values = list(args) + [kwargs[k] for k in sorted(kwargs)]
+        entry = "/".join([type(spec).__name__, spec._params["config"]["name"]] + [str(v) for v in values])
+        result = get(ns, entry)
+        if result is None:
+            result = func(spec, ns, *args, **kwargs)
+            put(ns, entry, result)
+        return result
+
+    return wrapper
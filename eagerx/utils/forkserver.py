@@ -0,0 +1,247 @@
+"""Forkserver that launches node and bridge processes.
+
+Instead of starting a new interpreter for every :attr:`~eagerx.core.constants.process.NEW_PROCESS` node (which imports
+rospy, numpy, rx and eagerx again), a zygote process that already imported eagerx and the modules of the registered
+entities forks a new process per node. The zygote is started once (when the first node is launched) and exits together
+with the process that started it.
+"""
+import os
+import sys
+import json
+import signal
+import time
+import socket
+import select
+import runpy
+import atexit
+import tempfile
+import threading
+import importlib
+import traceback
+import subprocess
+from typing import Dict, List, Optional
+
+# Modules that every node process imports.
+PREIMPORT = ["rospy", "numpy", "rx", "eagerx", "eagerx.core.executable_node", "eagerx.core.executable_bridge"]
+
+
+def enabled() -> bool:
+    """Checks if nodes are launched with the forkserver (disable with *EAGERX_FORKSERVER=0*)."""
+    return hasattr(os, "fork") and bool(eval(os.environ.get("EAGERX_FORKSERVER", "1")))
+
+
+class ForkedProcess(object):
+    """Handle of a process that was forked by the zygote. Mimics the parts of :class:`subprocess.Popen` that are used
+    to manage launched nodes.
+
+    The process is a child of the zygote, so the zygote reaps it and sends its exit status over the connection with
+    which the process was launched. Signals are also sent via the zygote, which only delivers them while the process is
+    not reaped (i.e. its pid cannot be reused yet).
+    """
+
+    def __init__(self, conn: socket.socket, args: List[str]):
+        self.args = args
+        self.returncode = None
+        self._conn = conn
+        self._buffer = b""
+        self._lock = threading.Lock()
+        self.pid = self._receive(timeout=None)["pid"]
+
+    def _receive(self, timeout: Optional[float]) -> Optional[dict]:
+        # Returns the next message of the zygote, or None if there is none within timeout.
+        while b"\n" not in self._buffer:
+            if not select.select([self._conn], [], [], timeout)[0]:
+                return None
+            data = self._conn.recv(4096)
+            if not data:
+                # The zygote exited before it could send the exit status, so it is unknown.
+                return dict(returncode=1)
+            self._buffer += data
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def poll(self) -> Optional[int]:
+        with self._lock:
+            if self.returncode is None:
+                reply = self._receive(timeout=0)
+                if reply is not None:
+                    self.returncode = reply["returncode"]
+                    self._conn.close()
+            return self.returncode
+
+    def send_signal(self, sig: int) -> None:
+        if self.poll() is None:
+            try:
+                self._conn.sendall(json.dumps(dict(signal=int(sig))).encode() + b"\n")
+            except OSError:
+                pass
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.send_signal(signal.SIGKILL)
+
+
+class _Zygote(object):
+    def __init__(self, modules: List[str]):
+        self.address = os.path.join(tempfile.mkdtemp(prefix="eagerx_"), "forkserver.sock")
+        cmd = [sys.executable, "-m", "eagerx.utils.forkserver", self.address, str(os.getpid())] + modules
+        self.process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL)
+
+    def fork(self, file: str, args: List[str]) -> ForkedProcess:
+        request = dict(file=file, args=args, env=dict(os.environ), cwd=os.getcwd())
+        # The connection is kept open to receive the exit status of the process.
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._connect(conn)
+        conn.sendall(json.dumps(request).encode() + b"\n")
+        return ForkedProcess(conn, [file] + args)
+
+    def _connect(self, conn: socket.socket, timeout: float = 60.0) -> None:
+        # The zygote only listens after it imported everything.
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                conn.connect(self.address)
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                assert self.process.poll() is None, f"The forkserver exited with code {self.process.returncode}."
+                assert time.monotonic() < deadline, f"The forkserver did not start within {timeout} seconds."
+                time.sleep(0.01)
+
+    def shutdown(self) -> None:
+        if self.process.poll() is None:
+            self.process.terminate()
+            self.process.wait()
+        try:
+            os.unlink(self.address)
+            os.rmdir(os.path.dirname(self.address))
+        except OSError:
+            pass
+
+
+_zygote: Optional[_Zygote] = None
+
+
+def _registered_modules() -> List[str]:
+    from eagerx.core.register import REGISTRY
+
+    # Registered classes are stored as "<module>/<qualname>".
+    modules = {entry["cls"].split("/")[0] for entities in REGISTRY.values() for entry in entities.values()}
+    return sorted(m for m in modules if m != "__main__")
+
+
+def launch(file: str, args: List[str]) -> ForkedProcess:
+    """Launches the python script *file* with command line arguments *args* in a process that is forked by the zygote.
+
+    :param file: Path to the script (e.g. :mod:`eagerx.core.executable_node`) that is run as ``__main__``.
+    :param args: The command line arguments (e.g. namespace, node name and object name).
+    :returns: A handle to the process.
+    """
+    global _zygote
+    if _zygote is None or _zygote.process.poll() is not None:
+        _zygote = _Zygote(_registered_modules())
+        atexit.register(_zygote.shutdown)
+    return _zygote.fork(file, args)
+
+
+def _child(sockets: List[socket.socket], request: dict) -> None:
+    # Runs in the forked process: restore the state of a fresh interpreter before running the script.
+    try:
+        [sock.close() for sock in sockets]
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.chdir(request["cwd"])
+        sys.argv = [request["file"]] + request["args"]
+        sys.path[0] = os.path.dirname(os.path.abspath(request["file"]))
+        runpy.run_path(request["file"], run_name="__main__")
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 0
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    os._exit(code)
+
+
+def _returncode(status: int) -> int:
+    # Same convention as subprocess.Popen.returncode: a negative value -N means that the process was killed by signal N.
+    return -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+
+
+def _reap(children: Dict[int, Optional[socket.socket]]) -> None:
+    # Sends the exit status of all exited processes to the process that launched them.
+    while len(children) > 0:
+        pid, status = os.waitpid(-1, os.WNOHANG)
+        if pid == 0:
+            return
+        conn = children.pop(pid, None)
+        if conn is not None:
+            try:
+                conn.sendall(json.dumps(dict(returncode=_returncode(status))).encode() + b"\n")
+            except OSError:
+                pass
+            conn.close()
+
+
+def _signal(pid: int, conn: socket.socket) -> bool:
+    # Delivers the signals that were requested via the connection of the process. Returns False if it was closed.
+    data = conn.recv(4096)
+    for line in data.splitlines():
+        os.kill(pid, json.loads(line)["signal"])
+    return len(data) > 0
+
+
+def _serve(address: str, parent: int, modules: List[str]) -> None:
+    for module in PREIMPORT + modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            print(f"[forkserver] Cannot preimport '{module}': {e}", file=sys.stderr)
+
+    # Wake up when a forked process exits, so that its exit status is sent immediately.
+    wakeup, wakeup_w = socket.socketpair()
+    wakeup.setblocking(False)
+    wakeup_w.setblocking(False)
+    signal.set_wakeup_fd(wakeup_w.fileno())
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+    # Forked processes that are not reaped yet, with the connection that launched them.
+    children: Dict[int, Optional[socket.socket]] = dict()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(address)
+        listener.listen()
+        while os.getppid() == parent:
+            conns = {conn: pid for pid, conn in children.items() if conn is not None}
+            ready, _, _ = select.select([listener, wakeup] + list(conns), [], [], 1.0)
+            for sock in ready:
+                if sock is wakeup:
+                    try:
+                        while wakeup.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                elif sock is listener:
+                    conn, _ = listener.accept()
+                    with conn.makefile("r") as f:
+                        request = json.loads(f.readline())
+                    pid = os.fork()
+                    if pid == 0:
+                        _child([listener, wakeup, wakeup_w, conn] + list(conns), request)
+                    conn.sendall(json.dumps(dict(pid=pid)).encode() + b"\n")
+                    children[pid] = conn
+                elif not _signal(conns[sock], sock):
+                    # The handle of the process was closed, but the process must still be reaped.
+                    sock.close()
+                    children[conns[sock]] = None
+            _reap(children)
+
+
+if __name__ == "__main__":
+    _serve(sys.argv[1], int(sys.argv[2]), sys.argv[3:])
@@ -0,0 +1,197 @@
+# ROS SPECIFIC
+import rospy
+
+# OTHER
+from threading import RLock
+from typing import Any, Callable, Dict, List, Optional, Set
+
+# Root namespaces (e.g. "/rx") of the environments that run in-process (i.e. without a roscore), and their reference count.
+_local_ns: Dict[str, int] = dict()
+_lock = RLock()
+
+
+def _root(name: str) -> str:
+    keys = [k for k in name.split("/") if len(k) > 0]
+    return "/" + keys[0] if len(keys) > 0 else "/"
+
+
+def enable(ns: str) -> None:
+    """Runs all topics, services and parameters under namespace *ns* in-process, i.e. without a roscore."""
+    ns = _root(ns)
+    _local_ns[ns] = _local_ns.get(ns, 0) + 1
+
+
+def disable(ns: str) -> None:
+    ns = _root(ns)
+    if ns not in _local_ns:
+        return
+    _local_ns[ns] -= 1
+    if _local_ns[ns] > 0:  # E.g. a previous environment with the same name that is shut down by a new environment.
+        return
+    _local_ns.pop(ns)
+    with _lock:
+        for name in [n for n in _topics if _root(n) == ns]:
+            _topics.pop(name)
+        for name in [n for n in _services if _root(n) == ns]:
+            _services.pop(name)
+
+
+def is_local(name: str) -> bool:
+    """Checks if *name* (a topic, service or parameter) lives in the namespace of an in-process environment."""
+    return len(_local_ns) > 0 and _root(name) in _local_ns
+
+
+class _Topic(object):
+    __slots__ = ["subscribers", "num_publishers", "latched"]
+
+    def __init__(self):
+        self.subscribers: List["Subscriber"] = []
+        self.num_publishers = 0
+        # Last message of every latched publisher
+        self.latched: Dict["Publisher", Any] = dict()
+
+
+_topics: Dict[str, _Topic] = dict()
+_services: Dict[str, Callable] = dict()
+
+
+def _get_topic(name: str) -> _Topic:
+    topic = _topics.get(name, None)
+    if topic is None:
+        topic = _topics[name] = _Topic()
+    return topic
+
+
+class Publisher(object):
+    """In-process replacement of :class:`rospy.Publisher`.
+
+    Messages are passed by reference to the callbacks of all subscribers, in the thread that calls
+    :func:`~eagerx.utils.inprocess.Publisher.publish`. Latched messages are replayed to new subscribers.
+    """
+
+    def __init__(self, name: str, data_class: Any, queue_size: Optional[int] = None, latch: bool = False):
+        self.name = name
+        self.data_class = data_class
+        self.latch = latch
+        self.caller_id = rospy.get_name()
+        with _lock:
+            self._topic = _get_topic(name)
+            self._topic.num_publishers += 1
+        self._registered = True
+
+    def publish(self, msg: Any) -> None:
+        topic = self._topic
+        if self.latch:
+            # Identifies the publisher (i.e. the owner of the message broker) like ROS does.
+            try:
+                msg._connection_header = {"callerid": self.caller_id}
+            except AttributeError:
+                pass
+            topic.latched[self] = msg
+        for sub in list(topic.subscribers):
+            sub._deliver(msg)
+
+    def get_num_connections(self) -> int:
+        return len(self._topic.subscribers)
+
+    def unregister(self) -> None:
+        if self._registered:
+            self._registered = False
+            with _lock:
+                self._topic.num_publishers -= 1
+                self._topic.latched.pop(self, None)
+
+
+class Subscriber(object):
+    """In-process replacement of :class:`rospy.Subscriber`."""
+
+    def __init__(self, name: str, data_class: Any, callback: Callable = None, callback_args: Any = None, **kwargs):
+        self.name = name
+        self.data_class = data_class
+        self.callback = callback
+        self.callback_args = callback_args
+        self.caller_id = rospy.get_name()
+        with _lock:
+            self._topic = _get_topic(name)
+            self._topic.subscribers.append(self)
+            latched = list(self._topic.latched.values())
+        for msg in latched:
+            self._deliver(msg)
+
+    def _deliver(self, msg: Any) -> None:
+        if self.callback_args is None:
+            self.callback(msg)
+        else:
+            self.callback(msg, self.callback_args)
+
+    def get_num_connections(self) -> int:
+        return self._topic.num_publishers
+
+    def unregister(self) -> None:
+        with _lock:
+            if self in self._topic.subscribers:
+                self._topic.subscribers.remove(self)
+
+
+class Service(object):
+    """In-process replacement of :class:`rospy.Service`."""
+
+    def __init__(self, name: str, service_class: Any, handler: Callable):
+        self.resolved_name = name
+        self.service_class = service_class
+        with _lock:
+            _services[name] = handler
+
+    def shutdown(self, reason: str = "") -> None:
+        with _lock:
+            _services.pop(self.resolved_name, None)
+
+
+class ServiceProxy(object):
+    """In-process replacement of :class:`rospy.ServiceProxy`. Calls the handler of the service directly."""
+
+    def __init__(self, name: str, service_class: Any):
+        self.resolved_name = name
+        self.service_class = service_class
+
+    def wait_for_service(self, timeout: float = None) -> None:
+        if self.resolved_name not in _services:
+            raise rospy.ROSException(f"Service '{self.resolved_name}' does not exist.")
+
+    def __call__(self, req: Any) -> Any:
+        self.wait_for_service()
+        return _services[self.resolved_name](req)
+
+
+def connections(pub: Any) -> Set[str]:
+    """Returns the caller ids of the subscribers that are connected to publisher *pub*."""
+    if isinstance(pub, Publisher):
+        return {sub.caller_id for sub in list(pub._topic.subscribers)}
+    return {c.endpoint_id for c in list(pub.impl.connections)}
+
+
+def get_service_list(namespace: str) -> List[str]:
+    """Lists the in-process services under *namespace*, or all services on the roscore otherwise."""
+    if is_local(namespace):
+        return [name for name in _services if _root(name) == _root(namespace)]
+    import rosservice
+
+    return rosservice.get_service_list(namespace=namespace)
+
+
+def publisher(name: str, *args, **kwargs):
+    """Creates an in-process :class:`~eagerx.utils.inprocess.Publisher` if *name* is local, else a rospy one."""
+    return (Publisher if is_local(name) else rospy.Publisher)(name, *args, **kwargs)
+
+
+def subscriber(name: str, *args, **kwargs):
+    """Creates an in-process :class:`~eagerx.utils.inprocess.Subscriber` if *name* is local, else a rospy one."""
+    return (Subscriber if is_local(name) else rospy.Subscriber)(name, *args, **kwargs)
+
+
+def service(name: str, *args, **kwargs):
+    return (Service if is_local(name) else rospy.Service)(name, *args, **kwargs)
+
+
+def service_proxy(name: str, *args, **kwargs):
+    return (ServiceProxy if is_local(name) else rospy.ServiceProxy)(name, *args, **kwargs)
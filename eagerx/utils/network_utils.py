@@ -1,6 +1,3 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.lines import Line2D
 import networkx as nx
 
 
@@ -28,34 +25,138 @@ def episode_graph(G):
         if data["skip"]:
             H.remove_edge(u, v, key=key)
 
-    # Color cyclic edges red
+    # Color cyclic edges red. Every strongly connected component with more than one node (or a self-loop) contains a
+    # cycle. This is linear in the number of edges, whereas enumerating all simple cycles is exponential.
     cycles = []
-    C = list(nx.simple_cycles(H))
-    for c in C:
+    for c in nx.strongly_connected_components(H):
+        n = next(iter(c))
+        if len(c) == 1 and not H.has_edge(n, n):
+            continue
         H_sub = H.subgraph(c)
         for u, v, key, data in H_sub.edges(data=True, keys=True):
             G[u][v][key]["color"] = "red"
             data["color"] = "red"
 
-        # Get all simple cyclic edge paths
-        out_nodes = []
-        for _u, v, _key, data in H_sub.out_edges(c[0], data=True, keys=True):
-            out_nodes.append((v, data))
-
-        for n, data_first in out_nodes:
-            paths = nx.all_simple_edge_paths(H_sub, n, c[0])
-            first_edge = (data_first["source"], data_first["target"])
-            for path in paths:
-                edges = [first_edge]
-                for edge in path:
-                    data = H_sub.get_edge_data(*edge)
-                    edge = (data["source"], data["target"])
-                    edges.append(edge)
-                cycles.append(edges)
+        # Report one cyclic edge path per component
+        edges = []
+        for u, v, key in nx.find_cycle(H_sub, source=n):
+            data = H_sub.get_edge_data(u, v, key)
+            edges.append((data["source"], data["target"]))
+        cycles.append(edges)
     return H, cycles
 
 
+class IncrementalDAG(object):
+    """Maintains a topological order of a directed multigraph while edges are added and removed (Pearce & Kelly, 2006).
+
+    Adding an edge only reorders the vertices between its endpoints, so checking a graph that is built edge-by-edge for
+    cycles does not require a full traversal after every edge. Edges that close a cycle are kept aside, and are
+    reinserted once the cycle is broken by the removal of another edge.
+    """
+
+    def __init__(self):
+        self._ord = dict()
+        self._succ = dict()
+        self._pred = dict()
+        self._cyclic = dict()
+        self._next = 0
+
+    def _add_vertex(self, n):
+        if n not in self._ord:
+            self._ord[n] = self._next
+            self._succ[n] = dict()
+            self._pred[n] = dict()
+            self._next += 1
+
+    def _search(self, start, adjacent, inside, stop=None):
+        visited = {start: None}
+        stack = [start]
+        while len(stack) > 0:
+            n = stack.pop()
+            for m in adjacent[n]:
+                if m in visited or not inside(self._ord[m]):
+                    continue
+                visited[m] = n
+                if m == stop:
+                    return visited, True
+                stack.append(m)
+        return visited, False
+
+    def _path(self, parents, target):
+        path = [target]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        return path[::-1]
+
+    def add_edge(self, u, v) -> list:
+        """Adds edge *u* --> *v*.
+
+        :param u: Source vertex.
+        :param v: Target vertex.
+        :return: The cycle that is closed by the edge as a list of vertices ``[u, v, ..., u]``, or an empty list.
+        """
+        self._add_vertex(u)
+        self._add_vertex(v)
+        if v in self._succ[u]:
+            self._succ[u][v] += 1
+            self._pred[v][u] += 1
+            return []
+        lb, ub = self._ord[v], self._ord[u]
+        if u == v or lb < ub:
+            # Only vertices with an order in [lb, ub] can be affected by the new edge.
+            forward, closed = self._search(v, self._succ, lambda o: o <= ub, stop=u)
+            if u == v or closed:
+                self._cyclic[(u, v)] = self._cyclic.get((u, v), 0) + 1
+                return [u] + (self._path(forward, u) if u != v else [u])
+            backward, _ = self._search(u, self._pred, lambda o: o >= lb)
+            backward = sorted(backward, key=self._ord.get)
+            forward = sorted(forward, key=self._ord.get)
+            positions = sorted(self._ord[n] for n in backward + forward)
+            for n, o in zip(backward + forward, positions):
+                self._ord[n] = o
+        self._succ[u][v] = 1
+        self._pred[v][u] = 1
+        return []
+
+    def remove_edge(self, u, v) -> None:
+        """Removes (one instance of) edge *u* --> *v*.
+
+        :param u: Source vertex.
+        :param v: Target vertex.
+        """
+        if (u, v) in self._cyclic:
+            self._cyclic[(u, v)] -= 1
+            if self._cyclic[(u, v)] == 0:
+                self._cyclic.pop((u, v))
+            return
+        self._succ[u][v] -= 1
+        self._pred[v][u] -= 1
+        if self._succ[u][v] > 0:
+            return
+        self._succ[u].pop(v)
+        self._pred[v].pop(u)
+        # Removing an edge may have broken cycles, so try to reinsert the edges that closed them.
+        cyclic, self._cyclic = self._cyclic, dict()
+        for (a, b), count in cyclic.items():
+            for _ in range(count):
+                self.add_edge(a, b)
+
+    def find_cycle(self) -> list:
+        """Returns a cycle as a list of vertices ``[u, v, ..., u]``, or an empty list if the graph is acyclic."""
+        for u, v in self._cyclic:
+            if u == v:
+                return [u, u]
+            forward, _ = self._search(v, self._succ, lambda o: True, stop=u)
+            return [u] + self._path(forward, u)
+        return []
+
+
 def plot_graph(G, ax=None, k=2, pos=None):
+    # Matplotlib is only imported when plotting, as it is slow to import.
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as mpatches
+    from matplotlib.lines import Line2D
+
     if ax is None:
         env, ax = plt.subplots(nrows=1, ncols=1)
 
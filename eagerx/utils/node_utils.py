@@ -1,13 +1,14 @@
 # ROS SPECIFIC
 import rospy
-import rosparam
-from std_msgs.msg import UInt64
+from std_msgs.msg import UInt64, String
 
 # RxEAGER
-from eagerx.utils.utils import substitute_args
+from eagerx.utils.utils import substitute_args, param_client
+from eagerx.utils import inprocess, forkserver
 from eagerx.core.constants import process, log, log_levels_ROS
 
 # OTHER
+import json
 import atexit
 import importlib
 import subprocess
@@ -17,8 +18,9 @@ from functools import partial, wraps
 
 
 @wraps(rospy.init_node)
-def initialize(*args, log_level=log.INFO, **kwargs):
-    roscore = launch_roscore()  # First launch roscore (if not already running)
+def initialize(*args, log_level=log.INFO, roscore: bool = True, **kwargs):
+    # Environments that run in-process (see EAGERX_LOCAL) do not need a roscore, so it can be skipped with roscore=False.
+    roscore = launch_roscore() if roscore else None  # First launch roscore (if not already running)
     try:
         rospy.init_node(*args, log_level=log_levels_ROS[log_level], **kwargs)
     except rospy.exceptions.ROSException as e:
@@ -62,10 +64,35 @@ def launch_node_as_subprocess(executable: str, ns: str, name: str, object_name:
     if "python" in node_type:
         if ".py" not in file:
             file = importlib.import_module(file).__file__
+        if forkserver.enabled():
+            return forkserver.launch(file, [ns, name, object_name])
     p = subprocess.Popen([file] + [ns, name, object_name])
     return p
 
 
+# Publishers that send nodes to the hosts of the process groups, structured as _group_hosts[address] = publisher
+_group_hosts: Dict[str, Any] = dict()
+
+
+def launch_group(ns: str, group: str, launch_nodes: Dict) -> Any:
+    """Launches the host of a process group (if not already launched) and returns the publisher to register nodes."""
+    name = "groups/" + group[len(process.GROUP) :]
+    address = f"{ns}/{name}"
+    if address not in launch_nodes:
+        old = _group_hosts.pop(address, None)
+        if old is not None:  # Host of a previous environment with the same name.
+            old.unregister()
+        launch_nodes[address] = launch_node_as_subprocess("python:=eagerx.core.executable_group", ns, name, "")
+        _group_hosts[address] = inprocess.publisher(address + "/register", String, queue_size=10)
+    pub = _group_hosts[address]
+
+    # Wait until the host subscribed, because messages are not latched.
+    while pub.get_num_connections() == 0:
+        assert launch_nodes[address].poll() is None, f'The host of process group "{address}" exited.'
+        sleep(0.01)
+    return pub
+
+
 def initialize_nodes(
     nodes: Union[Union[Any, Dict], List[Union[Any, Dict]]],
     process_id: int,
@@ -88,25 +115,32 @@ def initialize_nodes(
     if isinstance(nodes, (BaseNodeSpec, dict)):
         nodes = [nodes]
 
+    # Build the params of all nodes that were not yet uploaded to the rosparam server (env)
+    node_params = []
+    built = []
     for node in nodes:
-        # Check if we still need to upload params to rosparam server (env)
         if not isinstance(node, dict):
             params = node.build(ns=ns)
 
             # Check if node name is unique
             name = node.config.name
-            assert (
-                rospy.get_param(("%s/%s/rate") % (ns, name), None) is None
-            ), 'Node name "%s" already exists. Node names must be unique.' % (ns + "/" + name)
-
-            # Upload params to rosparam server
-            rosparam.upload_params(ns, params)
+            exists = param_client.exists(("%s/%s/rate") % (ns, name)) or name in [n for n, _ in built]
+            assert not exists, 'Node name "%s" already exists. Node names must be unique.' % (ns + "/" + name)
+            node_params.append(params)
 
             # Make params consistent when directly grabbing params from rosparam server
             params = params[name]
         else:
             params = node
             name = params["name"]
+        built.append((name, params))
+
+    # Upload params of all nodes to rosparam server at once
+    if len(node_params) > 0:
+        param_client.upload(ns, *node_params)
+
+    groups = dict()
+    for name, params in built:
         # Flag to check if node is initialized
         is_initialized[name] = False
 
@@ -120,7 +154,7 @@ def initialize_nodes(
         def initialized(msg, name):
             is_initialized[name] = True
 
-        sub = rospy.Subscriber(node_address + "/initialized", UInt64, partial(initialized, name=name))
+        sub = inprocess.subscriber(node_address + "/initialized", UInt64, partial(initialized, name=name))
         message_broker.subscribers.append(sub)
 
         # Initialize node
@@ -137,10 +171,16 @@ def initialize_nodes(
                 % name
             )
             launch_nodes[node_address] = launch_node_as_subprocess(params["executable"], ns, name, object_name)
+        elif process.is_group(params["process"]) and process_id == process.ENVIRONMENT:
+            # Nodes of the same group are sent together, so that they are connected via Rx.
+            groups.setdefault(params["process"], []).append(dict(name=name, object_name=object_name))
         elif params["process"] == process.EXTERNAL:
             rospy.loginfo('Node "%s" must be manually launched as the process is specified as process.EXTERNAL' % name)
         # else: node is launched in another (already launched) node's process (e.g. bridge process).
 
+    for group, entries in groups.items():
+        launch_group(ns, group, launch_nodes).publish(String(data=json.dumps(entries)))
+
 
 def wait_for_node_initialization(is_initialized, wait_time=0.3):
     iter = 0
@@ -0,0 +1,76 @@
+# ROS SPECIFIC
+import rospy
+
+# OTHER
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+
+def apply(cpu_affinity: Optional[List[int]] = None, nice: Optional[int] = None, sched_priority: Optional[int] = None) -> Dict:
+    """Applies the cpu affinity, niceness and real-time priority to the calling thread.
+
+    Threads that are created afterwards by the calling thread inherit the settings (on Linux).
+
+    :param cpu_affinity: Cpus the thread may run on.
+    :param nice: Niceness of the thread. Decreasing the niceness (i.e. increasing the priority) requires privileges.
+    :param sched_priority: Priority (1-99) with the real-time SCHED_FIFO policy. Requires privileges.
+    :return: The applied settings. Settings that could not be applied have an explanation as value instead.
+    """
+    applied = dict()
+    if cpu_affinity is not None:
+        applied["cpu_affinity"] = _try(_set_affinity, cpu_affinity)
+    if nice is not None:
+        applied["nice"] = _try(_set_nice, nice)
+    if sched_priority is not None:
+        applied["sched_priority"] = _try(_set_fifo, sched_priority)
+    return applied
+
+
+def _set_affinity(cpu_affinity: List[int]) -> List[int]:
+    os.sched_setaffinity(0, cpu_affinity)
+    return sorted(os.sched_getaffinity(0))
+
+
+def _set_nice(nice: int) -> int:
+    # On Linux, the niceness of PRIO_PROCESS with who=0 only applies to the calling thread.
+    os.setpriority(os.PRIO_PROCESS, 0, nice)
+    return os.getpriority(os.PRIO_PROCESS, 0)
+
+
+def _set_fifo(sched_priority: int) -> int:
+    os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(sched_priority))
+    return os.sched_getparam(0).sched_priority
+
+
+def _try(func: Callable, value: Any) -> Any:
+    try:
+        return func(value)
+    except AttributeError:
+        return "not supported"
+    except PermissionError:
+        return "not permitted"
+    except OSError as e:
+        return f"failed ({e})"
+
+
+def thread_factory(node: Any) -> Optional[Callable[[Callable], threading.Thread]]:
+    """Returns a thread factory for the scheduler of *node* that applies its scheduling settings when the thread starts.
+
+    The applied settings are logged and stored in *node.scheduling* under key "scheduler".
+
+    :param node: A node or bridge (see :class:`~eagerx.core.entities.BaseNode`).
+    """
+    settings = dict(cpu_affinity=node.cpu_affinity, nice=node.nice, sched_priority=node.sched_priority)
+    if all(v is None for v in settings.values()):
+        return None  # I.e. the default thread factory of the scheduler.
+
+    def factory(target: Callable) -> threading.Thread:
+        def run():
+            node.scheduling["scheduler"] = apply(**settings)
+            rospy.loginfo(f'[{node.ns_name}] Scheduler thread started with {node.scheduling["scheduler"]}.')
+            target()
+
+        return threading.Thread(target=run, daemon=True)
+
+    return factory
@@ -8,11 +8,17 @@ from typing import List, NamedTuple, Any, Optional, Dict, Union, Tuple
 import time
 import importlib
 import inspect
-from functools import wraps
+from functools import wraps, lru_cache
 from time import sleep
 import copy
 import ast
 import json
+import sys
+import xmlrpc.client
+from collections import deque
+
+# EAGERX
+from eagerx.utils import inprocess
 
 
 def dict_null(items):
@@ -42,11 +48,23 @@ def replace_None(d, to_null=True):
     return json.loads(dict_str, object_pairs_hook=object_pairs_hook)
 
 
+# Process-wide cache of resolved attributes, structured as _ATTRIBUTES["module/attribute"] = attribute.
+_ATTRIBUTES: Dict[str, Any] = dict()
+# Process-wide cache of shared converter instances, structured as _CONVERTERS[json.dumps(args)] = converter.
+_CONVERTERS: Dict[str, Any] = dict()
+
+
 def get_attribute_from_module(attribute, module=None):
+    key = attribute if module is None else f"{module}/{attribute}"
+    try:
+        return _ATTRIBUTES[key]
+    except KeyError:
+        pass
     if module is None:
         module, attribute = attribute.split("/")
     module = importlib.import_module(module)
     attribute = getattr(module, attribute)
+    _ATTRIBUTES[key] = attribute
     return attribute
 
 
@@ -55,10 +73,26 @@ def load(mod_attr: str):
 
 
 def initialize_converter(args):
-    converter_args = copy.deepcopy(args)
-    converter_args.pop("converter_type")
     converter_cls = get_attribute_from_module(args["converter_type"])
-    return converter_cls(**converter_args)
+    key = None
+    if getattr(converter_cls, "SHARED", False):
+        try:
+            key = json.dumps(args, sort_keys=True)
+        except (TypeError, ValueError):
+            pass
+        if key in _CONVERTERS:
+            return _CONVERTERS[key]
+    converter_args = copy_params(args)
+    converter_args.pop("converter_type")
+    converter = converter_cls(**converter_args)
+    if key is not None:
+        _CONVERTERS[key] = converter
+    return converter
+
+
+def clear_converters():
+    """Releases the shared converter instances, so that they are re-initialized when used again."""
+    _CONVERTERS.clear()
 
 
 def initialize_state(args):
@@ -102,13 +136,176 @@ def get_cls_from_string(cls_string):
 
 
 def get_param_with_blocking(name, timeout=5):
+    return param_client.get(name, timeout=timeout)
+
+
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def copy_params(params):
+    """Deep copies params, which is much faster than copy.deepcopy for dicts, lists and primitives."""
+    t = type(params)
+    if t is dict:
+        return {k: copy_params(v) for k, v in params.items()}
+    elif t is list:
+        return [copy_params(v) for v in params]
+    elif t in _IMMUTABLE_TYPES:
+        return params
+    return copy.deepcopy(params)
+
+
+def _flatten_params(ns, params, flat):
+    # Same semantics as rosparam.upload_params: dicts update (rather than replace) the existing params.
+    if isinstance(params, dict):
+        for k, v in params.items():
+            _flatten_params(f"{ns}/{k}", v, flat)
+    else:
+        flat.append((ns, params))
+    return flat
+
+
+class ParamClient(object):
+    """Caches the parameters of a namespace (e.g. ``/rx``), so that they are fetched from the parameter server at once.
+
+    All uploads via :func:`~eagerx.utils.utils.ParamClient.upload` are batched into a single (multi)call and bump the
+    version key ``<ns>/param_version``. Other processes compare it with the version of their cache
+    in :func:`~eagerx.utils.utils.ParamClient.sync`, which is done once per reset.
+
+    The parameters of in-process namespaces (see :func:`~eagerx.utils.inprocess.enable`) are only stored in memory.
+    """
+
+    VERSION_KEY = "param_version"
+
+    def __init__(self):
+        self._cache = dict()
+        self._versions = dict()
+        # In-memory parameter store of the in-process namespaces
+        self._local = dict()
+
+    @staticmethod
+    def _split(name: str) -> Tuple[str, List[str]]:
+        keys = [k for k in name.split("/") if len(k) > 0]
+        return "/" + keys[0], keys[1:]
+
+    def _lookup(self, name: str) -> Tuple[bool, Any]:
+        ns, keys = self._split(name)
+        params = self._local.get(ns, None) if inprocess.is_local(ns) else self._cache.get(ns, None)
+        if params is None:
+            return False, None
+        for k in keys:
+            if not isinstance(params, dict) or k not in params:
+                return False, None
+            params = params[k]
+        return True, params
+
+    def fetch(self, ns: str) -> None:
+        """Fetches (and caches) all parameters under namespace *ns* with a single call."""
+        ns, _ = self._split(ns)
+        if inprocess.is_local(ns):
+            return
+        try:
+            params = rospy.get_param(ns)
+        except (rosgraph.masterapi.Error, KeyError):
+            params = None
+        if isinstance(params, dict):
+            self._cache[ns] = replace_None(params, to_null=False)
+            self._versions[ns] = params.get(self.VERSION_KEY, None)
+        else:
+            self.invalidate(ns)
+
+    def invalidate(self, ns: str) -> None:
+        ns, _ = self._split(ns)
+        self._cache.pop(ns, None)
+        self._versions.pop(ns, None)
+
+    def sync(self, ns: str) -> None:
+        """Invalidates the cache of namespace *ns* if the version on the parameter server changed."""
+        ns, _ = self._split(ns)
+        if inprocess.is_local(ns) or ns not in self._cache:
+            return
+        if rospy.get_param(f"{ns}/{self.VERSION_KEY}", None) != self._versions[ns]:
+            self.invalidate(ns)
+
+    def get(self, name: str, default: Any = KeyError, timeout: float = 5) -> Any:
+        """Gets a parameter from the cache, or fetches its namespace if it was not cached yet.
+
+        :param name: Absolute parameter name.
+        :param default: Returned (without blocking) if the parameter does not exist.
+        :param timeout: Maximum time (seconds) to wait for the parameter to be uploaded, if no default is provided.
+        :return: A copy of the parameter.
+        """
+        local = inprocess.is_local(name)
+        found, params = self._lookup(name)
+        if not local and not found and (default is KeyError or self._split(name)[0] not in self._cache):
+            self.fetch(name)
+            found, params = self._lookup(name)
+        if not found and default is KeyError:
+            # Poll the single parameter (cheap), and refetch the namespace once it was uploaded.
+            if local:
+                get_param = lambda: self._lookup(name)[1] if self._lookup(name)[0] else None  # noqa: E731
+            else:
+                get_param = lambda: rospy.get_param(name)  # noqa: E731
+            if _poll(get_param, name, timeout) is not None:
+                self.fetch(name)
+                found, params = self._lookup(name)
+        if not found:
+            return None if default is KeyError else default
+        return copy_params(params)
+
+    def upload(self, ns: str, *params: Dict) -> None:
+        """Uploads one or more *params* under namespace *ns* in a single (multi)call, and bumps the namespace version."""
+        root, _ = self._split(ns)
+        flat = []
+        for p in params:
+            _flatten_params(ns.rstrip("/"), p, flat)
+        if inprocess.is_local(root):
+            for key, value in flat:
+                _, keys = self._split(key)
+                d = self._local.setdefault(root, dict())
+                for k in keys[:-1]:
+                    d = d.setdefault(k, dict())
+                d[keys[-1]] = None if value == "null" else replace_None(value, to_null=False)
+            return
+        flat.append((f"{root}/{self.VERSION_KEY}", str(time.time())))
+        caller_id = rospy.get_name()
+        multicall = xmlrpc.client.MultiCall(rosgraph.Master(caller_id).handle)
+        for key, value in flat:
+            multicall.setParam(caller_id, key, value)
+        for code, msg, _ in multicall():
+            if code != 1:
+                raise rosgraph.masterapi.Error(msg)
+        self.invalidate(root)
+
+    def exists(self, name: str) -> bool:
+        """Checks if a parameter exists on the parameter server (i.e. bypasses the cache)."""
+        if inprocess.is_local(name):
+            return self._lookup(name)[0]
+        return rospy.get_param(name, None) is not None
+
+    def delete(self, ns: str) -> None:
+        if inprocess.is_local(ns):
+            root, keys = self._split(ns)
+            if len(keys) == 0:
+                self._local.pop(root, None)
+            else:
+                d = self._local.get(root, dict())
+                for k in keys[:-1]:
+                    d = d.get(k, dict())
+                d.pop(keys[-1], None)
+            return
+        try:
+            rosgraph.Master(rospy.get_name()).deleteParam(ns)
+        finally:
+            self.invalidate(ns)
+
+
+def _poll(get_param, name, timeout):
     params = None
     start = time.time()
     it = 0
     while params is None:
-
         try:
-            params = rospy.get_param(name)
+            params = get_param()
         except (rosgraph.masterapi.Error, KeyError):
             sleep_time = 0.01
             if it % 20 == 0:
@@ -121,8 +318,11 @@ def get_param_with_blocking(name, timeout=5):
         if time.time() - start > timeout:
             break
         it += 1
+    return params
+
 
-    return replace_None(params, to_null=False)
+#: Parameter client that is shared by all nodes in this process.
+param_client = ParamClient()
 
 
 def substitute_args(
@@ -143,21 +343,34 @@ def substitute_args(
         param = resolve_args(param, context, only=only)
         return param
 
+    # The context does not change while substituting, so the results of strings that repeat can be reused.
+    return _substitute(param, context, only, memo=dict())
+
+
+def _substitute(param: Union[Dict, List], context: Optional[Dict], only: Optional[List[str]], memo: Dict):
     # For every key in the dictionary (not performing copy.deepcopy!)
     if isinstance(param, dict):
-        for key in param:
-            # If the value is of type `(Ordered)dict`, then recurse with the value
-            if isinstance(param[key], (dict, list)):
-                substitute_args(param[key], context, only=only)
-            # Otherwise, add the element to the result
-            elif isinstance(param[key], str):
-                param[key] = resolve_args(param[key], context, only=only)
+        items = param.items()
     elif isinstance(param, list):
-        for idx, i in enumerate(param):
-            if isinstance(i, (dict, list)):
-                substitute_args(i, context, only=only)
-            elif isinstance(i, str):
-                param[idx] = resolve_args(i, context, only=only)
+        items = enumerate(param)
+    else:
+        return param
+    for key, value in list(items):
+        # If the value is of type `(Ordered)dict`, then recurse with the value
+        if isinstance(value, (dict, list)):
+            _substitute(value, context, only, memo)
+        # Otherwise, add the element to the result. Strings without substitution args are skipped.
+        elif isinstance(value, str) and "$(" in value:
+            if value in memo:
+                param[key] = memo[value]
+                continue
+            resolved = resolve_args(value, context, only=only)
+            # Only results that are independent of the environment and file system (and immutable) are reused.
+            # Partially resolved results can change, as the context may refer to params that are being substituted.
+            if _is_pure(value) and isinstance(resolved, (str, int, float, bool, type(None))):
+                if not isinstance(resolved, str) or "$(" not in resolved:
+                    memo[value] = resolved
+            param[key] = resolved
     return param
 
 
@@ -188,57 +401,77 @@ def resolve_args(arg_str, context=None, resolve_anon=True, filename=None, only=N
         context = {}
     if not arg_str:
         return arg_str
+    # Most strings do not contain any substitution args
+    if isinstance(arg_str, str) and "$(" not in arg_str:
+        return arg_str
     # special handling of $(eval ...)
     if arg_str.startswith("$(eval ") and arg_str.endswith(")"):
         return roslaunch.substitution_args._eval(arg_str[7:-1], context)
     # first resolve variables like 'env' and 'arg'
-    commands = {
-        "env": roslaunch.substitution_args._env,
-        "optenv": roslaunch.substitution_args._optenv,
-        "dirname": roslaunch.substitution_args._dirname,
-        "anon": roslaunch.substitution_args._anon,
-        "arg": roslaunch.substitution_args._arg,
-        "ns": _ns,
-        "config": _config,
-    }
-    if only is not None:
-        exec_commands = {}
-        for c in only:
-            if c in commands:
-                exec_commands[c] = commands[c]
-    else:
-        exec_commands = commands
-    resolved = _resolve_args(arg_str, context, resolve_anon, exec_commands)
+    only = tuple(only) if only is not None else None
+    resolved = _resolve_args(arg_str, context, resolve_anon, _select_commands(only))
     # then resolve 'find' as it requires the subsequent path to be expanded already
-    commands = {
-        "find": roslaunch.substitution_args._find,
-    }
-    if only is not None:
-        exec_commands = {}
-        for c in only:
-            if c in commands:
-                exec_commands[c] = commands[c]
-    else:
-        exec_commands = commands
-    resolved = _resolve_args(resolved, context, resolve_anon, exec_commands)
+    resolved = _resolve_args(resolved, context, resolve_anon, _select_commands(only, find=True))
     return resolved
 
 
+_SUBSTITUTION_COMMANDS = ["find", "env", "optenv", "dirname", "anon", "arg", "ns", "config"]
+# Commands whose result only depends on the context.
+_PURE_COMMANDS = ["ns", "config"]
+
+
+@lru_cache(maxsize=None)
+def _select_commands(only: Optional[Tuple[str]], find: bool = False) -> Dict:
+    if find:
+        commands = {
+            "find": roslaunch.substitution_args._find,
+        }
+    else:
+        commands = {
+            "env": roslaunch.substitution_args._env,
+            "optenv": roslaunch.substitution_args._optenv,
+            "dirname": roslaunch.substitution_args._dirname,
+            "anon": roslaunch.substitution_args._anon,
+            "arg": roslaunch.substitution_args._arg,
+            "ns": _ns,
+            "config": _config,
+        }
+    if only is None:
+        return commands
+    return {c: commands[c] for c in only if c in commands}
+
+
+@lru_cache(maxsize=4096)
+def _parse_args(arg_str: str) -> Tuple[Tuple[str, str, Tuple[str, ...]], ...]:
+    """Parses the substitution args in *arg_str* once, into tuples of (arg, command, command args)."""
+    parsed = []
+    for a in roslaunch.substitution_args._collect_args(arg_str):
+        splits = [s for s in a.split(" ") if s]
+        if not splits[0] in _SUBSTITUTION_COMMANDS:
+            raise roslaunch.substitution_args.SubstitutionException(
+                "Unknown substitution command [%s]. Valid commands are %s" % (a, _SUBSTITUTION_COMMANDS)
+            )
+        parsed.append((a, splits[0], tuple(splits[1:])))
+    return tuple(parsed)
+
+
+def _is_pure(arg_str: str) -> bool:
+    return not arg_str.startswith("$(eval ") and all(command in _PURE_COMMANDS for _, command, _ in _parse_args(arg_str))
+
+
 def _resolve_args(arg_str, context, resolve_anon, commands):
-    ros_valid = ["find", "env", "optenv", "dirname", "anon", "arg"]
-    valid = ros_valid + ["ns", "config"]
     resolved = arg_str
-    if isinstance(arg_str, (str, list)):
-        for a in roslaunch.substitution_args._collect_args(arg_str):
-            splits = [s for s in a.split(" ") if s]
-            if not splits[0] in valid:
-                raise roslaunch.substitution_args.SubstitutionException(
-                    "Unknown substitution command [%s]. Valid commands are %s" % (a, valid)
-                )
-            command = splits[0]
-            args = splits[1:]
-            if command in commands:
-                resolved = commands[command](resolved, a, args, context)
+    if isinstance(arg_str, str):
+        if "$(" not in arg_str:
+            return resolved
+        parsed = _parse_args(arg_str)
+    elif isinstance(arg_str, list):
+        parsed = _parse_args.__wrapped__(arg_str)
+    else:
+        return resolved
+    for a, command, args in parsed:
+        if command in commands:
+            resolved = commands[command](resolved, a, list(args), context)
     return resolved
 
 
@@ -409,9 +642,11 @@ def msg_type_error(
 
 
 def deepcopy(func):
+    """Returns a copy of the result of *func*, made with :func:`~eagerx.utils.utils.copy_params`."""
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        return copy.deepcopy(func(*args, **kwargs))
+        return copy_params(func(*args, **kwargs))
 
     return wrapper
 
@@ -471,3 +706,42 @@ def get_default_params(func):
             continue
         defaults[arg] = None
     return defaults
+
+
+class MessagePool(object):
+    """Recycles message instances of a single output to reduce allocations at high rates.
+
+    The pool is disabled by default, and only enabled by the message broker once it proved that the output is
+    consumed synchronously (i.e. all consumers serialize the message before the next callback).
+    The most recently released message is held back, because a latched publisher still references it (i.e. it is sent
+    to late subscribers). It is recycled once the next message is released.
+    In guard mode, recycled messages are checked for external references (e.g. a consumer that holds on to a message).
+    Such messages are never recycled.
+    """
+
+    def __init__(self, msg_type: Any, size: int, guard: bool = False, name: str = ""):
+        self.msg_type = msg_type
+        self.guard = guard
+        self.name = name
+        self.enabled = False
+        self._free = deque(maxlen=size)
+        self._latched = None
+
+    def acquire(self) -> Any:
+        if self.enabled and len(self._free) > 0:
+            msg = self._free.popleft()
+            # Only referenced by `msg` and the argument of getrefcount, if nobody else holds on to the message.
+            if self.guard and sys.getrefcount(msg) > 2:
+                rospy.logwarn_once(
+                    f"[{self.name}] A recycled message is still referenced elsewhere, so it was not reused. "
+                    "Disable message pooling for this output, or do not hold on to its messages."
+                )
+                return self.msg_type()
+            return msg
+        return self.msg_type()
+
+    def release(self, msg: Any) -> None:
+        if self.enabled and type(msg) is self.msg_type:
+            if self._latched is not None:
+                self._free.append(self._latched)
+            self._latched = msg
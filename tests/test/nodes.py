@@ -166,7 +166,7 @@ class TestNode(EngineNode):
 
 class ProcessNode(TestNode):
     @staticmethod
-    @register.spec("Process", Node)
+    @register.spec("Process", Node, prototype=True)
     def spec(
         spec,
         name: str,
@@ -0,0 +1,53 @@
+import pytest
+
+from eagerx.utils import build_cache
+
+
+class Spec:
+    def __init__(self, name):
+        self._params = {"config": {"name": name}}
+        self.calls = 0
+
+    @build_cache.cached
+    def build(self, ns, bridge_id="bridge"):
+        self.calls += 1
+        return {self._params["config"]["name"]: {"ns": ns, "bridge_id": bridge_id}}
+
+
+def test_build_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("EAGERX_CACHE", "1")
+    monkeypatch.setenv("EAGERX_CACHE_DIR", str(tmp_path))
+    for i in range(2):
+        spec = Spec("node")
+        build_cache.begin("/env", {"graph": 1})
+        assert spec.build("/env", bridge_id="b") == {"node": {"ns": "/env", "bridge_id": "b"}}
+        assert spec.build(ns="/env", bridge_id="b") == {"node": {"ns": "/env", "bridge_id": "b"}}
+        build_cache.end("/env")
+        # The second launch loads the artifact of the first launch.
+        assert spec.calls == (1 if i == 0 else 0)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # A different graph is compiled again, and nothing is cached outside begin/end.
+    spec = Spec("node")
+    build_cache.begin("/env", {"graph": 2})
+    spec.build("/env")
+    build_cache.end("/env")
+    spec.build("/env")
+    assert spec.calls == 2
+
+
+def test_failed_build(tmp_path, monkeypatch):
+    monkeypatch.setenv("EAGERX_CACHE", "1")
+    monkeypatch.setenv("EAGERX_CACHE_DIR", str(tmp_path))
+    spec = Spec("node")
+    with pytest.raises(RuntimeError):
+        with build_cache.compiling("/env", {"graph": 1}):
+            spec.build("/env")
+            raise RuntimeError("Build failed.")
+
+    # A failed build is neither stored, nor left active.
+    assert "/env" not in build_cache._artifacts and len(list(tmp_path.iterdir())) == 0
+    spec.build("/env")
+    with build_cache.compiling("/env", {"graph": 1}):
+        spec.build("/env")
+    assert spec.calls == 3 and len(list(tmp_path.iterdir())) == 1
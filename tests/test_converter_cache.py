@@ -0,0 +1,29 @@
+from eagerx.core.converters import Identity
+from eagerx.utils.utils import initialize_converter, get_attribute_from_module, clear_converters
+import eagerx.utils.utils as utils
+
+
+class SharedIdentity(Identity):
+    SHARED = True
+
+
+def test_converter_cache():
+    space = dict(converter_type="eagerx.converters.space_ros_converters/Space_Float32", low=-1, high=1, dtype="float32")
+    c1 = initialize_converter(space)
+    assert initialize_converter(dict(space)) is c1
+    assert initialize_converter(dict(space, high=2)) is not c1
+    assert space["converter_type"] == "eagerx.converters.space_ros_converters/Space_Float32"
+    cls = get_attribute_from_module("eagerx.converters.space_ros_converters/Space_Float32")
+    assert get_attribute_from_module("Space_Float32", "eagerx.converters.space_ros_converters") is cls
+
+    # Converters are not shared by default (e.g. because they may keep state)
+    assert not Identity.SHARED
+    identity = dict(converter_type="eagerx.core.converters/Identity")
+    assert initialize_converter(identity) is not initialize_converter(identity)
+    shared = dict(converter_type=f"{__name__}/SharedIdentity")
+    assert initialize_converter(shared) is initialize_converter(shared)
+
+    # Shared instances are released when cleared (e.g. when the environment shuts down)
+    clear_converters()
+    assert not utils._CONVERTERS
+    assert initialize_converter(space) is not c1
@@ -0,0 +1,54 @@
+import signal
+import time
+
+from eagerx.utils import forkserver
+
+
+def wait(p):
+    start = time.time()
+    while p.poll() is None:
+        assert time.time() - start < 30, f"Process {p.pid} did not finish."
+        time.sleep(0.01)
+    return p.returncode
+
+
+def test_forkserver(tmp_path, monkeypatch):
+    script = tmp_path / "script.py"
+    script.write_text(
+        "import sys, os, time\n"
+        "assert sys.path[0] == os.path.dirname(os.path.abspath(__file__))\n"
+        "if sys.argv[1] == 'sleep':\n"
+        "    time.sleep(30)\n"
+        "open(sys.argv[-1], 'w').write(' '.join(sys.argv[1:-1]) + os.environ['EAGERX_TEST'])\n"
+        "sys.exit(3)\n"
+    )
+    monkeypatch.setenv("EAGERX_TEST", "!")
+
+    # Every launch forks the same zygote, which forwards the exit status
+    processes = [forkserver.launch(str(script), ["ns", f"node_{i}", str(tmp_path / f"out_{i}")]) for i in range(3)]
+    assert len({p.pid for p in processes}) == 3
+    for i, p in enumerate(processes):
+        assert wait(p) == 3
+        assert (tmp_path / f"out_{i}").read_text() == f"ns node_{i}!"
+
+    # Signals are delivered via the zygote
+    p = forkserver.launch(str(script), ["sleep", "node", str(tmp_path / "out")])
+    p.terminate()
+    assert wait(p) == -signal.SIGTERM
+    forkserver._zygote.shutdown()
+
+
+def test_forkserver_registry(tmp_path):
+    import tests.test  # noqa # pylint: disable=unused-import
+
+    # The zygote preimports the modules of the registered entities
+    if forkserver._zygote is not None:
+        forkserver._zygote.shutdown()
+    modules = forkserver._registered_modules()
+    assert "tests.test.nodes" in modules
+    script = tmp_path / "script.py"
+    script.write_text("import sys\nopen(sys.argv[-1], 'w').write(str('tests.test.nodes' in sys.modules))\n")
+    p = forkserver.launch(str(script), ["ns", "node", str(tmp_path / "out")])
+    assert wait(p) == 0
+    assert (tmp_path / "out").read_text() == "True"
+    forkserver._zygote.shutdown()
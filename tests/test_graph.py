@@ -10,10 +10,11 @@ from eagerx.wrappers import Flatten
 import tests.test  # noqa # pylint: disable=unused-import
 
 import pytest
+import eagerx.core.graph
 
 
 @pytest.mark.timeout(60)
-def test_graph():
+def test_graph(tmp_path):
     roscore = initialize("eagerx_core", anonymous=True, log_level=log.INFO)
     rate = 7
 
@@ -214,6 +215,12 @@ def test_graph():
     # Test save & load functionality
     graph.save("./test.graph")
     graph.load("./test.graph")
+    state = graph._state
+    graph.save(str(tmp_path / "test.graph.bin"), binary=True)
+    graph.load(str(tmp_path / "test.graph.bin"), binary=True)
+    assert graph._state == state
+    KF_bin = Graph.load_entity(str(tmp_path / "test.graph.bin"), "KF", binary=True)
+    assert KF_bin == Graph.load_entity("./test.graph", "KF") == state["nodes"]["KF"]
 
     # Plot
     import matplotlib.pyplot as plt
@@ -270,3 +277,71 @@ def test_graph():
     if roscore:
         roscore.shutdown()
     print("\n[Shutdown]")
+
+
+def test_prune():
+    # N1 and N2 form a cycle (via a skipped input) that does not reach an observation, so both are pruned with N3.
+    N0 = Node.make("Process", "N0", rate=7, inputs=["in_1"], outputs=["out_1", "out_2"])
+    N1 = Node.make("Process", "N1", rate=7, inputs=["in_1", "in_2"], outputs=["out_1"])
+    N2 = Node.make("Process", "N2", rate=7, inputs=["in_1"], outputs=["out_1"])
+    N3 = Node.make("Process", "N3", rate=7, inputs=["in_1"], outputs=["out_1"])
+    graph = Graph.create(nodes=[N0, N1, N2, N3])
+    graph.connect(action="act_1", target=N0.inputs.in_1, skip=True)  # Else, act_1 --> N0 --> obs_1 is an algebraic loop.
+    graph.connect(source=N0.outputs.out_1, observation="obs_1")
+    graph.connect(source=N0.outputs.out_2, target=N1.inputs.in_1)
+    graph.connect(source=N1.outputs.out_1, target=N2.inputs.in_1)
+    graph.connect(source=N2.outputs.out_1, target=N1.inputs.in_2, skip=True)
+    graph.connect(source=N2.outputs.out_1, target=N3.inputs.in_1)
+
+    nodes, _, _, _, _ = graph.register()
+    assert {n.config.name for n in nodes} == {"N0", "N1", "N2", "N3"}, "Pruning must be opt-in."
+    nodes, _, _, _, _ = graph.register(prune=True)
+    assert [n.config.name for n in nodes] == ["N0"]
+    assert nodes[0].config.outputs == ["out_1"]
+
+
+def test_add_copies_params():
+    N0 = Node.make("Process", "N0", rate=7)
+    graph = Graph.create(nodes=[N0])
+
+    # The graph owns a copy of the params, and its views are read-only.
+    N0._params["config"]["rate"] = 8
+    assert graph._state["nodes"]["N0"]["config"]["rate"] == 7
+    N0.config.inputs.append("in_2")
+    assert N0.config.inputs == ["in_1"]
+
+
+def make_loop(monkeypatch, skip=None):
+    warnings = []
+    monkeypatch.setattr(eagerx.core.graph.rospy, "logwarn", warnings.append)
+    # The object decouples the action from the observation (i.e. they do not form an algebraic loop).
+    arm = Object.make("Arm", "obj", actuators=["ref_vel"], sensors=["N6"], states=["N9"])
+    N1 = Node.make("Process", "N1", rate=7, inputs=["in_1", "in_2"], outputs=["out_1"])
+    N2 = Node.make("Process", "N2", rate=7, inputs=["in_1"], outputs=["out_1"])
+    graph = Graph.create(nodes=[N1, N2], objects=[arm])
+    graph.connect(action="act_1", target=arm.actuators.ref_vel)
+    graph.connect(source=arm.sensors.N6, target=N1.inputs.in_1)
+    graph.connect(source=N1.outputs.out_1, target=N2.inputs.in_1)
+    graph.connect(source=N2.outputs.out_1, observation="obs_1")
+    graph.connect(source=N2.outputs.out_1, target=N1.inputs.in_2, skip=skip)
+    return graph, N1, N2, warnings
+
+
+def test_algebraic_loop(monkeypatch):
+    # The connection that closes the loop is reported at connect time, and the graph is rejected.
+    graph, N1, N2, warnings = make_loop(monkeypatch)
+    assert len(warnings) == 1 and "creates an algebraic loop" in warnings[0], warnings
+    assert "N1" in warnings[0] and "N2" in warnings[0]
+    with pytest.raises(AssertionError, match="Algebraic loops detected"):
+        Graph.check_graph_is_acyclic(graph._state, plot=False)
+
+    # Skipping the connection breaks the loop, also when it is skipped after connecting.
+    graph.set({"skip": True}, N1.inputs.in_2)
+    assert Graph.check_graph_is_acyclic(graph._state, plot=False)
+    graph.disconnect(source=N2.outputs.out_1, target=N1.inputs.in_2)
+    graph.connect(source=N2.outputs.out_1, target=N1.inputs.in_2, skip=True)
+    assert len(warnings) == 1
+
+    graph, _, _, warnings = make_loop(monkeypatch, skip=True)
+    assert len(warnings) == 0
+    assert Graph.check_graph_is_acyclic(graph._state, plot=False) and graph.is_valid(plot=False)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from sensor_msgs.msg import Image
+
+from eagerx.converters.image_compression import Image_CompressedImage, ENCODINGS
+
+
+def make_image(encoding, height=4, width=5, padding=0, is_bigendian=False):
+    dtype, channels = ENCODINGS.get(encoding, (np.float32, 1))
+    dtype = np.dtype(dtype).newbyteorder(">" if is_bigendian else "<")
+    rng = np.random.default_rng(0)
+    array = rng.integers(0, np.iinfo(dtype).max if dtype.kind == "u" else 1, size=(height, width, channels)).astype(dtype)
+    rows = array.reshape(height, -1).view(np.uint8)
+    rows = np.concatenate([rows, np.zeros((height, padding), dtype=np.uint8)], axis=1)
+    msg = Image(
+        height=height,
+        width=width,
+        encoding=encoding,
+        is_bigendian=int(is_bigendian),
+        step=rows.shape[1],
+        data=rows.tobytes(),
+    )
+    return msg, array.astype(dtype.newbyteorder("="))
+
+
+@pytest.mark.parametrize("encoding", list(ENCODINGS))
+def test_png_round_trip(encoding):
+    converter = Image_CompressedImage(format="png", skip_rx=False)
+    msg, array = make_image(encoding)
+    decoded = converter.B_to_A(converter.A_to_B(msg))
+    dtype, channels = ENCODINGS[encoding]
+    assert (decoded.height, decoded.width, decoded.encoding) == (msg.height, msg.width, encoding)
+    assert decoded.step == msg.width * channels * np.dtype(dtype).itemsize
+    assert np.array_equal(np.frombuffer(decoded.data, dtype=dtype).reshape(array.shape), array)
+
+
+@pytest.mark.parametrize("encoding", ["mono8", "rgb8", "bgr8"])
+def test_jpeg_round_trip(encoding):
+    converter = Image_CompressedImage(format="jpeg", jpeg_quality=100, skip_rx=False)
+    msg, array = make_image(encoding)
+    decoded = converter.B_to_A(converter.A_to_B(msg))
+    assert (decoded.height, decoded.width, decoded.encoding) == (msg.height, msg.width, encoding)
+    assert np.frombuffer(decoded.data, dtype=np.uint8).size == array.size
+
+
+def test_padding_and_endianness():
+    converter = Image_CompressedImage(format="png", skip_rx=False)
+    for msg, array in [make_image("rgb8", padding=3), make_image("mono16", is_bigendian=True, padding=2)]:
+        decoded = converter.B_to_A(converter.A_to_B(msg))
+        assert np.array_equal(np.frombuffer(decoded.data, dtype=array.dtype).reshape(array.shape), array)
+
+
+def test_unsupported_encodings():
+    png = Image_CompressedImage(format="png", skip_rx=False)
+    jpeg = Image_CompressedImage(format="jpeg", skip_rx=False)
+    with pytest.raises(ValueError):
+        png.A_to_B(make_image("32FC1")[0])
+    with pytest.raises(ValueError):
+        jpeg.A_to_B(make_image("mono16")[0])
+    with pytest.raises(ValueError):
+        jpeg.A_to_B(make_image("rgba8")[0])
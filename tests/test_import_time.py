@@ -0,0 +1,19 @@
+import os
+import subprocess
+import sys
+
+# Modules that node processes do not need, so importing eagerx must not import them.
+HEAVY_MODULES = ["cv2", "gym", "networkx", "matplotlib", "skimage", "pyvirtualdisplay", "eagerx.core.env"]
+# Budget for the cumulative import time of eagerx (seconds). Can be raised on slow machines.
+IMPORT_BUDGET = float(os.environ.get("EAGERX_IMPORT_BUDGET", "3.0"))
+
+
+def test_import_time():
+    code = "import sys, eagerx; print(','.join(m for m in %s if m in sys.modules))" % HEAVY_MODULES
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "", f"Importing eagerx imports heavy modules: {out.stdout.strip()}"
+
+    # Lines are formatted as "import time: self [us] | cumulative | imported package".
+    cumulative = [int(line.split("|")[1]) for line in out.stderr.splitlines() if line.split("|")[-1].strip() == "eagerx"]
+    assert len(cumulative) == 1, out.stderr
+    assert cumulative[0] * 1e-6 < IMPORT_BUDGET, f"Importing eagerx took {cumulative[0] * 1e-6:.2f}s."
@@ -0,0 +1,99 @@
+import os
+import socket
+import subprocess
+import sys
+
+from std_msgs.msg import UInt64
+
+from eagerx.utils import inprocess
+from eagerx.utils.utils import param_client
+
+import pytest
+
+
+def test_inprocess_backend():
+    inprocess.enable("/local")
+    try:
+        # Latched messages are replayed to new subscribers
+        received = []
+        pub = inprocess.publisher("/local/node/initialized", UInt64, queue_size=0, latch=True)
+        assert isinstance(pub, inprocess.Publisher)
+        pub.publish(UInt64(data=1))
+        sub = inprocess.subscriber(
+            "/local/node/initialized", UInt64, callback=lambda msg, arg: received.append((msg.data, arg)), callback_args="a"
+        )
+        pub.publish(UInt64(data=2))
+        assert received == [(1, "a"), (2, "a")]
+        assert pub.get_num_connections() == 1
+        sub.unregister()
+        pub.publish(UInt64(data=3))
+        assert len(received) == 2
+
+        # Services are called directly
+        srv = inprocess.service("/local/environment/shutdown", None, lambda req: req + 1)
+        assert "/local/environment/shutdown" in inprocess.get_service_list("/local")
+        assert inprocess.service_proxy("/local/environment/shutdown", None)(1) == 2
+        srv.shutdown()
+        assert len(inprocess.get_service_list("/local")) == 0
+
+        # Params are stored in memory
+        param_client.upload("/local", {"node": {"rate": 5, "inputs": ["null"]}}, {"rate": {"node/out": 5}})
+        param_client.upload("/local", {"rate": {"other/out": 3}})
+        assert param_client.get("/local/rate") == {"node/out": 5, "other/out": 3}
+        assert param_client.get("/local/node/inputs") == [None]
+        assert param_client.get("/local/missing", default=False) is False
+        assert param_client.exists("/local/node/rate")
+        param_client.delete("/local/node")
+        assert not param_client.exists("/local/node/rate")
+    finally:
+        inprocess.disable("/local")
+    assert not inprocess.is_local("/local/node")
+
+
+INPROCESS_ENV = """
+import eagerx
+import rosgraph
+import tests.test  # noqa # pylint: disable=unused-import
+from eagerx.utils import inprocess
+
+# Does not launch a roscore.
+eagerx.initialize("eagerx_core", anonymous=True, log_level=eagerx.log.INFO, roscore=False)
+
+# All nodes (and the simnodes of the object) run in the environment process.
+arm = eagerx.Object.make("Arm", "obj", actuators=["ref_vel"], sensors=["N6"], states=["N9"])
+N1 = eagerx.Node.make("Process", "N1", rate=1.0, inputs=["in_1"], outputs=["out_1"], process=eagerx.process.ENVIRONMENT)
+graph = eagerx.Graph.create(nodes=[N1], objects=[arm])
+graph.connect(action="act_1", target=N1.inputs.in_1)
+graph.connect(source=N1.outputs.out_1, target=arm.actuators.ref_vel)
+graph.connect(source=arm.sensors.N6, observation="sens_1")
+bridge = eagerx.Bridge.make("TestBridge", rate=20, sync=True, real_time_factor=0, process=eagerx.process.ENVIRONMENT)
+
+env = eagerx.EagerxEnv(name="inprocess", rate=7, graph=graph, bridge=bridge)
+assert env.local
+assert all(isinstance(pub, inprocess.Publisher) for pub in env.mb._publishers)
+env.reset()
+action = env.action_space.sample()
+for _ in range(10):
+    _, _, _, _ = env.step(action)
+env.shutdown()
+assert not inprocess.is_local("/inprocess")
+print(f"master_online={rosgraph.is_master_online()}")
+"""
+
+
+@pytest.mark.timeout(60)
+def test_inprocess_env(tmp_path):
+    # Runs in a fresh process that points to an unused master port, so that a roscore of other tests is not used.
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        port = s.getsockname()[1]
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, ROS_MASTER_URI=f"http://localhost:{port}", EAGERX_LOCAL="1")
+    env["PYTHONPATH"] = os.pathsep.join([root] + [p for p in [os.environ.get("PYTHONPATH", None)] if p])
+    script = tmp_path / "inprocess_env.py"
+    script.write_text(INPROCESS_ENV)
+    p = subprocess.run([sys.executable, str(script)], cwd=root, env=env, capture_output=True, text=True, timeout=50)
+    assert p.returncode == 0, p.stderr
+
+    # No roscore was launched (i.e. the environment ran without one).
+    assert "master_online=False" in p.stdout, p.stdout
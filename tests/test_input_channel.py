@@ -0,0 +1,244 @@
+from std_msgs.msg import UInt64
+
+import rx
+from rx import Observable, typing, operators as ops
+from rx.disposable import SingleAssignmentDisposable, CompositeDisposable
+from rx.internal.concurrency import synchronized
+from rx.scheduler import ImmediateScheduler
+from rx.subject import Subject
+
+from eagerx.core.rx_operators import InputChannel, expected_inputs
+from eagerx.utils.utils import Info, Msg, Stamp
+
+import time
+from collections import deque
+from threading import RLock
+from typing import List, Optional
+
+import pytest
+
+
+# Frozen copy of the (unfused) message generator that InputChannel replaced. Only used as reference.
+def generate_msgs(
+    source_Nc: Observable,
+    rate_node: float,
+    name: str,
+    rate_in: float,
+    params: dict,
+    sync: bool,
+    real_time_factor: float,
+    simulate_delays: bool,
+    node=None,
+    change_only: bool = False,
+):
+    dt_i = 1 / rate_in
+    # The held value is only synthesised in async mode, because change-only outputs are only filtered in async mode.
+    hold = change_only and not sync
+
+    def _generate_msgs(source_msg: Observable):
+        window = params["window"]
+        skip = int(params["skip"])
+
+        def subscribe(observer: typing.Observer, scheduler: Optional[typing.Scheduler] = None) -> CompositeDisposable:
+            start = time.time()
+            msgs_queue: List = []
+            t_i_queue: List = []
+            num_queue: List = []
+            tick_queue: List = []
+            msgs_window = deque(maxlen=window)
+            t_i_window = deque(maxlen=window)
+            t_n_window = deque(maxlen=window)
+            lock = RLock()
+            last_msg = [None]
+            num_msgs_total = [0]
+
+            @synchronized(lock)
+            def fill_held(wc_stamp):
+                # Synthesise the held value for every message that the change-only output did not publish (up until now).
+                num_expected = int(((wc_stamp - start) / real_time_factor) * rate_in)
+                while last_msg[0] is not None and num_msgs_total[0] < num_expected:
+                    sim_stamp = num_msgs_total[0] * dt_i
+                    msgs_queue.append(last_msg[0])
+                    t_i_queue.append(Stamp(num_msgs_total[0], sim_stamp, start + sim_stamp * real_time_factor))
+                    num_msgs_total[0] += 1
+
+            @synchronized(lock)
+            def next(i):
+                if len(tick_queue) > 0:
+                    if hold:
+                        fill_held(time.time())
+                    if not sync or len(msgs_queue) >= num_queue[0]:
+                        try:
+                            tick = tick_queue.pop(0)
+                            if sync:
+                                # determine num_msgs
+                                num_msgs = num_queue.pop(0)
+                                msgs = msgs_queue[:num_msgs]
+                                t_i = t_i_queue[:num_msgs]
+                                msgs_queue[:] = msgs_queue[num_msgs:]
+                                t_i_queue[:] = t_i_queue[num_msgs:]
+                            else:  # Empty complete buffer
+                                msgs = msgs_queue.copy()
+                                t_i = t_i_queue.copy()
+                                msgs_queue[:] = []
+                                t_i_queue[:] = []
+                        except Exception as ex:  # pylint: disable=broad-except
+                            observer.on_error(ex)
+                            return
+
+                        # Determine t_n stamp
+                        wc_stamp = time.time()
+                        seq = tick
+                        if sync:
+                            sim_stamp = round(tick / rate_node, 12)
+                        else:
+                            sim_stamp = (wc_stamp - start) / real_time_factor
+                        t_n = Stamp(seq, sim_stamp, wc_stamp)
+
+                        if window > 0:
+                            msgs_window.extend(msgs)
+                            t_i_window.extend(t_i)
+                            t_n_window.extend([t_n] * len(msgs))
+                            wmsgs = list(msgs_window)
+                            wt_i = list(t_i_window)
+                            wt_n = list(t_n_window)
+                        else:
+                            wmsgs = msgs
+                            wt_i = t_i
+                            wt_n = [t_n] * len(msgs)
+                        res = Msg(Info(name, tick, rate_in, wt_n, wt_i, None), wmsgs)
+                        observer.on_next(res)
+
+            # Determine Nc logic
+            def on_next_Nc(x):
+                if sync:
+                    # Caculate expected number of message to be received
+                    delay = params["delay"] if simulate_delays else 0.0
+                    num_msgs = expected_inputs(x - skip, rate_in, rate_node, delay)
+                    num_queue.append(num_msgs)
+                tick_queue.append(x)
+                next(x)
+
+            subscriptions = []
+            sad = SingleAssignmentDisposable()
+            sad.disposable = source_Nc.subscribe(on_next_Nc, observer.on_error, observer.on_completed, scheduler)
+            subscriptions.append(sad)
+
+            @synchronized(lock)
+            def on_next_msg(x):
+                wc_stamp = time.time()
+                seq = x[0]
+                if hold:
+                    fill_held(wc_stamp)
+                    last_msg[0] = x[1]
+                    seq = num_msgs_total[0]
+                    num_msgs_total[0] += 1
+                msgs_queue.append(x[1])
+                if sync:
+                    sim_stamp = round(x[0] * dt_i, 12)
+                else:
+                    sim_stamp = (wc_stamp - start) / real_time_factor
+                t_i_queue.append(Stamp(seq, sim_stamp, wc_stamp))
+                next(x)
+
+            sad = SingleAssignmentDisposable()
+            if not sync and simulate_delays:
+                source_msg_delayed = source_msg.pipe(ops.delay(params["delay"] / real_time_factor))
+            else:
+                source_msg_delayed = source_msg
+            sad.disposable = source_msg_delayed.subscribe(on_next_msg, observer.on_error, observer.on_completed, scheduler)
+            subscriptions.append(sad)
+
+            return CompositeDisposable(subscriptions)
+
+        return rx.create(subscribe)
+
+    return _generate_msgs
+
+
+def legacy_channel(name, msg, Nc, Is, convert, rate_node, rate_in, params, sync, rtf, simulate_delays, change_only, scheduler):
+    # The (unfused) pipeline that InputChannel replaced.
+    Ir = msg.pipe(
+        ops.observe_on(scheduler),
+        ops.map(convert),
+        ops.scan(lambda acc, x: (acc[0] + 1, x), (-1, None)),
+        ops.share(),
+    )
+    channel = Ir.pipe(
+        generate_msgs(Nc, rate_node, name, rate_in, params, sync, rtf, simulate_delays, change_only=change_only),
+        ops.share(),
+    )
+    flag = Ir.pipe(
+        ops.map(lambda val: val[0] + 1),
+        ops.start_with(0),
+        ops.combine_latest(Is.pipe(ops.map(lambda msg: msg.data))),
+        ops.filter(lambda value: not sync or value[0] == value[1]),
+        ops.map(lambda x: {name: x[0]}),
+    )
+    return channel, flag
+
+
+def record(channel, flag):
+    channels, flags = [], []
+
+    def on_channel(msg):
+        channels.append((msg.info.name, msg.info.node_tick, msg.info.rate_in, msg.info.t_node, msg.info.t_in, list(msg.msgs)))
+
+    d = [channel.subscribe(on_channel), flag.subscribe(flags.append)]
+    return channels, flags, d
+
+
+@pytest.mark.parametrize("sync", [True, False])
+@pytest.mark.parametrize("window", [0, 1, 2])
+@pytest.mark.parametrize("skip", [False, True])
+@pytest.mark.parametrize("delay", [0.0, 0.1])
+@pytest.mark.parametrize("rtf", [1, 2])
+@pytest.mark.parametrize("change_only", [False, True])
+def test_input_channel_equivalence(monkeypatch, sync, window, skip, delay, rtf, change_only):
+    # The wall-clock is controlled by the test, so that stamps (and held messages) are deterministic.
+    now = [0.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    scheduler = ImmediateScheduler()
+    rate_node, rate_in = 10, 20
+    params = dict(window=window, skip=skip, delay=delay)
+    # Asynchronous delays are simulated with a timer, so they are only simulated in sync mode.
+    simulate_delays = sync
+    convert = lambda x: 2 * x  # noqa: E731
+
+    results = []
+    for fused in [False, True]:
+        now[0] = 0.0
+        msg, Nc, Is = Subject(), Subject(), Subject()
+        args = ("in", msg, Nc, Is, convert, rate_node, rate_in, params, sync, rtf, simulate_delays)
+        if fused:
+            ic = InputChannel(*args, change_only=change_only, scheduler=scheduler)
+            channel, flag = ic.channel, ic.flag
+        else:
+            channel, flag = legacy_channel(*args, change_only, scheduler)
+        channels, flags, d = record(channel, flag)
+
+        Is.on_next(UInt64(data=5))
+        Nc.on_next(0)
+        for i in range(5):
+            now[0] += 0.1  # I.e. two messages of a change-only output are held in between (with rtf=1).
+            msg.on_next(i)
+            if i % 2 == 0:
+                Nc.on_next(i // 2 + 1)
+        Is.on_next(UInt64(data=4))
+        [s.dispose() for s in d]
+        results.append((channels, flags))
+    assert len(results[0][0]) > 0, "The legacy channel did not emit."
+    assert results[0] == results[1]
+
+
+def test_input_channel_shared_count():
+    # Resubscribing after all subscribers disposed resets the message counter.
+    msg, Nc, Is = Subject(), Subject(), rx.of(UInt64(data=1))
+    params = dict(window=1, skip=False, delay=0.0)
+    ic = InputChannel("in", msg, Nc, Is, lambda x: x, 1, 1, params, True, 1, False, scheduler=ImmediateScheduler())
+    for _ in range(2):
+        flags = []
+        d = ic.flag.subscribe(flags.append)
+        msg.on_next(0)
+        d.dispose()
+        assert flags == [{"in": 1}]
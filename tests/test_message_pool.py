@@ -0,0 +1,55 @@
+from std_msgs.msg import UInt64
+
+from eagerx.utils.utils import MessagePool
+
+
+def make_pool(size=2, guard=False):
+    pool = MessagePool(UInt64, size, guard=guard, name="test")
+    pool.enabled = True
+    return pool
+
+
+def test_reuse():
+    pool = make_pool()
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+    assert second is not first, "The latched message must not be reused."
+    pool.release(second)
+    assert pool.acquire() is first, "The previous message must be reused once a newer one is latched."
+
+    # Disabled pools (the default) never recycle
+    pool = MessagePool(UInt64, 2)
+    msg = pool.acquire()
+    pool.release(msg)
+    pool.release(pool.acquire())
+    assert pool.acquire() is not msg
+
+
+def test_latched_message():
+    # The most recently published message is never handed out, so late subscribers receive it unmodified.
+    pool = make_pool()
+    latched = None
+    for i in range(10):
+        msg = pool.acquire()
+        assert msg is not latched
+        msg.data = i
+        pool.release(msg)
+        latched = msg
+        assert latched.data == i
+
+
+def test_guard():
+    # Messages without external references are reused in guard mode.
+    pool = make_pool(guard=True)
+    pool.release(pool.acquire())
+    pool.release(pool.acquire())
+    ids = {id(m) for m in pool._free}
+    assert id(pool.acquire()) in ids
+
+    # Messages that are still referenced elsewhere are not.
+    pool = make_pool(guard=True)
+    held = pool.acquire()
+    pool.release(held)
+    pool.release(pool.acquire())
+    assert pool.acquire() is not held
@@ -0,0 +1,22 @@
+from eagerx.utils.network_utils import IncrementalDAG
+
+
+def test_incremental_dag():
+    dag = IncrementalDAG()
+    assert dag.add_edge("a", "b") == []
+    assert dag.add_edge("b", "c") == []
+    assert dag.add_edge("c", "a") == ["c", "a", "b", "c"]
+    assert dag.find_cycle() == ["c", "a", "b", "c"]
+
+    # A parallel edge keeps the cycle alive when one of them is removed.
+    assert dag.add_edge("a", "b") == []
+    dag.remove_edge("a", "b")
+    assert dag.find_cycle() == ["c", "a", "b", "c"]
+
+    # Breaking the cycle reinserts the edge that closed it.
+    dag.remove_edge("a", "b")
+    assert dag.find_cycle() == []
+    assert dag.add_edge("d", "d") == ["d", "d"]
+    dag.remove_edge("d", "d")
+    assert dag.find_cycle() == []
+    assert dag._ord["b"] < dag._ord["c"] < dag._ord["a"]
@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+
+import pytest
+
+from eagerx.core.constants import process
+from eagerx.utils import inprocess, node_utils, utils
+from eagerx.utils.utils import ParamClient
+
+
+class Master:
+    """Parameter server that counts the calls (i.e. round trips) to the ROS master."""
+
+    def __init__(self):
+        self.params = dict()
+        self.calls = []
+        self.handle = SimpleNamespace(system=SimpleNamespace(multicall=self.multicall))
+
+    def multicall(self, calls):
+        self.calls.append([c["methodName"] for c in calls])
+        for c in calls:
+            _caller_id, key, value = c["params"]
+            self.set_param(key, value)
+        return [[(1, "", 0)] for _ in calls]
+
+    def set_param(self, name, value):
+        keys = [k for k in name.split("/") if len(k) > 0]
+        d = self.params
+        for k in keys[:-1]:
+            d = d.setdefault(k, dict())
+        d[keys[-1]] = value
+
+    def get_param(self, name, default=KeyError):
+        self.calls.append(["getParam"])
+        params = self.params
+        for k in [k for k in name.split("/") if len(k) > 0]:
+            if not isinstance(params, dict) or k not in params:
+                if default is KeyError:
+                    raise KeyError(name)
+                return default
+            params = params[k]
+        return params
+
+
+@pytest.fixture
+def master(monkeypatch):
+    master = Master()
+    monkeypatch.setattr(utils.rospy, "get_param", master.get_param)
+    monkeypatch.setattr(utils.rosgraph, "Master", lambda caller_id: master)
+    return master
+
+
+def test_cache(master):
+    client = ParamClient()
+
+    # All params are uploaded in a single multicall, and bump the version of the namespace.
+    client.upload("/ns", {"node": {"rate": 5, "inputs": ["in_1"]}}, {"other": {"rate": 3}})
+    assert master.calls == [["setParam"] * 4]
+    assert set(master.params["ns"]) == {"node", "other", ParamClient.VERSION_KEY}
+
+    # The namespace is fetched once, after which all params are read from the cache.
+    master.calls.clear()
+    assert client.get("/ns/node/rate") == 5
+    assert client.get("/ns/other") == {"rate": 3}
+    assert client.get("/ns/missing", default=None) is None
+    assert master.calls == [["getParam"]]
+
+    # Copies are returned, so the cache cannot be modified.
+    client.get("/ns/node")["inputs"].append("in_2")
+    assert client.get("/ns/node/inputs") == ["in_1"]
+
+
+def test_invalidation(master):
+    client, other = ParamClient(), ParamClient()
+    client.upload("/ns", {"node": {"rate": 5}})
+    assert other.get("/ns/node/rate") == 5
+
+    # The cache is kept as long as the version of the namespace did not change.
+    master.calls.clear()
+    other.sync("/ns")
+    assert other.get("/ns/node/rate") == 5 and master.calls == [["getParam"]]
+
+    # An upload by another process (i.e. a new version) invalidates the cache.
+    client.upload("/ns", {"node": {"rate": 10}})
+    assert other.get("/ns/node/rate") == 5
+    other.sync("/ns")
+    assert other.get("/ns/node/rate") == 10
+
+    # An upload by this process invalidates its own cache.
+    other.get("/ns/node/rate")
+    other.upload("/ns", {"node": {"rate": 20}})
+    assert other.get("/ns/node/rate") == 20
+
+
+def test_initialize_nodes(monkeypatch):
+    ns = "/param_client"
+    uploads = []
+    monkeypatch.setattr(node_utils.param_client, "upload", lambda ns, *params: uploads.append((ns, params)))
+    inprocess.enable(ns)
+    try:
+
+        def make(name):
+            params = {name: dict(name=name, process=process.EXTERNAL)}
+            return SimpleNamespace(build=lambda ns: params, config=SimpleNamespace(name=name))
+
+        # The params of all nodes are uploaded at once.
+        mb = SimpleNamespace(subscribers=[])
+        is_initialized = dict()
+        node_utils.initialize_nodes([make("N1"), make("N2")], process.ENVIRONMENT, ns, mb, is_initialized, dict(), dict())
+        assert len(uploads) == 1 and [list(p) for p in uploads[0][1]] == [["N1"], ["N2"]]
+        assert is_initialized == dict(N1=False, N2=False)
+
+        # Node names must also be unique within the batch.
+        with pytest.raises(AssertionError):
+            node_utils.initialize_nodes([make("N3"), make("N3")], process.ENVIRONMENT, ns, mb, dict(), dict(), dict())
+        assert len(uploads) == 1
+        [sub.unregister() for sub in mb.subscribers]
+    finally:
+        inprocess.disable(ns)
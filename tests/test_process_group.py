@@ -0,0 +1,50 @@
+import eagerx
+
+# Implementation specific
+import tests.test  # noqa # pylint: disable=unused-import
+import pytest
+import rosgraph
+
+
+# Start roscore
+roscore = eagerx.initialize("eagerx_core", anonymous=True, log_level=eagerx.log.INFO)
+
+
+@pytest.mark.timeout(40)
+def test_process_group():
+    # Define object
+    arm = eagerx.Object.make("Arm", "obj", actuators=["ref_vel"], sensors=["N6"], states=["N9"])
+
+    # Nodes N1 and N2 share a process (and are linked via Rx), N3 runs in a second group.
+    group = eagerx.process.group("test")
+    assert group == "group:test" and eagerx.process.is_group(group)
+    N1 = eagerx.Node.make("Process", "N1", rate=1.0, inputs=["in_1"], outputs=["out_1"], process=group)
+    N2 = eagerx.Node.make("Process", "N2", rate=1.0, inputs=["in_1"], outputs=["out_1"], process=group)
+    N3 = eagerx.Node.make("Process", "N3", rate=1.0, inputs=["in_1"], outputs=["out_1"], process="group:other")
+
+    # Define graph
+    graph = eagerx.Graph.create(nodes=[N1, N2, N3], objects=[arm])
+    graph.connect(action="act_1", target=N1.inputs.in_1)
+    graph.connect(source=N1.outputs.out_1, target=N2.inputs.in_1)
+    graph.connect(source=N2.outputs.out_1, target=N3.inputs.in_1)
+    graph.connect(source=N3.outputs.out_1, target=arm.actuators.ref_vel)
+    graph.connect(source=arm.sensors.N6, observation="sens_1")
+
+    # Define bridge
+    bridge = eagerx.Bridge.make("TestBridge", rate=20, sync=True, real_time_factor=0, process=eagerx.process.ENVIRONMENT)
+
+    # Initialize Environment
+    env = eagerx.EagerxEnv(name="group", rate=7, graph=graph, bridge=bridge)
+    assert not env.local
+    assert {"/group/groups/test", "/group/groups/other"} <= set(env.supervisor_node.launch_nodes)
+
+    # The host of a group only subscribes (via ROS) to the outputs of nodes in other processes.
+    _, subscribers, _ = rosgraph.Master("/test_process_group").getSystemState()
+    subscribers = {topic: nodes for topic, nodes in subscribers}
+    assert not any(n.startswith("/groups_test") for n in subscribers.get("/group/N1/outputs/out_1", [])), "N1 -> N2 via ROS."
+    assert any(n.startswith("/groups_other") for n in subscribers["/group/N2/outputs/out_1"]), "N2 -> N3 not via ROS."
+    env.reset()
+    action = env.action_space.sample()
+    for _ in range(10):
+        env.step(action)
+    env.shutdown()
@@ -0,0 +1,56 @@
+from eagerx import Node, Object, SpaceConverter, process
+from eagerx.core.graph import Graph
+from eagerx.core import register
+
+# Implementation specific
+import tests.test  # noqa # pylint: disable=unused-import
+
+
+def test_prototype_clone(monkeypatch):
+    N1 = Node.make("Process", "N1", rate=1.0, inputs=["in_1"], outputs=["out_1"])
+    N2 = Node.make("Process", "N2", rate=1.0, inputs=["in_1"], outputs=["out_1"])
+    with monkeypatch.context() as m:
+        m.setenv("EAGERX_PROTOTYPES", "0")
+        N2_ref = Node.make("Process", "N2", rate=1.0, inputs=["in_1"], outputs=["out_1"])
+
+    # Clones must be identical to freshly made specs, and independent of each other
+    assert N2.params == N2_ref.params
+    N1.config.rate = 2.0
+    assert N2.config.rate == 1.0
+
+    # Arguments of different types (e.g. tuples and lists) do not share a prototype
+    key_list, _, _ = register._prototype_key(Node, "Process", ("N1", 1.0), dict(inputs=["in_1"]))
+    key_tuple, _, _ = register._prototype_key(Node, "Process", ("N1", 1.0), dict(inputs=("in_1",)))
+    assert key_list != key_tuple
+
+    # Only entities that opted in are cached
+    Node.make("KalmanFilter", "KF", rate=1.0)
+    assert not any(key[1] == "KalmanFilter" for key in register.PROTOTYPES)
+
+
+def make_gym_graph():
+    objects = [Object.make("GymObject", f"pendulum_{i}", env_id="Pendulum-v1", rate=20) for i in range(2)]
+    bf = Node.make("ButterworthFilter", name="bf", rate=20, N=2, Wn=4, process=process.ENVIRONMENT)
+    graph = Graph.create(nodes=[bf], objects=objects)
+    for i, obj in enumerate(objects):
+        graph.connect(source=obj.sensors.observation, observation=f"observation_{i}", window=1)
+        graph.connect(action=f"action_{i}", target=obj.actuators.action, window=1)
+    graph.connect(source=objects[0].sensors.observation, target=bf.inputs.signal)
+    sc = SpaceConverter.make("Space_Float32MultiArray", [-3], [3], dtype="float32")
+    graph.connect(source=bf.outputs.filtered, observation="filtered", converter=sc)
+    nodes, objects, actions, observations, _ = graph.register()
+    [obj.add_bridge("GymBridge") for obj in objects]
+    return [spec.params for spec in nodes + objects + [actions, observations]]
+
+
+def test_prototype_objects(monkeypatch):
+    import eagerx.bridges.openai_gym  # noqa # pylint: disable=unused-import
+
+    # Graphs with multiple (cloned) objects are identical to graphs with freshly made objects.
+    params = make_gym_graph()
+    with monkeypatch.context() as m:
+        m.setenv("EAGERX_PROTOTYPES", "0")
+        params_ref = make_gym_graph()
+    assert params == params_ref
+    assert [p["config"]["name"] for p in params[1:3]] == ["pendulum_0", "pendulum_1"]
+    assert any(key[1] == "GymObject" for key in register.PROTOTYPES)
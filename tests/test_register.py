@@ -0,0 +1,44 @@
+import sys
+
+import pytest
+
+from eagerx import Node, Bridge
+import eagerx.core.register as register
+
+
+@pytest.fixture
+def unloaded_filter():
+    # Unloads the butterworth filter and restores the original module and registration afterwards.
+    module = sys.modules.pop("eagerx.nodes.butterworth_filter", None)
+    entry = register.REGISTRY.get(Node, {}).pop("ButterworthFilter", None)
+    yield
+    if module is not None:
+        sys.modules["eagerx.nodes.butterworth_filter"] = module
+    if entry is not None:
+        register.REGISTRY[Node]["ButterworthFilter"] = entry
+
+
+def test_lazy_manifest(unloaded_filter):
+    # Entities in the manifest are made without importing their module first.
+    spec = Node.make("ButterworthFilter", "bf", rate=10, N=2)
+    assert spec.config.entity_id == "ButterworthFilter"
+    assert "eagerx.nodes.butterworth_filter" in sys.modules
+    assert register.MANIFEST[("Node", "ButterworthFilter")] == "eagerx.nodes.butterworth_filter"
+    assert register.MANIFEST[("BaseConverter", "Identity")] == "eagerx.core.converters"
+
+
+def test_reverse_lookup_and_views():
+    from eagerx.bridges.openai_gym.bridge import GymBridge
+
+    Bridge.make("GymBridge", rate=20)
+    assert register.REVERSE_REGISTRY[GymBridge.spec] == "GymBridge"
+    types = register.LOOKUP_TYPES[GymBridge.add_object]
+    with pytest.raises(TypeError):
+        types["bridge_config"]["env_id"] = "other"
+    with pytest.raises(TypeError):
+        types["bridge_config"] = dict()
+    bridge_config = register.thaw(types["bridge_config"])
+    bridge_config["env_id"] = "other"
+    assert types["bridge_config"]["env_id"] != "other"
+    with pytest.raises(TypeError):
+        register._read_only(dict(a=[dict(b=1)]))["a"][0]["b"] = 2
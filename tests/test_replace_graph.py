@@ -0,0 +1,149 @@
+import eagerx
+
+# Implementation specific
+import tests.test  # noqa # pylint: disable=unused-import
+import pytest
+import time
+from types import SimpleNamespace
+
+from eagerx.core.env import Env
+from eagerx.utils.utils import copy_params
+
+
+# Start roscore
+roscore = eagerx.initialize("eagerx_core", anonymous=True, log_level=eagerx.log.INFO)
+
+
+@pytest.mark.timeout(40)
+def test_replace_graph():
+    # Define object
+    arm = eagerx.Object.make("Arm", "obj", actuators=["ref_vel"], sensors=["N6"], states=["N9"])
+
+    # Define graph
+    graph = eagerx.Graph.create(objects=[arm])
+    N1 = eagerx.Node.make("Process", "N1", rate=1.0, inputs=["in_1"], outputs=["out_1"])
+    graph.add(N1)
+    graph.connect(action="act_1", target=N1.inputs.in_1)
+    graph.connect(source=N1.outputs.out_1, target=arm.actuators.ref_vel)
+    graph.connect(source=arm.sensors.N6, observation="sens_1")
+
+    # Define bridge
+    bridge = eagerx.Bridge.make("TestBridge", rate=20, sync=True, real_time_factor=0, process=eagerx.process.ENVIRONMENT)
+
+    # Initialize Environment
+    env = eagerx.EagerxEnv(name="replace_graph", rate=7, graph=graph, bridge=bridge)
+    env.reset()
+    action = env.action_space.sample()
+    env.step(action)
+
+    # Add a node without states that only receives messages from the running graph (i.e. registered without relaunching)
+    N2 = eagerx.Node.make("KalmanFilter", "N2", rate=1.0, inputs=["in_1"], outputs=["out_1"], states=[])
+    graph.add(N2)
+    graph.connect(source=arm.sensors.N6, target=N2.inputs.in_1)
+    env.replace_graph(graph)
+    supervisor_node = env.supervisor_node
+    env.reset()
+    assert env.supervisor_node is supervisor_node, "The environment should not have been relaunched."
+    address = f"{env.ns}/N2"
+    assert f"in_1:{env.ns}/obj/sensors/N6" in env.mb.connected_rx[address]["inputs"]
+
+    # The added node ticks, which it only does after receiving in_1 (because the bridge is synchronized).
+    node = env.supervisor_node.sp_nodes[address].node
+    start = time.time()
+    while node.num_ticks == 0:
+        assert time.time() - start < 10, "The added node did not receive any messages."
+        env.step(action)
+
+    # Add an observation (i.e. relaunch the environment)
+    graph.connect(source=N2.outputs.out_1, observation="obs_N2")
+    env.replace_graph()
+    env.reset()
+    assert env.supervisor_node is not supervisor_node, "The environment should have been relaunched."
+    assert "obs_N2" in env.observation_space.spaces
+    env.step(action)
+    env.shutdown()
+
+
+def make_graph(inputs=("in_1",)):
+    arm = eagerx.Object.make("Arm", "obj", actuators=["ref_vel"], sensors=["N6"], states=["N9"])
+    N1 = eagerx.Node.make("Process", "N1", rate=1.0, inputs=list(inputs), outputs=["out_1"])
+    graph = eagerx.Graph.create(nodes=[N1], objects=[arm])
+    graph.connect(action="act_1", target=N1.inputs.in_1)
+    graph.connect(source=N1.outputs.out_1, target=arm.actuators.ref_vel)
+    graph.connect(source=arm.sensors.N6, observation="sens_1")
+    return graph, N1, arm
+
+
+def add_node(graph, N1, **kwargs):
+    N2 = eagerx.Node.make("KalmanFilter", "N2", rate=1.0, inputs=["in_1"], outputs=["out_1"], **kwargs)
+    graph.add(N2)
+    graph.connect(source=N1.outputs.out_1, target=N2.inputs.in_1)
+    return N2
+
+
+def change_param(graph, N1, arm):
+    graph.set({"test_arg": "other"}, N1.config)
+
+
+def swap_converter(graph, N1, arm):
+    graph.set({"converter": eagerx.Processor.make("IdentityProcessor")}, N1.inputs.in_1)
+
+
+def remove_node(graph, N1, arm):
+    graph.remove(N1)
+    graph.connect(action="act_1", target=arm.actuators.ref_vel)
+
+
+def remove_connection(graph, N1, arm):
+    # The actuator is reset to its (unchanged) disconnected params, so only the connection differs.
+    graph.disconnect(source=N1.outputs.out_1, target=arm.actuators.ref_vel)
+
+
+def add_observation(graph, N1, arm):
+    graph.connect(source=N1.outputs.out_1, observation="obs_N1")
+
+
+def add_render(graph, N1, arm):
+    RosImage_RosUInt64 = eagerx.Converter.make("RosImage_RosUInt64", test_arg="test")
+    graph.render(source=arm.sensors.N6, rate=1, converter=RosImage_RosUInt64, display=False)
+
+
+def add_node_with_states(graph, N1, arm):
+    add_node(graph, N1)
+
+
+@pytest.mark.parametrize(
+    "change, reason",
+    [
+        (change_param, '"N1" was changed'),
+        (swap_converter, '"N1" was changed'),
+        (remove_node, '"N1" was removed'),
+        (remove_connection, "was removed"),
+        (add_observation, '"env/observations" was changed'),
+        (add_render, "was added"),
+        (add_node_with_states, "has states or targets"),
+    ],
+)
+def test_relaunch_reasons(change, reason):
+    graph, N1, arm = make_graph()
+    env = SimpleNamespace(_graph_state=copy_params(graph._state), _bridge_name="TestBridge", local=False)
+    change(graph, N1, arm)
+    additions = Env._get_additions(env, graph)
+    assert isinstance(additions, str) and reason in additions, additions
+
+    # Nodes without states that only receive messages from the existing graph are added in-place.
+    graph, N1, arm = make_graph()
+    env = SimpleNamespace(_graph_state=copy_params(graph._state), _bridge_name="TestBridge", local=False)
+    add_node(graph, N1, states=[])
+    nodes, objects = Env._get_additions(env, graph)
+    assert [n.config.name for n in nodes] == ["N2"] and objects == []
+
+
+def test_relaunch_new_target():
+    # An added node that sends messages to the existing graph (here, to the selected but unconnected "in_2" of N1).
+    graph, N1, arm = make_graph(inputs=["in_1", "in_2"])
+    env = SimpleNamespace(_graph_state=copy_params(graph._state), _bridge_name="TestBridge", local=False)
+    N2 = add_node(graph, N1, states=[])
+    graph.connect(source=N2.outputs.out_1, target=N1.inputs.in_2)
+    additions = Env._get_additions(env, graph)
+    assert isinstance(additions, str) and '"N1" (which was not added) is the target' in additions, additions
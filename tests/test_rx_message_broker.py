@@ -0,0 +1,211 @@
+from types import SimpleNamespace
+
+import pytest
+from rx.subject import Subject
+from std_msgs.msg import Float32, Float32MultiArray, UInt64
+
+import eagerx.core.rx_message_broker as rx_message_broker
+from eagerx.converters.ros_processor import GetIndex_Float32MultiArray
+from eagerx.core.converters import Identity
+from eagerx.utils import inprocess
+
+NS = "/broker"
+
+
+@pytest.fixture
+def local():
+    # Brokers in the same process that are linked via (in-process) topics behave like brokers in separate processes.
+    inprocess.enable(NS)
+    brokers = []
+    yield brokers
+    [mb.shutdown() for mb in brokers]
+    inprocess.disable(NS)
+
+
+def make_broker(brokers, owner):
+    mb = rx_message_broker.RxMessageBroker(owner=f"{NS}/{owner}")
+    brokers.append(mb)
+    return mb
+
+
+def make_output(name="out_1", rate=10):
+    address = f"{NS}/producer/outputs/{name}"
+    return dict(name=name, address=address, msg=Subject(), reset=Subject(), msg_type=Float32MultiArray, rate=rate)
+
+
+def make_input(address, name="in_1", converter=None):
+    converter = converter if converter is not None else Identity()
+    return dict(
+        name=name,
+        address=address,
+        msg=Subject(),
+        reset=Subject(),
+        msg_type=Float32MultiArray,
+        converter=converter,
+        window=1,
+        external_rate=None,
+    )
+
+
+def add_producer(mb, outputs):
+    [o.update(converter=Identity()) for o in outputs]
+    mb.add_rx_objects(f"{NS}/producer", node=SimpleNamespace(ns=NS), outputs=outputs)
+    mb.connect_io(print_status=False)
+
+
+def add_consumer(mb, inputs, name="consumer"):
+    received = {i["name"]: [] for i in inputs}
+    [i["msg"].subscribe(received[i["name"]].append) for i in inputs]
+    mb.add_rx_objects(f"{NS}/{name}", node=SimpleNamespace(ns=NS), inputs=inputs)
+    mb.connect_io(print_status=False)
+    return received
+
+
+def test_pushdown(local):
+    producer, consumer = make_broker(local, "producer"), make_broker(local, "consumer")
+    out = make_output()
+    add_producer(producer, [out])
+
+    # The producer acknowledges the push-down, so the consumer subscribes to the processed topic.
+    inpt = make_input(out["address"], converter=GetIndex_Float32MultiArray(index=[1]))
+    received = add_consumer(consumer, [inpt])
+    assert inpt["pushdown"]
+    out["msg"].on_next(Float32MultiArray(data=[1.0, 2.0, 3.0]))
+    assert [msg.data for msg in received["in_1"]] == [[2.0]]
+
+    # Other processors are pushed down as well, and share the output.
+    other = make_input(out["address"], name="in_2", converter=GetIndex_Float32MultiArray(index=[0, 2]))
+    received = add_consumer(consumer, [other], name="other")
+    assert other["pushdown"]
+    out["msg"].on_next(Float32MultiArray(data=[4.0, 5.0, 6.0]))
+    assert [msg.data for msg in received["in_2"]][-1] == [4.0, 6.0]
+
+
+def test_pushdown_fallback(local, monkeypatch):
+    monkeypatch.setattr(rx_message_broker, "PUSHDOWN_TIMEOUT", 0.1)
+    consumer = make_broker(local, "consumer")
+
+    # Nobody acknowledges the push-down, so the consumer subscribes to the original topic and processes itself.
+    address = f"{NS}/producer/outputs/out_1"
+    inpt = make_input(address, converter=GetIndex_Float32MultiArray(index=[1]))
+    received = add_consumer(consumer, [inpt])
+    assert not inpt.get("pushdown", False)
+    pub = inprocess.publisher(address, Float32MultiArray, queue_size=0, latch=True)
+    pub.publish(Float32MultiArray(data=[1.0, 2.0]))
+    assert [msg.data for msg in received["in_1"]] == [[1.0, 2.0]]
+    pub.unregister()
+
+    # Processors that are not stateless are never pushed down.
+    monkeypatch.setattr(GetIndex_Float32MultiArray, "PUSHDOWN", False)
+    inpt = make_input(address, name="in_2", converter=GetIndex_Float32MultiArray(index=[1]))
+    add_consumer(consumer, [inpt], name="other")
+    assert not inpt.get("pushdown", False) and len(consumer.pushdown_requests[address]) == 1
+
+
+def request_rate(address, rate, callerid):
+    pub = inprocess.publisher(address + "/rate_request", Float32, queue_size=0, latch=True)
+    pub.caller_id = callerid
+    pub.publish(Float32(data=rate))
+    return pub
+
+
+def connect(address, callerid):
+    received = []
+    sub = inprocess.subscriber(address, UInt64, callback=received.append)
+    sub.caller_id = callerid
+    return sub, received
+
+
+def test_decimation(local):
+    mb = make_broker(local, "producer")
+    address = f"{NS}/producer/outputs/out_1"
+    pub = inprocess.publisher(address, UInt64, queue_size=0, latch=True)
+    publish = mb._decimated_publish(address, 10, pub)
+    _, received = connect(address, "/consumer")
+
+    # The consumer requires 2.5 Hz of the 10 Hz output, so only every 4th message is sent.
+    request = request_rate(address, 2.5, "/consumer")
+    assert mb.decimation[address] == dict(factor=4, consumers={"/consumer": 2.5})
+    [publish(UInt64(data=i)) for i in range(8)]
+    assert [msg.data for msg in received] == [0, 4]
+
+    # The rate is changed at runtime. A rate of 0 means that every message is required.
+    request.publish(Float32(data=5))
+    assert mb.decimation[address]["factor"] == 2
+    request.publish(Float32(data=0))
+    assert mb.decimation[address]["factor"] == 1
+    [publish(UInt64(data=i)) for i in range(8, 10)]
+    assert [msg.data for msg in received] == [0, 4, 8, 9]
+
+
+def test_decimation_multiple_consumers(local):
+    mb = make_broker(local, "producer")
+    address = f"{NS}/producer/outputs/out_1"
+    pub = inprocess.publisher(address, UInt64, queue_size=0, latch=True)
+    publish = mb._decimated_publish(address, 10, pub)
+    _, received = connect(address, "/consumer")
+    request_rate(address, 2.5, "/consumer")
+
+    # A consumer that has not (yet) requested a rate receives every message.
+    other, other_received = connect(address, "/other")
+    [publish(UInt64(data=i)) for i in range(4)]
+    assert [msg.data for msg in other_received] == [0, 1, 2, 3]
+
+    # The highest requested rate determines the factor.
+    request_rate(address, 5, "/other")
+    assert mb.decimation[address]["factor"] == 2
+
+    # The requests of consumers that disconnected are forgotten.
+    other.unregister()
+    [publish(UInt64(data=i)) for i in range(4, 8)]
+    assert mb.decimation[address] == dict(factor=4, consumers={"/consumer": 2.5})
+    assert [msg.data for msg in received] == [0, 1, 2, 3, 4]
+
+
+def test_no_decimation(local):
+    mb = make_broker(local, "producer")
+    remote = "/remote/producer/outputs/out_1"
+    node = SimpleNamespace(sync=False, real_time_factor=1, rate=5)
+    mb.node_io["producer"] = dict(node=SimpleNamespace(node=node))
+    assert mb._can_decimate("producer", dict(address=remote), tick_address="/remote/bridge/outputs/tick")
+
+    # Not for the tick, change-only outputs, or in-process topics (i.e. nothing to gain).
+    assert not mb._can_decimate("producer", dict(address=remote), tick_address=remote)
+    assert not mb._can_decimate("producer", dict(address=remote, change_only=True), tick_address=None)
+    assert not mb._can_decimate("producer", dict(address=f"{NS}/producer/outputs/out_1"), tick_address=None)
+
+    # Only asynchronous inputs with window=1 request a lower rate, so synchronized (or not real-time) nodes never decimate.
+    assert mb._required_rate("producer", "inputs", dict(window=1)) == 5
+    assert mb._required_rate("producer", "inputs", dict(window=2)) == 0
+    assert mb._required_rate("producer", "feedthroughs", dict(window=1)) == 0
+    for sync, real_time_factor in [(True, 1), (False, 0)]:
+        node.sync, node.real_time_factor = sync, real_time_factor
+        assert not mb._can_decimate("producer", dict(address=remote), tick_address=None)
+        assert mb._required_rate("producer", "inputs", dict(window=1)) == 0
+
+
+def test_shared_topic(local):
+    mb = make_broker(local, "consumer")
+    address = f"{NS}/producer/outputs/out_1"
+    pub = inprocess.publisher(address, Float32MultiArray, queue_size=0, latch=True)
+    reset_pub = inprocess.publisher(address + "/reset", UInt64, queue_size=0, latch=True)
+
+    # Both inputs receive the message via a single subscriber.
+    received = add_consumer(mb, [make_input(address)])
+    received.update(add_consumer(mb, [make_input(address, name="in_2")], name="other"))
+    assert len([sub for sub in mb.subscribers if sub.name == address]) == 1
+    pub.publish(Float32MultiArray(data=[1.0]))
+    assert [msg.data for msg in received["in_1"]] == [msg.data for msg in received["in_2"]] == [[1.0]]
+
+    # After a reset, an input that connects later does not receive the (stale) message of the previous episode.
+    reset_pub.publish(UInt64(data=1))
+    late = add_consumer(mb, [make_input(address, name="in_3")], name="late")
+    assert late["in_3"] == []
+    pub.publish(Float32MultiArray(data=[2.0]))
+    assert [msg.data for msg in late["in_3"]] == [[2.0]]
+
+    # Within an episode, the last message is replayed like a latched message.
+    later = add_consumer(mb, [make_input(address, name="in_4")], name="later")
+    assert [msg.data for msg in later["in_4"]] == [[2.0]]
+    assert len([sub for sub in mb.subscribers if sub.name == address]) == 1
+    [p.unregister() for p in (pub, reset_pub)]
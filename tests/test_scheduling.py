@@ -0,0 +1,27 @@
+import os
+import threading
+from types import SimpleNamespace
+
+from eagerx.utils import scheduling
+
+
+def test_scheduling():
+    cpu = sorted(os.sched_getaffinity(0))[0]
+    nice = os.getpriority(os.PRIO_PROCESS, 0) + 1
+    node = SimpleNamespace(ns_name="/test/node", cpu_affinity=[cpu], nice=nice, sched_priority=None, scheduling=dict())
+    assert scheduling.thread_factory(SimpleNamespace(cpu_affinity=None, nice=None, sched_priority=None)) is None
+
+    # Settings are applied to the scheduler thread only.
+    affinity = os.sched_getaffinity(0)
+    thread = scheduling.thread_factory(node)(lambda: None)
+    thread.start()
+    thread.join()
+    assert node.scheduling["scheduler"] == dict(cpu_affinity=[cpu], nice=nice)
+    assert os.sched_getaffinity(0) == affinity
+
+    # Settings that are not permitted are reported instead of raised (in a separate thread to not affect the tests).
+    applied = dict()
+    thread = threading.Thread(target=lambda: applied.update(scheduling.apply(sched_priority=1)))
+    thread.start()
+    thread.join()
+    assert applied["sched_priority"] in [1, "not permitted", "not supported"]